@@ -0,0 +1,156 @@
+"""End-to-end CLI timings on synthetic catalogs.
+
+For each catalog size, generates a project (see generate.py) and times
+each command as a fresh process, the way users and git hooks run them:
+
+    build_cold       first build, no parse cache
+    build_noop       rebuild with nothing changed
+    build_one_edit   rebuild after editing one skill
+    check            `aictrl check` on a fresh build
+    status           `aictrl status`
+    clean            `aictrl clean`
+
+Each cycle runs `--repeat` times and the fastest time per step is
+kept. Results are JSON with the commit they were measured at; pass an
+earlier result file as --compare to see the ratio per step and fail
+on regressions:
+
+    python benchmarks/bench_commands.py --output before.json
+    git checkout my-branch
+    python benchmarks/bench_commands.py --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from aictrl import __version__  # noqa: E402
+from generate import add_arguments, age_tree, generate_project, generator_options  # noqa: E402
+
+DEFAULT_SIZES = [10, 1_000, 10_000, 50_000]
+STEPS = ["build_cold", "build_noop", "build_one_edit", "check", "status", "clean"]
+AICTRL = [sys.executable, "-c", "from aictrl.cli import main; main()"]
+
+
+def _run(args: list[str], project: Path) -> float:
+    start = time.perf_counter()
+    proc = subprocess.run([*AICTRL, *args, "--project", str(project)], capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"aictrl {' '.join(args)} failed:\n{proc.stdout}{proc.stderr}")
+    return elapsed
+
+
+def _wait_for_trash(project: Path, timeout: float = 60.0) -> None:
+    # `clean` deletes its trash in a detached process; let it finish so
+    # it neither races the next step nor slows it down.
+    trash = project / ".aictrl" / ".cache" / "trash"
+    deadline = time.monotonic() + timeout
+    while trash.exists() and any(trash.iterdir()) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def measure(n_skills: int, repeat: int, options: dict, workdir: Path) -> dict:
+    project = workdir / f"catalog-{n_skills}"
+    start = time.perf_counter()
+    generate_project(project, n_skills, **options)
+    generated = time.perf_counter() - start
+
+    skill = project / ".aictrl" / "data" / "skills" / "skill-00000.yaml"
+    original = skill.read_text()
+    best = {step: float("inf") for step in STEPS}
+    for _ in range(repeat):
+        shutil.rmtree(project / ".aictrl" / ".cache", ignore_errors=True)
+        skill.write_text(original)
+        age_tree(project / ".aictrl" / "data")
+        timings = {
+            "build_cold": _run(["build"], project),
+            "build_noop": _run(["build"], project),
+        }
+        skill.write_text(original.replace("description: ", "description: Edited. ", 1))
+        timings["build_one_edit"] = _run(["build"], project)
+        timings["check"] = _run(["check"], project)
+        timings["status"] = _run(["status"], project)
+        timings["clean"] = _run(["clean"], project)
+        _wait_for_trash(project)
+        for step, seconds in timings.items():
+            best[step] = min(best[step], seconds)
+
+    shutil.rmtree(project)
+    return {"skills": n_skills, "generate_s": round(generated, 3), **{f"{s}_s": round(best[s], 4) for s in STEPS}}
+
+
+def _commit() -> str | None:
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(Path(__file__).parent), "rev-parse", "HEAD"], capture_output=True, text=True,
+        )
+    except OSError:
+        return None
+    return proc.stdout.strip() or None
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> bool:
+    """Print each step's ratio to the baseline; False if any exceeds `threshold`."""
+    before = {r["skills"]: r for r in baseline["results"]}
+    ok = True
+    for result in results:
+        old = before.get(result["skills"])
+        if old is None:
+            continue
+        for step in STEPS:
+            key = f"{step}_s"
+            if not old.get(key):
+                continue
+            ratio = result[key] / old[key]
+            flag = "  REGRESSION" if ratio > threshold else ""
+            ok = ok and not flag
+            print(
+                f"{result['skills']:>7} skills  {step:<15} {old[key]:8.3f}s -> {result[key]:8.3f}s  x{ratio:.2f}{flag}",
+                file=sys.stderr,
+            )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, action="append", help="Catalog size (repeatable; default: 10, 1k, 10k, 50k)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write results here as well as to stdout")
+    parser.add_argument("--compare", type=Path, help="Earlier results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio --compare fails on")
+    parser.add_argument("--workdir", type=Path, help="Where to generate catalogs (default: a temp dir)")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    options = generator_options(args)
+    with tempfile.TemporaryDirectory(dir=args.workdir) as workdir:
+        results = [measure(n, args.repeat, options, Path(workdir)) for n in (args.skills or DEFAULT_SIZES)]
+
+    report = {
+        "benchmark": "commands",
+        "commit": _commit(),
+        "aictrl": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "generator": options,
+        "results": results,
+    }
+    json.dump(report, sys.stdout, indent=2)
+    print()
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.compare and not compare(results, json.loads(args.compare.read_text()), args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
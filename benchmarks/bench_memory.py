@@ -0,0 +1,84 @@
+"""Memory footprint of loaded skills.
+
+Compares the current SkillData (slotted, frozen, interned tags/tools/
+metadata keys) with an equivalent plain dataclass holding the same
+parsed documents, and measures the per-target template views.
+
+    python benchmarks/bench_memory.py --skills 10000 --skills 50000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from aictrl.loader import _skill_from_document  # noqa: E402
+from synthetic import skill_document  # noqa: E402
+
+
+@dataclass
+class PlainSkill:
+    slug: str
+    name: str
+    description: str
+    version: str
+    instructions: str
+    sections: dict = field(default_factory=dict)
+    tags: list = field(default_factory=list)
+    allowed_tools: list = field(default_factory=list)
+    metadata: dict = field(default_factory=dict)
+    file_structure: dict | None = None
+    content_files: dict = field(default_factory=dict)
+
+
+def _traced(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def measure(n_skills: int) -> dict:
+    # A JSON round trip stands in for yaml.safe_load: every string comes
+    # back as a distinct object, as it would straight from the parser.
+    documents = [json.dumps(skill_document(i)) for i in range(n_skills)]
+
+    def load_plain():
+        return [PlainSkill(**json.loads(d)) for d in documents]
+
+    def load_compact():
+        return [_skill_from_document(json.loads(d), Path("skill.yaml")) for d in documents]
+
+    plain, plain_bytes = _traced(load_plain)
+    compact, compact_bytes = _traced(load_compact)
+    _, asdict_bytes = _traced(lambda: [asdict(s) for s in plain])
+    _, view_bytes = _traced(lambda: [s.as_dict() for s in compact])
+
+    return {
+        "skills": n_skills,
+        "plain_dataclass_bytes": plain_bytes,
+        "skilldata_bytes": compact_bytes,
+        "asdict_per_target_bytes": asdict_bytes,
+        "as_dict_per_target_bytes": view_bytes,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, action="append", help="Catalog size (repeatable)")
+    args = parser.parse_args()
+
+    results = [measure(n) for n in (args.skills or [10_000])]
+    json.dump({"benchmark": "memory", "results": results}, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Override merge cost for skills with large sections/content_files.
+
+Compares merger.deep_merge (copy-on-write) against the previous
+deepcopy-at-every-level implementation, applying a small override to
+skills whose sections and content_files grow.
+
+    python benchmarks/bench_merge.py --section-chars 100000 --content-files 20
+"""
+
+import argparse
+import json
+import sys
+import time
+from copy import deepcopy
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from aictrl.loader import _skill_from_document  # noqa: E402
+from aictrl.merger import deep_merge  # noqa: E402
+from synthetic import skill_document  # noqa: E402
+
+
+def deepcopy_merge(base: dict, override: dict) -> dict:
+    result = deepcopy(base)
+    for key, value in override.items():
+        if key == "_delete":
+            if isinstance(value, list):
+                for k in value:
+                    result.pop(k, None)
+            continue
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = deepcopy_merge(result[key], value)
+        else:
+            result[key] = deepcopy(value)
+    return result
+
+
+OVERRIDE = {
+    "allowed_tools": ["Bash", "Read"],
+    "metadata": {"team": "platform"},
+    "sections": {"team_standards": "## Ours\n- be nice\n"},
+}
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(n_skills: int, n_sections: int, section_chars: int, n_content_files: int, repeat: int) -> dict:
+    skills = [
+        _skill_from_document(
+            skill_document(i, n_sections=n_sections, section_chars=section_chars, n_content_files=n_content_files),
+            Path("skill.yaml"),
+        )
+        for i in range(n_skills)
+    ]
+    dicts = [s.as_dict() for s in skills]
+
+    # Each merger pays for producing its own input dict: the old path
+    # used dataclasses.asdict, the new one the shallow SkillData.as_dict.
+    legacy = _best_of(lambda: [deepcopy_merge(asdict(s), OVERRIDE) for s in skills], repeat)
+    cow = _best_of(lambda: [deep_merge(s.as_dict(), OVERRIDE) for s in skills], repeat)
+    assert [deep_merge(d, OVERRIDE) for d in dicts] == [deepcopy_merge(d, OVERRIDE) for d in dicts]
+
+    return {
+        "skills": n_skills,
+        "sections": n_sections,
+        "section_chars": section_chars,
+        "content_files": n_content_files,
+        "deepcopy_merge_s": round(legacy, 6),
+        "cow_merge_s": round(cow, 6),
+        "speedup": round(legacy / cow, 1) if cow else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=1000)
+    parser.add_argument("--sections", type=int, default=20)
+    parser.add_argument("--section-chars", type=int, default=2000)
+    parser.add_argument("--content-files", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    result = measure(args.skills, args.sections, args.section_chars, args.content_files, args.repeat)
+    json.dump({"benchmark": "merge", "results": [result]}, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Generate a synthetic aictrl project.
+
+Writes .aictrl/ with config, org, N skill files and optionally
+overrides, content_files (inline and as external sources) and local
+template overrides, shaped like synthetic.skill_document. Every file's
+mtime is set an hour back so `aictrl check` can trust stat data, as it
+would in a checkout that is not being edited.
+
+    python benchmarks/generate.py /tmp/catalog --skills 10000 --override-density 0.2
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import prose, skill_document  # noqa: E402
+
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as Dumper
+
+TEMPLATES = Path(__file__).resolve().parent.parent / "src" / "aictrl" / "templates"
+
+
+def generate_project(
+    root: Path,
+    n_skills: int,
+    n_sections: int = 3,
+    section_chars: int = 400,
+    override_density: float = 0.1,
+    n_content_files: int = 0,
+    n_source_files: int = 0,
+    local_templates: bool = False,
+    seed: int = 0,
+) -> Path:
+    """Write a project under `root` (replacing any .aictrl/ there) and return root."""
+    rng = random.Random(seed)
+    aictrl = root / ".aictrl"
+    if aictrl.exists():
+        shutil.rmtree(aictrl)
+    skills_dir = aictrl / "data" / "skills"
+    overrides_dir = aictrl / "overrides" / "skills"
+    skills_dir.mkdir(parents=True)
+    overrides_dir.mkdir(parents=True)
+
+    _dump(aictrl / "config.yaml", {
+        "org_id": "org-bench",
+        "api_url": "https://aictrl.dev",
+        "telemetry_url": "https://aictrl.dev/api/telemetry",
+        "targets": ["claude", "cursor"],
+    })
+    _dump(aictrl / "data" / "org.yaml", {
+        "id": "org-bench",
+        "name": "Bench Org",
+        "slug": "bench-org",
+        "telemetry_url": "https://aictrl.dev/api/telemetry",
+    })
+
+    for i in range(n_skills):
+        doc = skill_document(
+            i, n_sections=n_sections, section_chars=section_chars, n_content_files=n_content_files, seed=seed,
+        )
+        for j in range(n_source_files):
+            source = f"references/{doc['slug']}/source_{j}.md"
+            path = aictrl / "data" / source
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(prose(rng, section_chars))
+            doc["content_files"][f"source_{j}.md"] = {"source": source}
+        if not doc["content_files"]:
+            del doc["content_files"]
+        _dump(skills_dir / f"{doc['slug']}.yaml", doc)
+
+        if rng.random() < override_density:
+            _dump(overrides_dir / f"{doc['slug']}.yaml", {
+                "allowed_tools": ["Bash", "Read"],
+                "metadata": {"team": f"team-{i % 5}"},
+                "sections": {"team_standards": prose(rng, section_chars // 4)},
+            })
+
+    if local_templates:
+        # Same output as the bundled template plus a marker line, so
+        # builds go through the project template loader.
+        local = aictrl / "templates" / "claude" / "skill.md.j2"
+        local.parent.mkdir(parents=True)
+        local.write_text((TEMPLATES / "claude" / "skill.md.j2").read_text() + "\n<!-- local template -->\n")
+
+    age_tree(aictrl)
+    return root
+
+
+def age_tree(root: Path, seconds: int = 3600) -> None:
+    past = time.time_ns() - seconds * 1_000_000_000
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), ns=(past, past))
+
+
+def _dump(path: Path, data: dict) -> None:
+    with open(path, "w") as f:
+        yaml.dump(data, f, Dumper=Dumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--sections", type=int, default=3, help="Sections per skill")
+    parser.add_argument("--section-chars", type=int, default=400, help="Characters per section")
+    parser.add_argument("--override-density", type=float, default=0.1, help="Fraction of skills with an override")
+    parser.add_argument("--content-files", type=int, default=0, help="Inline content_files per skill")
+    parser.add_argument("--source-files", type=int, default=0, help="content_files per skill read from data/")
+    parser.add_argument("--local-templates", action="store_true", help="Add a project-local claude/skill.md.j2")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def generator_options(args: argparse.Namespace) -> dict:
+    return {
+        "n_sections": args.sections,
+        "section_chars": args.section_chars,
+        "override_density": args.override_density,
+        "n_content_files": args.content_files,
+        "n_source_files": args.source_files,
+        "local_templates": args.local_templates,
+        "seed": args.seed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", type=Path, help="Project directory to write .aictrl/ into")
+    parser.add_argument("--skills", type=int, default=1000)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    generate_project(args.root, args.skills, **generator_options(args))
+    print(f"Generated {args.skills} skills in {args.root} ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
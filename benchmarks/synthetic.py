@@ -0,0 +1,50 @@
+"""Synthetic skill documents for benchmarks.
+
+Documents mimic a real catalog: a small shared vocabulary of tags,
+tools and metadata keys, and per-skill prose in instructions/sections.
+"""
+
+import random
+
+TAGS = ["review", "quality", "security", "testing", "docs", "api", "ui", "infra", "data", "perf"]
+TOOLS = ["Bash", "Read", "Write", "Edit", "Grep", "Glob", "WebFetch"]
+STACKS = ["api", "ui", "test", "infra", "data"]
+
+WORDS = (
+    "check verify ensure review handle validate document prefer avoid "
+    "error input output function module service request response cache "
+    "test coverage type boundary security performance readability"
+).split()
+
+
+def prose(rng: random.Random, n_chars: int) -> str:
+    out = []
+    size = 0
+    while size < n_chars:
+        line = "- " + " ".join(rng.choice(WORDS) for _ in range(10))
+        out.append(line)
+        size += len(line) + 1
+    return "\n".join(out) + "\n"
+
+
+def skill_document(
+    i: int,
+    n_sections: int = 3,
+    section_chars: int = 400,
+    n_content_files: int = 0,
+    seed: int = 0,
+) -> dict:
+    rng = random.Random(seed * 1_000_003 + i)
+    slug = f"skill-{i:05d}"
+    return {
+        "slug": slug,
+        "name": slug,
+        "description": f"Synthetic skill number {i}",
+        "version": f"1.{i % 10}.{i % 7}",
+        "instructions": prose(rng, section_chars),
+        "sections": {f"section_{j}": prose(rng, section_chars) for j in range(n_sections)},
+        "tags": rng.sample(TAGS, 3),
+        "allowed_tools": rng.sample(TOOLS, 4),
+        "metadata": {"stack": rng.choice(STACKS), "owner": f"team-{i % 12}"},
+        "content_files": {f"ref_{j}.md": prose(rng, section_chars) for j in range(n_content_files)},
+    }
@@ -0,0 +1,345 @@
+"""Build orchestration: load, merge, render and write, incrementally.
+
+Each target renders its output in units (see targets.base.BuildTarget):
+one per skill, plus a shared unit for org-level files. The inputs of a
+unit -- the merged skill's hash and the override files applied to it,
+the org data, and the sources of every template it renders, including
+templates those include or extend -- are digested into a key that the
+target's manifest records. The next build re-renders and rewrites only
+units whose key changed or whose files are no longer on disk; `full`
+re-renders everything.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+
+from jinja2 import Environment, TemplateNotFound, meta
+
+from . import __version__
+from .cache import ParseCache
+from .cleanup import remove_files
+from .config import AictrlConfig, OrgData, get_data_dir, get_overrides_dir, get_templates_dir
+from .fingerprints import save_fingerprints, take_snapshot
+from .gitignore import ensure_gitignore
+from .gittree import forget_tree, head_tree, record_tree
+from .hashing import compute_skill_hashes, hash_value
+from .loader import SkillData, load_skill_sources
+from .lockfile import write_lockfile
+from .manifest import Manifest, ManifestEntry, UnitRecord, entry_for, read_manifest, write_manifest
+from .merger import merge_overrides_with_sources
+from .precompile import bundled_source_env, compiled_index, source_digest
+from .profiling import NULL_PROFILER
+from .renderer import get_target, render_items, write_files
+from .staging import OutputStage
+from .targets.base import BuildTarget, OutputFile
+
+
+SHARED_UNIT = "shared"
+
+
+@dataclass
+class BuildResult:
+    skills: list[SkillData] = field(default_factory=list)
+    targets: list[str] = field(default_factory=list)
+    files: int = 0      # output files the build covers
+    rendered: int = 0   # rendered by this build
+    reused: int = 0     # not re-rendered: their unit's inputs are unchanged
+    written: int = 0    # rendered and different from what was on disk
+    pruned: int = 0     # output of an earlier build that is no longer produced
+    gitignore_added: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)  # seconds per phase
+
+    @property
+    def unchanged(self) -> int:
+        return self.files - self.written
+
+
+@contextmanager
+def _timed(result: BuildResult, phase: str, profiler=NULL_PROFILER):
+    start = time.perf_counter()
+    try:
+        with profiler.span(phase):
+            yield
+    finally:
+        result.timings[phase] = result.timings.get(phase, 0.0) + time.perf_counter() - start
+
+
+def skill_unit(slug: str) -> str:
+    return f"skill:{slug}"
+
+
+class TemplateDigests:
+    """Source digests of templates, memoized for one build.
+
+    Project-local templates in .aictrl/templates/ are read and parsed;
+    bundled ones are looked up in the precompiled index, falling back
+    to their source when it is unavailable (see precompile.py).
+    """
+
+    def __init__(self, project_root: Path):
+        self.local_dir = get_templates_dir(project_root)
+        self._index = compiled_index()
+        self._bundled_env: Environment | None = None
+        self._digests: dict[str, str] = {}
+        self._references: dict[str, list[str | None]] = {}
+
+    def digest(self, name: str) -> str:
+        if name not in self._digests:
+            self._load(name)
+        return self._digests[name]
+
+    def closure(self, names: tuple[str, ...]) -> dict[str, str]:
+        """Digests of `names` and every template they reference, transitively.
+
+        A reference Jinja cannot resolve statically (a variable template
+        name) pulls in every template there is.
+        """
+        seen: dict[str, str] = {}
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen[name] = self.digest(name)
+            for ref in self._references[name]:
+                if ref is None:
+                    pending.extend(self._all_names())
+                else:
+                    pending.append(ref)
+        return dict(sorted(seen.items()))
+
+    def _load(self, name: str) -> None:
+        local = self.local_dir / name
+        if local.is_file():
+            self._load_source(name, local.read_text())
+        elif self._index is not None and name in self._index["templates"]:
+            info = self._index["templates"][name]
+            self._digests[name] = info["digest"]
+            self._references[name] = info["references"]
+        else:
+            try:
+                source, _, _ = self._bundled().loader.get_source(self._bundled(), name)
+            except TemplateNotFound:
+                self._digests[name] = "missing"
+                self._references[name] = []
+                return
+            self._load_source(name, source)
+
+    def _load_source(self, name: str, source: str) -> None:
+        self._digests[name] = source_digest(source)
+        self._references[name] = list(meta.find_referenced_templates(self._bundled().parse(source)))
+
+    def _bundled(self) -> Environment:
+        if self._bundled_env is None:
+            self._bundled_env = bundled_source_env()
+        return self._bundled_env
+
+    def _all_names(self) -> list[str]:
+        names = self._bundled().list_templates(extensions=["j2"])
+        if self.local_dir.is_dir():
+            names.extend(p.relative_to(self.local_dir).as_posix() for p in self.local_dir.rglob("*.j2"))
+        return names
+
+
+def build_project(
+    project_root: Path,
+    config: AictrlConfig,
+    org: OrgData,
+    target_names: list[str] | None = None,
+    jobs: int | None = None,
+    cache: ParseCache | None = None,
+    full: bool = False,
+    profiler=NULL_PROFILER,
+) -> BuildResult:
+    """Build output for `target_names` (default: config.targets).
+
+    Raises SkillLoadError, ValueError for bad overrides or targets, and
+    FileNotFoundError for a missing content_files source. Returns an
+    empty result, writing nothing, when there are no skills. With a
+    `cache` the parse cache and input fingerprints are updated. The git
+    tree .aictrl/ was built from is recorded for `build --if-changed`
+    (see gittree.py). A profiling.Profiler gets a span for every phase,
+    step and render.
+    """
+    targets = [get_target(name) for name in (target_names or config.targets)]
+    result = BuildResult(targets=[t.name for t in targets])
+
+    with _timed(result, "load", profiler):
+        # Before anything is read, so the tree is never newer than the inputs.
+        with profiler.span("head_tree"):
+            tree = head_tree(project_root)
+        with profiler.span("take_snapshot"):
+            snapshot = take_snapshot(project_root)
+        with profiler.span("load_skill_sources"):
+            sources = load_skill_sources(project_root, jobs=jobs, cache=cache)
+    if not sources:
+        return result
+
+    with _timed(result, "merge", profiler):
+        with profiler.span("merge_overrides"):
+            merged, applied = merge_overrides_with_sources([skill for _, skill in sources], project_root, cache)
+        if cache is not None:
+            with profiler.span("save_parse_cache"):
+                cache.save()
+
+    with _timed(result, "hash", profiler):
+        with profiler.span("hash_skills"):
+            hashes = compute_skill_hashes(merged, get_data_dir(project_root))
+        with profiler.span("template_digests"):
+            templates = TemplateDigests(project_root)
+        org_digest = hash_value(asdict(org))
+
+    overrides_dir = get_overrides_dir(project_root)
+    override_names = {
+        slug: [path.relative_to(overrides_dir).as_posix() for path in paths]
+        for slug, paths in applied.items()
+    }
+
+    # Decide which units each target must re-render; collect them as one
+    # work item per skill covering every target that needs it.
+    with _timed(result, "plan", profiler):
+        plans: list[tuple[BuildTarget, Manifest | None, Manifest | None, Manifest]] = []
+        stale: dict[str | None, list[str]] = {}
+        for target in targets:
+            # The last build's manifest tells what to prune even when
+            # `full` ignores it for reuse.
+            on_disk = read_manifest(project_root, target.output_dir)
+            previous = None if full else on_disk
+            manifest = Manifest()
+            for skill in merged:
+                inputs = {
+                    "skill": f"{skill.slug}@{hashes[skill.slug]}",
+                    "overrides": override_names.get(skill.slug, []),
+                    "org": org_digest,
+                    "templates": templates.closure(target.skill_templates),
+                }
+                reused = _plan_unit(project_root, target, previous, manifest, skill_unit(skill.slug), inputs)
+                if reused is None:
+                    stale.setdefault(skill.slug, []).append(target.name)
+                else:
+                    result.reused += reused
+            inputs = {"org": org_digest, "templates": templates.closure(target.shared_templates)}
+            reused = _plan_unit(project_root, target, previous, manifest, SHARED_UNIT, inputs)
+            if reused is None:
+                stale.setdefault(None, []).append(target.name)
+            else:
+                result.reused += reused
+            plans.append((target, on_disk, previous, manifest))
+
+    with _timed(result, "render", profiler):
+        by_slug = {skill.slug: skill for skill in merged}
+        items = [(by_slug[slug] if slug is not None else None, tuple(names)) for slug, names in stale.items()]
+        rendered = {}
+        rendered_items = render_items(items, org, project_root, jobs=jobs, profiler=profiler)
+        for (skill, _), by_target in zip(items, rendered_items):
+            unit_id = skill_unit(skill.slug) if skill is not None else SHARED_UNIT
+            for target_name, files in by_target.items():
+                rendered[target_name, unit_id] = files
+
+    with _timed(result, "write", profiler):
+        forget_tree(project_root, [t.name for t in targets])
+        for target, on_disk, previous, manifest in plans:
+            to_write: list[OutputFile] = []
+            for unit_id in [*(skill_unit(s.slug) for s in merged), SHARED_UNIT]:
+                for f in rendered.get((target.name, unit_id), ()):
+                    manifest.files[f.path] = entry_for(f, project_root, unit=unit_id)
+                    to_write.append(f)
+            result.files += len(manifest.files)
+            orphans = sorted(set(on_disk.files) - set(manifest.files)) if on_disk is not None else []
+            if not to_write and not orphans and previous == manifest:
+                continue
+
+            # Write into a hardlinked stage and swap it in, so readers of
+            # the target directory never see a half-written build.
+            with profiler.span(f"write {target.name}", files=len(to_write)):
+                with OutputStage(project_root, target.output_dir) as stage:
+                    with profiler.span("write_files"):
+                        stats = write_files(to_write, project_root, dest_root=stage.root)
+                    _record_stats(stage.root, manifest)
+                    pruned = remove_files(stage.root, orphans)
+                    manifest_changed = write_manifest(stage.root, target.output_dir, manifest)
+                    if stats.written or pruned or manifest_changed:
+                        with profiler.span("publish"):
+                            stage.publish()
+            result.pruned += pruned
+            result.rendered += stats.total
+            result.written += stats.written
+
+        with profiler.span("write_lockfile"):
+            write_lockfile(project_root, merged, hashes)
+        if cache is not None:
+            with profiler.span("save_fingerprints"):
+                save_fingerprints(project_root, snapshot, sources, merged)
+        with profiler.span("ensure_gitignore"):
+            result.gitignore_added = ensure_gitignore(project_root)
+        with profiler.span("record_tree"):
+            record_tree(project_root, tree, {t.name: t.output_dir for t in targets}, config.targets)
+
+    result.skills = merged
+    return result
+
+
+def _plan_unit(
+    project_root: Path,
+    target: BuildTarget,
+    previous: Manifest | None,
+    manifest: Manifest,
+    unit_id: str,
+    inputs: dict,
+) -> int | None:
+    """Record a unit in `manifest`. If the previous build's output for it
+    can be kept, add those files too and return their count; otherwise
+    return None: the unit must be rendered."""
+    key = hash_value({"aictrl": __version__, "target": target.name, **inputs})
+    manifest.units[unit_id] = UnitRecord(key=key, inputs=inputs)
+    reusable = _reusable_files(project_root, previous, unit_id, key)
+    if reusable is None:
+        return None
+    manifest.files.update(reusable)
+    return len(reusable)
+
+
+def _reusable_files(
+    project_root: Path,
+    previous: Manifest | None,
+    unit_id: str,
+    key: str,
+) -> dict[str, ManifestEntry] | None:
+    """The previous build's files for a unit, if its key is unchanged and
+    they are all still on disk with the recorded size, mode, mtime and
+    inode. An edit that keeps the size, or a file replaced by another
+    one, moves the mtime or the inode, and the unit is rendered again."""
+    if previous is None:
+        return None
+    record = previous.units.get(unit_id)
+    if record is None or record.key != key:
+        return None
+
+    files = {path: e for path, e in previous.files.items() if e.unit == unit_id}
+    for path, entry in files.items():
+        try:
+            st = os.stat(project_root / path)
+        except OSError:
+            return None
+        if (
+            st.st_size != entry.size
+            or bool(st.st_mode & 0o111) != entry.executable
+            or st.st_mtime_ns != entry.mtime_ns
+            or st.st_ino != entry.inode
+        ):
+            return None
+    return files
+
+
+def _record_stats(root: Path, manifest: Manifest) -> None:
+    """Record the mtime and inode of every file as it now is under `root`
+    (a stage, whose files keep their inodes when it is published)."""
+    for path, entry in manifest.files.items():
+        try:
+            st = os.stat(root / path)
+        except OSError:
+            continue
+        manifest.files[path] = replace(entry, mtime_ns=st.st_mtime_ns, inode=st.st_ino)
@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .config import get_cache_dir
+
+
+CACHE_FILE = "parsed.json"
+# Earlier releases pickled the cache. It sits in the working tree, where
+# a checkout could plant one, so it is deleted, never loaded.
+LEGACY_CACHE_FILE = "parsed.pickle"
+CACHE_FORMAT = 2
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# A file modified this close to the moment it was cached may change again
+# within the same mtime tick, so its stat data alone is not trusted.
+RACY_WINDOW_NS = 2_000_000_000
+# LRU recency is kept to the day: a hit bumps last_used_ns (and has the
+# cache rewritten) only when the previous use is older than this.
+LAST_USED_RESOLUTION_NS = 24 * 3600 * 1_000_000_000
+
+
+class Fingerprint(NamedTuple):
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+@dataclass
+class _Entry:
+    fingerprint: Fingerprint
+    payload: str  # the document as JSON
+    verified_ns: int
+    last_used_ns: int
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def read_yaml(path: Path) -> tuple[Any, Fingerprint]:
+    """Parse a YAML file, returning the document and the fingerprint of the bytes read."""
+    # Imported on first parse, so commands answered from caches and
+    # fingerprints never load it.
+    import yaml
+
+    st = os.stat(path)
+    with open(path, "rb") as f:
+        raw = f.read()
+    fingerprint = Fingerprint(size=len(raw), mtime_ns=st.st_mtime_ns, digest=content_digest(raw))
+    return yaml.safe_load(raw), fingerprint
+
+
+class ParseCache:
+    """On-disk cache of parsed YAML documents.
+
+    Entries are keyed by path and validated by size + mtime_ns, falling
+    back to a content hash when the stat data changed or is too recent
+    to trust. Documents are stored as JSON, so loading the cache cannot
+    run code; one JSON would not give back as it was parsed (a YAML date,
+    a non-string key) is simply not cached. The cache is bounded to
+    `max_bytes` of encoded documents; least recently used entries are
+    evicted on save.
+    """
+
+    def __init__(self, path: Path | None = None, root: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.root = root
+        self.max_bytes = max_bytes
+        self.entries: dict[str, _Entry] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    @classmethod
+    def open(cls, project_root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> "ParseCache":
+        cache = cls(get_cache_dir(project_root) / CACHE_FILE, root=project_root, max_bytes=max_bytes)
+        try:
+            with open(cache.path, "rb") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cache
+
+        if isinstance(data, dict) and data.get("format") == CACHE_FORMAT:
+            try:
+                cache.entries = {key: _entry_from_json(item) for key, item in data["entries"].items()}
+            except (AttributeError, KeyError, TypeError, ValueError):
+                cache.entries = {}
+        return cache
+
+    def key(self, path: Path) -> str:
+        if self.root is not None:
+            try:
+                return str(path.relative_to(self.root))
+            except ValueError:
+                pass
+        return str(path)
+
+    def get(self, path: Path) -> tuple[bool, Any]:
+        """Return (hit, document) for path."""
+        key = self.key(path)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.misses += 1
+            return False, None
+
+        fp = entry.fingerprint
+        trusted = (
+            st.st_size == fp.size
+            and st.st_mtime_ns == fp.mtime_ns
+            and fp.mtime_ns < entry.verified_ns - RACY_WINDOW_NS
+        )
+        if not trusted:
+            if st.st_size != fp.size:
+                self.misses += 1
+                return False, None
+            try:
+                raw = path.read_bytes()
+            except OSError:
+                self.misses += 1
+                return False, None
+            if content_digest(raw) != fp.digest:
+                self.misses += 1
+                return False, None
+            entry.fingerprint = Fingerprint(fp.size, st.st_mtime_ns, fp.digest)
+            entry.verified_ns = time.time_ns()
+            self._dirty = True
+
+        self._touch(entry)
+        self.hits += 1
+        return True, json.loads(entry.payload)
+
+    def put(self, path: Path, fingerprint: Fingerprint, document: Any) -> None:
+        self._store(self.key(path), fingerprint, document)
+
+    def get_by_digest(self, key: str, digest: str) -> tuple[bool, Any]:
+        """Return (hit, document) for a key whose content digest is already known.
+
+        Used for members of a skill pack, whose index records each
+        member's digest, so no stat or read is needed.
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry.fingerprint.digest != digest:
+            self.misses += 1
+            return False, None
+
+        self._touch(entry)
+        self.hits += 1
+        return True, json.loads(entry.payload)
+
+    def put_by_digest(self, key: str, digest: str, size: int, document: Any) -> None:
+        self._store(key, Fingerprint(size=size, mtime_ns=0, digest=digest), document)
+
+    def _touch(self, entry: _Entry) -> None:
+        now = time.time_ns()
+        if now - entry.last_used_ns > LAST_USED_RESOLUTION_NS:
+            entry.last_used_ns = now
+            self._dirty = True
+
+    def _store(self, key: str, fingerprint: Fingerprint, document: Any) -> None:
+        if not _is_json(document):
+            if self.entries.pop(key, None) is not None:
+                self._dirty = True
+            return
+        now = time.time_ns()
+        payload = json.dumps(document, ensure_ascii=False)
+        self.entries[key] = _Entry(fingerprint, payload, verified_ns=now, last_used_ns=now)
+        self._dirty = True
+
+    def evict(self) -> None:
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        total = sum(len(e.payload) for e in self.entries.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1].last_used_ns):
+            del self.entries[key]
+            total -= len(entry.payload)
+            self._dirty = True
+            if total <= self.max_bytes:
+                break
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.evict()
+        if not self._dirty:
+            return
+
+        # The cache is best-effort: a read-only checkout must still build.
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            ensure_cache_dir(self.path.parent)
+            entries = {
+                key: [list(e.fingerprint), e.payload, e.verified_ns, e.last_used_ns]
+                for key, e in self.entries.items()
+            }
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"format": CACHE_FORMAT, "entries": entries}, f)
+            os.replace(tmp_path, self.path)
+            self.path.with_name(LEGACY_CACHE_FILE).unlink(missing_ok=True)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._dirty = False
+
+
+def _entry_from_json(item: list) -> _Entry:
+    (size, mtime_ns, digest), payload, verified_ns, last_used_ns = item
+    if not all(isinstance(n, int) for n in (size, mtime_ns, verified_ns, last_used_ns)):
+        raise TypeError("bad cache entry")
+    if not isinstance(digest, str) or not isinstance(payload, str):
+        raise TypeError("bad cache entry")
+    return _Entry(Fingerprint(size, mtime_ns, digest), payload, verified_ns, last_used_ns)
+
+
+def _is_json(value: Any) -> bool:
+    """True if `value` comes back from a JSON round trip as it is."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_json(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json(v) for k, v in value.items())
+    return False
+
+
+def ensure_cache_dir(cache_dir: Path) -> Path:
+    """Create the cache directory, keeping it out of git with its own .gitignore."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("*\n")
+    return cache_dir
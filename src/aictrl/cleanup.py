@@ -0,0 +1,145 @@
+"""Removing build output: pruning orphans and `aictrl clean`.
+
+Only files a build manifest lists are ever removed, so files users keep
+in .claude/ or .cursor/ themselves survive. `clean` renames what it
+removes into .aictrl/.cache/trash/ -- one rename per file, or one for
+the whole directory when everything in it is tracked -- and deletes the
+trash in a detached background process, so even huge trees disappear
+immediately.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+from .cache import ensure_cache_dir
+from .config import get_cache_dir
+from .manifest import MANIFEST_FILE, read_manifest
+
+
+TRASH_DIR = "trash"
+
+
+@dataclass
+class CleanResult:
+    removed: list[str] = field(default_factory=list)    # target dirs cleaned
+    untracked: list[str] = field(default_factory=list)  # dirs left alone: no manifest
+    files: int = 0
+
+
+def remove_files(root: Path, paths: list[str]) -> int:
+    """Delete output files under `root` and any directories they leave
+    empty, stopping at each path's target directory. Returns the number
+    of files deleted."""
+    removed = 0
+    for path in paths:
+        try:
+            (root / path).unlink()
+        except FileNotFoundError:
+            continue
+        removed += 1
+        _remove_empty_parents(root, path)
+    return removed
+
+
+def clean_outputs(project_root: Path, output_dirs: list[str], force: bool = False) -> CleanResult:
+    """Remove tracked build output from each target directory.
+
+    Directories without a manifest are skipped (reported in `untracked`)
+    unless `force` is set, in which case they are removed entirely.
+    """
+    result = CleanResult()
+    trash = None
+
+    for output_dir in output_dirs:
+        target_dir = project_root / output_dir
+        if not target_dir.is_dir():
+            continue
+
+        manifest = read_manifest(project_root, output_dir)
+        if manifest is None and not force:
+            result.untracked.append(output_dir)
+            continue
+        if trash is None:
+            trash = _new_trash_dir(project_root)
+
+        tracked = [] if manifest is None else [*manifest.files, f"{output_dir}/{MANIFEST_FILE}"]
+        if manifest is None or _only_tracked(project_root, target_dir, tracked):
+            result.files += len(manifest.files) if manifest is not None else 0
+            _move(target_dir, trash / output_dir)
+        else:
+            for path in tracked:
+                src = project_root / path
+                if src.is_file() or src.is_symlink():
+                    dst = trash / path
+                    dst.parent.mkdir(parents=True, exist_ok=True)
+                    _move(src, dst)
+                    _remove_empty_parents(project_root, path)
+            result.files += len(manifest.files)
+        result.removed.append(output_dir)
+
+    if trash is not None:
+        delete_in_background(trash.parent)
+    return result
+
+
+def delete_in_background(path: Path) -> None:
+    """Delete a directory tree from a detached process that outlives this one."""
+    subprocess.Popen(
+        [sys.executable, "-c", "import shutil, sys; shutil.rmtree(sys.argv[1], ignore_errors=True)", str(path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+
+
+def _new_trash_dir(project_root: Path) -> Path:
+    # Everything under trash/ is garbage, including what an earlier
+    # background delete did not finish; it is all deleted together.
+    trash = ensure_cache_dir(get_cache_dir(project_root)) / TRASH_DIR / f"{os.getpid()}-{time.time_ns()}"
+    trash.mkdir(parents=True)
+    return trash
+
+
+def _move(src: Path, dst: Path) -> None:
+    try:
+        os.rename(src, dst)
+    except OSError:
+        # Trash is on another filesystem: delete in place instead.
+        if src.is_dir() and not src.is_symlink():
+            shutil.rmtree(src)
+        else:
+            src.unlink()
+
+
+def _only_tracked(project_root: Path, target_dir: Path, tracked: list[str]) -> bool:
+    """True if every file, directory and symlink under `target_dir` is a
+    tracked path or a parent of one."""
+    tracked_paths = {project_root / path for path in tracked}
+    tracked_dirs = {parent for path in tracked_paths for parent in path.parents}
+    for dirpath, dirnames, filenames in os.walk(target_dir):
+        for name in dirnames:
+            path = Path(dirpath, name)
+            # os.walk lists symlinks to directories here and does not follow them.
+            if path.is_symlink() or path not in tracked_dirs:
+                return False
+        for name in filenames:
+            if Path(dirpath, name) not in tracked_paths:
+                return False
+    return True
+
+
+def _remove_empty_parents(root: Path, path: str) -> None:
+    parts = PurePosixPath(path).parts
+    # Never remove the target directory itself (parts[0]).
+    for depth in range(len(parts) - 1, 1, -1):
+        try:
+            (root / PurePosixPath(*parts[:depth])).rmdir()
+        except OSError:
+            break
@@ -1,20 +1,109 @@
-import shutil
+"""The `aictrl` command line.
+
+Each command imports what it needs when it runs, so `check` and
+`status` (run from git hooks on every checkout) load neither Jinja nor
+the build pipeline, and nothing loads rich unless stdout is a terminal.
+tests/test_startup.py holds this in place.
+"""
+
 import sys
+import time
 from pathlib import Path
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from .config import load_config, load_org, AICTRL_DIR
-from .loader import load_skills
-from .merger import merge_overrides
-from .renderer import render_all, write_output_files, TARGETS
-from .lockfile import write_lockfile, read_lockfile, is_stale
-from .gitignore import ensure_gitignore
+from .cache import ParseCache
+from .config import load_config, load_org, get_pack_path, AICTRL_DIR
+from .console import Console, escape
+from .loader import SkillLoadError
+from .targets import TARGETS
 
 console = Console()
 
+JOBS_HELP = "Parallel worker processes (0 = all cores; default: auto)"
+NO_CACHE_HELP = "Ignore and do not update the parse cache and fingerprints in .aictrl/.cache/"
+RECURSIVE_HELP = "Every project with a .aictrl/ under --project (honors .gitignore), in parallel"
+# Git hooks run after git changes the work tree.
+HOOKS = ["post-checkout", "post-merge", "post-rewrite"]
+
+
+def _open_cache(project_root: Path, no_cache: bool) -> ParseCache | None:
+    if no_cache:
+        return None
+    return ParseCache.open(project_root)
+
+
+def _print_load_errors(error: SkillLoadError) -> None:
+    console.print(f"[red]Error:[/red] {len(error.errors)} skill file(s) failed to load:")
+    for _, message in error.errors:
+        console.print(f"  {message}", markup=False)
+
+
+def _find_projects_or_exit(root: Path) -> list[Path]:
+    from .monorepo import find_projects
+
+    projects = find_projects(root)
+    if not projects:
+        console.print(f"[yellow]No .aictrl/ projects found under {escape(str(root))}[/yellow]")
+        sys.exit(1)
+    return projects
+
+
+def _print_project_results(root: Path, results, columns) -> None:
+    """One table row per project: `columns` are (header, cell) pairs for
+    successful results, followed by time and outcome."""
+    rows = []
+    for r in results:
+        name = r.project.relative_to(root).as_posix() if r.project != root else "."
+        cells = [cell(r) if r.ok else "-" for _, cell in columns]
+        if not r.ok:
+            outcome = f"error: {r.error}"
+        elif r.stale:
+            outcome = "stale"
+        else:
+            outcome = "ok"
+        rows.append((name, *cells, f"{r.seconds * 1000:.0f}ms", outcome))
+    console.table(
+        "Projects",
+        [("Project", "cyan"), *((header, None) for header, _ in columns), ("Time", "dim"), ("Result", None)],
+        rows,
+    )
+    for r in results:
+        for message in r.details or []:
+            console.print(f"  {message}", markup=False)
+
+
+def _flush_telemetry_in_background() -> None:
+    """Upload what the telemetry hooks spooled, without waiting for it."""
+    from .telemetry import flush_in_background, has_pending
+
+    if has_pending():
+        flush_in_background()
+
+
+def _print_profile(profiler) -> None:
+    summary = profiler.summary()
+    wall_ns = sum(s.total_ns for s in summary if s.depth == 0) or 1
+    memory = profiler.peak_bytes is not None
+    rows = []
+    for s in summary:
+        row = ["  " * s.depth + s.name, str(s.calls), f"{s.total_ns / 1e6:.1f}ms", f"{100 * s.total_ns / wall_ns:.0f}%"]
+        if memory:
+            row.append(_format_bytes(s.peak_bytes) if s.peak_bytes is not None else "")
+        rows.append(tuple(row))
+    columns = [("Step", "cyan"), ("Calls", None), ("Time", "green"), ("Share", "dim")]
+    if memory:
+        columns.append(("Peak memory", None))
+    console.table("Profile", columns, rows)
+    if memory:
+        console.print(f"  Peak traced memory: {_format_bytes(profiler.peak_bytes)}")
+
+
+def _format_bytes(n: int) -> str:
+    if n < 2**20:
+        return f"{n / 1024:.0f}KB"
+    return f"{n / 2**20:.1f}MB"
+
 
 @click.group()
 def main():
@@ -25,9 +114,53 @@ def main():
 @main.command()
 @click.option("--target", type=click.Choice(list(TARGETS.keys())), help="Build only a specific target")
 @click.option("--project", default=".", help="Project root directory")
-def build(target, project):
+@click.option("--jobs", "-j", type=int, default=None, help=JOBS_HELP)
+@click.option("--no-cache", is_flag=True, help=NO_CACHE_HELP)
+@click.option("--full", is_flag=True, help="Re-render every output file, not only those whose inputs changed")
+@click.option("--timings", is_flag=True, help="Print how long each build phase took")
+@click.option("--recursive", "-r", is_flag=True, help=RECURSIVE_HELP)
+@click.option("--if-changed", is_flag=True, help="Do nothing if the last build was made from the .aictrl/ tree in git HEAD")
+@click.option("--profile", is_flag=True, help="Print a timing breakdown of every build step and render")
+@click.option("--profile-trace", type=click.Path(dir_okay=False), help="Also write a Chrome trace (JSON) to this file")
+@click.option("--profile-memory", is_flag=True, help="Also record peak memory per phase with tracemalloc (slower)")
+def build(target, project, jobs, no_cache, full, timings, recursive, if_changed, profile, profile_trace, profile_memory):
     """Build .claude/ and .cursor/ from .aictrl/ data."""
     project_root = Path(project).resolve()
+    target_names = [target] if target else None
+    if recursive:
+        if profile or profile_trace or profile_memory:
+            raise click.UsageError("--profile, --profile-trace and --profile-memory work on one project, not with --recursive.")
+        from .monorepo import build_projects
+
+        projects = _find_projects_or_exit(project_root)
+        if if_changed:
+            from .gittree import built_from_head
+
+            unchanged = [p for p in projects if built_from_head(p, target_names)]
+            if unchanged:
+                console.print(f"{len(unchanged)} of {len(projects)} projects unchanged since their last build.")
+            projects = [p for p in projects if p not in unchanged]
+            if not projects:
+                sys.exit(0)
+        results = build_projects(projects, target_names=target_names, jobs=jobs, full=full, use_cache=not no_cache)
+        _print_project_results(project_root, results, [
+            ("Skills", lambda r: str(r.skills)),
+            ("Files", lambda r: str(r.files)),
+            ("Written", lambda r: str(r.written)),
+        ])
+        failed = sum(not r.ok for r in results)
+        console.print(f"Built {len(results) - failed} of {len(results)} projects.")
+        _flush_telemetry_in_background()
+        sys.exit(1 if failed else 0)
+
+    if if_changed:
+        from .gittree import built_from_head
+
+        if built_from_head(project_root, target_names):
+            console.print("Up to date: .aictrl/ has not changed since the last build.")
+            sys.exit(0)
+
+    from .build import build_project
 
     try:
         config = load_config(project_root)
@@ -37,42 +170,142 @@ def build(target, project):
         console.print("Run 'aictrl init' to set up .aictrl/ first.")
         sys.exit(1)
 
-    skills = load_skills(project_root)
-    if not skills:
+    cache = _open_cache(project_root, no_cache)
+    profiler = None
+    if profile or profile_trace or profile_memory:
+        from .profiling import Profiler
+
+        profiler = Profiler(memory=profile_memory)
+    try:
+        if profiler is None:
+            result = build_project(
+                project_root, config, org,
+                target_names=target_names, jobs=jobs, cache=cache, full=full,
+            )
+        else:
+            with profiler:
+                result = build_project(
+                    project_root, config, org,
+                    target_names=target_names, jobs=jobs, cache=cache, full=full, profiler=profiler,
+                )
+    except SkillLoadError as e:
+        _print_load_errors(e)
+        sys.exit(1)
+    except (ValueError, FileNotFoundError) as e:
+        console.print(f"[red]Error:[/red] {escape(str(e))}")
+        sys.exit(1)
+
+    if not result.skills:
         console.print("[yellow]No skills found in .aictrl/data/skills/[/yellow]")
         sys.exit(0)
 
-    merged = merge_overrides(skills, project_root)
+    console.print(
+        f"[green]Built {len(result.skills)} skills → {result.files} files[/green] ({', '.join(result.targets)})"
+    )
+    if result.unchanged:
+        console.print(f"  {result.written} written, {result.unchanged} unchanged")
+    if result.pruned:
+        console.print(f"  Pruned {result.pruned} stale file(s)")
+    if result.gitignore_added:
+        console.print(f"  Added to .gitignore: {', '.join(result.gitignore_added)}")
+    _flush_telemetry_in_background()
+    if timings:
+        phases = ", ".join(f"{phase} {seconds * 1000:.1f}ms" for phase, seconds in result.timings.items())
+        console.print(f"  Timings: {phases}")
+    if profiler is not None:
+        _print_profile(profiler)
+        if profile_trace:
+            profiler.write_trace(Path(profile_trace))
+            console.print(f"  Trace written to {escape(profile_trace)} (open in chrome://tracing or ui.perfetto.dev)")
 
-    target_names = [target] if target else None
-    files = render_all(merged, config, org, project_root, target_names=target_names)
-    count = write_output_files(files, project_root)
 
-    write_lockfile(project_root, merged)
-    added_to_gitignore = ensure_gitignore(project_root)
+@main.command()
+@click.option("--target", type=click.Choice(list(TARGETS.keys())), help="Build only a specific target")
+@click.option("--project", default=".", help="Project root directory")
+@click.option("--jobs", "-j", type=int, default=None, help=JOBS_HELP)
+@click.option("--debounce", type=int, default=100, show_default=True, help="Milliseconds to wait for a burst of changes to settle")
+@click.option("--poll", is_flag=True, help="Poll for changes instead of using inotify")
+def watch(target, project, jobs, debounce, poll):
+    """Rebuild whenever anything under .aictrl/ changes."""
+    from .watch import watch_project
 
-    targets_built = target_names or config.targets
-    console.print(f"[green]Built {len(merged)} skills → {count} files[/green] ({', '.join(targets_built)})")
-    if added_to_gitignore:
-        console.print(f"  Added to .gitignore: {', '.join(added_to_gitignore)}")
+    project_root = Path(project).resolve()
+    try:
+        load_config(project_root)
+    except FileNotFoundError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        console.print("Run 'aictrl init' to set up .aictrl/ first.")
+        sys.exit(1)
+
+    def on_ready(watcher_name):
+        console.print(f"Watching .aictrl/ for changes ({watcher_name}). Press Ctrl+C to stop.")
+
+    def on_build(result, changed, seconds):
+        stamp = time.strftime("%H:%M:%S")
+        if not result.skills:
+            console.print(f"[dim]{stamp}[/dim] [yellow]No skills found in .aictrl/data/skills/[/yellow]")
+            return
+        summary = f"{result.written} written, {result.unchanged} unchanged"
+        if result.pruned:
+            summary += f", {result.pruned} pruned"
+        what = f"Rebuilt ({len(changed)} changed)" if changed else "Built"
+        console.print(f"[dim]{stamp}[/dim] [green]{what}[/green] {summary} in {seconds * 1000:.0f}ms")
+
+    def on_error(error):
+        stamp = time.strftime("%H:%M:%S")
+        if isinstance(error, SkillLoadError):
+            console.print(f"[dim]{stamp}[/dim]", end=" ")
+            _print_load_errors(error)
+        else:
+            console.print(f"[dim]{stamp}[/dim] [red]Error:[/red] {escape(str(error))}")
+
+    target_names = [target] if target else None
+    try:
+        watch_project(
+            project_root, on_build, on_error,
+            target_names=target_names, jobs=jobs, debounce=debounce / 1000, polling=poll, on_ready=on_ready,
+        )
+    except KeyboardInterrupt:
+        console.print("Stopped watching.")
 
 
 @main.command()
 @click.option("--project", default=".", help="Project root directory")
-def check(project):
+@click.option("--jobs", "-j", type=int, default=None, help=JOBS_HELP)
+@click.option("--no-cache", is_flag=True, help=NO_CACHE_HELP)
+@click.option("--recursive", "-r", is_flag=True, help=RECURSIVE_HELP)
+def check(project, jobs, no_cache, recursive):
     """Check if build is stale (exit code 1 if stale)."""
+    from .fingerprints import check_stale
+
     project_root = Path(project).resolve()
+    if recursive:
+        from .monorepo import check_projects
+
+        results = check_projects(_find_projects_or_exit(project_root), jobs=jobs, use_cache=not no_cache)
+        _print_project_results(project_root, results, [])
+        stale = sum(r.stale for r in results)
+        failed = sum(not r.ok for r in results)
+        if stale or failed:
+            console.print(f"[yellow]{stale + failed} of {len(results)} projects need attention.[/yellow]")
+            sys.exit(1)
+        console.print(f"[green]All {len(results)} projects are up to date.[/green]")
+        sys.exit(0)
 
+    cache = _open_cache(project_root, no_cache)
     try:
-        config = load_config(project_root)
-    except FileNotFoundError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        stale = check_stale(project_root, jobs=jobs, cache=cache)
+    except SkillLoadError as e:
+        _print_load_errors(e)
+        sys.exit(1)
+    except (ValueError, FileNotFoundError) as e:
+        console.print(f"[red]Error:[/red] {escape(str(e))}")
         sys.exit(1)
 
-    skills = load_skills(project_root)
-    merged = merge_overrides(skills, project_root)
+    if cache is not None:
+        cache.save()
 
-    if is_stale(project_root, merged):
+    if stale:
         console.print("[yellow]Build is stale.[/yellow] Run 'aictrl build' to update.")
         sys.exit(1)
     else:
@@ -82,20 +315,54 @@ def check(project):
 
 @main.command()
 @click.option("--project", default=".", help="Project root directory")
-def clean(project):
-    """Remove build output (.claude/ and .cursor/)."""
-    project_root = Path(project).resolve()
-    removed = []
+@click.option("--jobs", "-j", type=int, default=None, help="Parallel hashing threads (default: auto)")
+def verify(project, jobs):
+    """Check build output on disk against the build manifest (exit code 1 on drift)."""
+    from .manifest import read_manifest, verify_outputs
 
+    project_root = Path(project).resolve()
+    manifests = {}
     for target_cls in TARGETS.values():
-        target_dir = project_root / target_cls.output_dir
-        if target_dir.exists():
-            shutil.rmtree(target_dir)
-            removed.append(target_cls.output_dir)
+        manifest = read_manifest(project_root, target_cls.output_dir)
+        if manifest is not None:
+            manifests[target_cls.output_dir] = manifest.files
 
-    if removed:
-        console.print(f"[green]Cleaned:[/green] {', '.join(removed)}")
-    else:
+    if not manifests:
+        console.print("[yellow]No build manifest found.[/yellow] Run 'aictrl build' first.")
+        sys.exit(1)
+
+    result = verify_outputs(project_root, manifests, jobs=jobs)
+    for path in result.modified:
+        console.print(f"  [red]modified:[/red] {escape(path)}")
+    for path in result.missing:
+        console.print(f"  [red]missing:[/red]  {escape(path)}")
+
+    if not result.ok:
+        drifted = len(result.modified) + len(result.missing)
+        console.print(f"[yellow]{drifted} of {result.checked} files drifted.[/yellow] Run 'aictrl build' to restore.")
+        sys.exit(1)
+
+    console.print(f"[green]{result.checked} files match the build manifest.[/green]")
+
+
+@main.command()
+@click.option("--project", default=".", help="Project root directory")
+@click.option("--force", is_flag=True, help="Also remove target directories that have no build manifest")
+def clean(project, force):
+    """Remove build output tracked by the build manifests."""
+    from .cleanup import clean_outputs
+
+    project_root = Path(project).resolve()
+    result = clean_outputs(project_root, [t.output_dir for t in TARGETS.values()], force=force)
+
+    if result.removed:
+        console.print(f"[green]Cleaned:[/green] {', '.join(result.removed)} ({result.files} files)")
+    for output_dir in result.untracked:
+        console.print(
+            f"[yellow]Skipped {output_dir}:[/yellow] no build manifest, so aictrl cannot tell its files "
+            "from yours. Use --force to remove it anyway."
+        )
+    if not result.removed and not result.untracked:
         console.print("Nothing to clean.")
 
 
@@ -103,6 +370,8 @@ def clean(project):
 @click.option("--project", default=".", help="Project root directory")
 def status(project):
     """Show current skill versions from lockfile."""
+    from .lockfile import read_lockfile
+
     project_root = Path(project).resolve()
     lock = read_lockfile(project_root)
 
@@ -110,15 +379,11 @@ def status(project):
         console.print("[yellow]No lockfile found.[/yellow] Run 'aictrl build' first.")
         sys.exit(0)
 
-    table = Table(title="Installed Skills")
-    table.add_column("Skill", style="cyan")
-    table.add_column("Version", style="green")
-    table.add_column("Hash", style="dim", max_width=16)
-
-    for entry in lock.skills:
-        table.add_row(entry.slug, entry.version, entry.content_hash[:16])
-
-    console.print(table)
+    console.table(
+        "Installed Skills",
+        [("Skill", "cyan"), ("Version", "green"), ("Hash", "dim")],
+        [(entry.slug, entry.version, entry.content_hash[:16]) for entry in lock.skills],
+    )
 
 
 @main.command()
@@ -167,10 +432,140 @@ def init(org_id, api_url, project):
     console.print("  Then run 'aictrl build'")
 
 
+@main.command()
+@click.option("--project", default=".", help="Project root directory")
+@click.option("--keep-sources", is_flag=True, help="Keep the loose YAML files after packing")
+def pack(project, keep_sources):
+    """Pack .aictrl/data/skills/*.yaml into a single indexed skills.pack."""
+    from .pack import pack_skills
+
+    project_root = Path(project).resolve()
+    try:
+        count = pack_skills(project_root, remove_sources=not keep_sources)
+    except SkillLoadError as e:
+        _print_load_errors(e)
+        sys.exit(1)
+
+    console.print(f"[green]Packed {count} skills[/green] → {get_pack_path(project_root).relative_to(project_root)}")
+
+
+@main.command()
+@click.option("--project", default=".", help="Project root directory")
+@click.option("--keep-pack", is_flag=True, help="Keep skills.pack after extracting it")
+def unpack(project, keep_pack):
+    """Extract skills.pack back into .aictrl/data/skills/*.yaml."""
+    from .pack import unpack_skills
+
+    project_root = Path(project).resolve()
+    if not get_pack_path(project_root).exists():
+        console.print("[yellow]No skills.pack found.[/yellow]")
+        sys.exit(1)
+
+    count = unpack_skills(project_root, keep_pack=keep_pack)
+    console.print(f"[green]Unpacked {count} skills[/green] → .aictrl/data/skills/")
+
+
+@main.group()
+def daemon():
+    """Run a background build server that aictrl-client (and the git hook) use."""
+
+
+@daemon.command("start")
+@click.option("--foreground", is_flag=True, help="Serve in this process instead of detaching")
+@click.option("--idle-timeout", type=float, default=3600, show_default=True, help="Exit after this many idle seconds")
+def daemon_start(foreground, idle_timeout):
+    """Start the build daemon."""
+    from .client import DaemonUnavailable, request, socket_path
+    from .daemon import BuildDaemon, start_background
+
+    try:
+        pid = request({"op": "ping"}, timeout=2.0)["pid"]
+    except DaemonUnavailable:
+        pid = None
+    if pid is not None:
+        console.print(f"[yellow]Daemon already running[/yellow] (pid {pid}) on {socket_path()}")
+        return
+
+    if foreground:
+        console.print(f"Serving builds on {socket_path()}. Press Ctrl+C to stop.")
+        try:
+            BuildDaemon(idle_timeout=idle_timeout).serve()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    try:
+        pid = start_background(idle_timeout=idle_timeout)
+    except DaemonUnavailable as e:
+        console.print(f"[red]Error:[/red] daemon did not start: {escape(str(e))}")
+        sys.exit(1)
+    console.print(f"[green]Daemon started[/green] (pid {pid}) on {socket_path()}")
+
+
+@daemon.command("stop")
+def daemon_stop():
+    """Stop the build daemon."""
+    from .client import DaemonUnavailable, request
+
+    try:
+        request({"op": "stop"}, timeout=5.0)
+    except DaemonUnavailable:
+        console.print("No daemon running.")
+        return
+    console.print("[green]Daemon stopped.[/green]")
+
+
+@daemon.command("status")
+def daemon_status():
+    """Show whether the build daemon is running (exit code 1 if not)."""
+    from .client import DaemonUnavailable, request, socket_path
+
+    try:
+        response = request({"op": "ping"}, timeout=2.0)
+    except DaemonUnavailable:
+        console.print("No daemon running.")
+        sys.exit(1)
+    console.print(f"Daemon running (pid {response['pid']}) on {socket_path()}")
+    for project in response["projects"]:
+        console.print(f"  {escape(project)}")
+
+
+@main.group()
+def telemetry():
+    """Skill usage telemetry spooled by the generated hooks."""
+
+
+@telemetry.command("flush")
+def telemetry_flush():
+    """Upload spooled skill usage events (exit code 1 if some are left)."""
+    from .telemetry import flush, spool_path
+
+    try:
+        result = flush()
+    except OSError as e:
+        console.print(f"[red]Error:[/red] {escape(str(e))}")
+        sys.exit(1)
+    if result.busy:
+        console.print("Another flush is already running.")
+        return
+    if not (result.sent or result.dropped or result.pending):
+        console.print(f"Nothing to upload in {escape(str(spool_path()))}.")
+        return
+
+    console.print(f"[green]Sent {result.sent} events in {result.requests} requests.[/green]")
+    if result.dropped:
+        console.print(f"  Dropped {result.dropped} event(s)")
+    for error in result.errors:
+        console.print(f"  [yellow]{escape(error)}[/yellow]")
+    if result.pending:
+        console.print(f"[yellow]{result.pending} event(s) kept for the next flush.[/yellow]")
+        sys.exit(1)
+
+
 @main.command("install-hook")
 @click.option("--project", default=".", help="Project root directory")
 def install_hook(project):
-    """Install git post-checkout hook to auto-build on checkout."""
+    """Install git hooks that rebuild after a checkout, merge or rebase."""
     project_root = Path(project).resolve()
     hooks_dir = project_root / ".git" / "hooks"
 
@@ -179,25 +574,33 @@ def install_hook(project):
         sys.exit(1)
 
     hooks_dir.mkdir(exist_ok=True)
-    hook_path = hooks_dir / "post-checkout"
 
+    # aictrl-client hands the build to a running `aictrl daemon` and
+    # builds in-process otherwise. With --if-changed it exits after one
+    # `git rev-parse` when .aictrl/ is the tree the last build used.
     hook_content = """#!/bin/bash
-# Auto-build skills on checkout (installed by aictrl)
-if command -v aictrl &> /dev/null && [ -d ".aictrl" ]; then
-  aictrl build --project "$(git rev-parse --show-toplevel)" 2>/dev/null || true
+# Auto-build skills when git changes .aictrl/ (installed by aictrl)
+if [ -d ".aictrl" ]; then
+  if command -v aictrl-client &> /dev/null; then
+    aictrl-client build --if-changed --project "$(git rev-parse --show-toplevel)" 2>/dev/null || true
+  elif command -v aictrl &> /dev/null; then
+    aictrl build --if-changed --project "$(git rev-parse --show-toplevel)" 2>/dev/null || true
+  fi
 fi
 """
 
-    if hook_path.exists():
-        existing = hook_path.read_text()
-        if "aictrl" in existing:
-            console.print("[yellow]Hook already installed.[/yellow]")
-            sys.exit(0)
-        # Append to existing hook
-        with open(hook_path, "a") as f:
-            f.write("\n" + hook_content)
-        console.print("[green]Appended aictrl hook to existing post-checkout.[/green]")
-    else:
-        hook_path.write_text(hook_content)
-        hook_path.chmod(0o755)
-        console.print("[green]Installed post-checkout hook.[/green]")
+    for name in HOOKS:
+        hook_path = hooks_dir / name
+        if hook_path.exists():
+            existing = hook_path.read_text()
+            if "aictrl" in existing:
+                console.print(f"[yellow]{name} hook already installed.[/yellow]")
+                continue
+            # Append to existing hook
+            with open(hook_path, "a") as f:
+                f.write("\n" + hook_content)
+            console.print(f"[green]Appended aictrl hook to existing {name}.[/green]")
+        else:
+            hook_path.write_text(hook_content)
+            hook_path.chmod(0o755)
+            console.print(f"[green]Installed {name} hook.[/green]")
@@ -0,0 +1,167 @@
+"""`aictrl-client`: ask the build daemon for a build, or build in-process.
+
+This is what the git hook runs, so it imports nothing beyond the
+standard library until it has to: when a daemon (see daemon.py) is
+listening, a build costs one interpreter start and a socket round trip.
+Without one, or if the daemon runs a different aictrl release, it falls
+back to `aictrl build`.
+
+Protocol: one JSON object per line each way over a Unix domain socket.
+Every request has an "op" ("ping", "build" or "stop") and the client's
+"version"; every response has "ok" and, when that is false, "error".
+
+`build --if-changed` first asks gittree whether .aictrl/ is still the
+git tree the last build was made from, and then does nothing at all.
+"""
+
+import json
+import os
+import socket
+import stat
+import sys
+from pathlib import Path
+
+from . import __version__
+
+
+SOCKET_ENV = "AICTRL_DAEMON_SOCKET"
+SOCKET_NAME = "daemon.sock"
+# Builds of large catalogs take a while; only a wedged daemon takes this long.
+BUILD_TIMEOUT = 600.0
+
+
+class DaemonUnavailable(Exception):
+    """No daemon is listening, or it cannot serve this client."""
+
+
+def socket_path() -> Path:
+    """The per-user daemon socket.
+
+    $AICTRL_DAEMON_SOCKET if set, else aictrl/daemon.sock under
+    $XDG_RUNTIME_DIR, else under a per-user directory in the temp dir.
+    """
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "aictrl" / SOCKET_NAME
+    import tempfile
+
+    return Path(tempfile.gettempdir()) / f"aictrl-{os.getuid()}" / SOCKET_NAME
+
+
+def check_socket_dir(directory: Path) -> None:
+    """Refuse a socket directory another user could have made or can
+    write to (the temp dir is shared): it must be a real directory, ours,
+    with mode 0700. Raises DaemonUnavailable."""
+    try:
+        st = os.lstat(directory)
+    except OSError as e:
+        raise DaemonUnavailable(f"no daemon in {directory}: {e.strerror or e}") from None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+        raise DaemonUnavailable(f"{directory} is not a private directory (owned by you, mode 0700)")
+
+
+def uses_default_socket() -> bool:
+    """True unless $AICTRL_DAEMON_SOCKET names the socket; only the
+    directory of a default socket is checked, an explicit one is trusted."""
+    return not os.environ.get(SOCKET_ENV)
+
+
+def request(message: dict, path: Path | None = None, timeout: float = BUILD_TIMEOUT) -> dict:
+    """Send one request to the daemon and return its response."""
+    if path is None:
+        path = socket_path()
+        if uses_default_socket():
+            check_socket_dir(path.parent)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(os.fspath(path))
+        except OSError as e:
+            raise DaemonUnavailable(f"no daemon at {path}: {e.strerror or e}") from None
+        sock.sendall(json.dumps({"version": __version__, **message}).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    except OSError as e:
+        raise DaemonUnavailable(f"daemon at {path} failed: {e}") from None
+    finally:
+        sock.close()
+    if not line:
+        raise DaemonUnavailable(f"daemon at {path} closed the connection")
+    response = json.loads(line)
+    if response.get("stale"):
+        raise DaemonUnavailable(response["error"])
+    return response
+
+
+def print_build(response: dict) -> None:
+    """Print a build response the way `aictrl build` reports a build."""
+    if not response["ok"]:
+        print(f"Error: {response['error']}")
+        for message in response.get("messages", []):
+            print(f"  {message}")
+        return
+    if not response["skills"]:
+        print("No skills found in .aictrl/data/skills/")
+        return
+    print(f"Built {response['skills']} skills → {response['files']} files ({', '.join(response['targets'])})")
+    if response["unchanged"]:
+        print(f"  {response['written']} written, {response['unchanged']} unchanged")
+    if response["pruned"]:
+        print(f"  Pruned {response['pruned']} stale file(s)")
+    if response["gitignore_added"]:
+        print(f"  Added to .gitignore: {', '.join(response['gitignore_added'])}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """aictrl-client build [--if-changed] [--project DIR] [--target NAME]"""
+    args = list(sys.argv[1:] if argv is None else argv)
+    if not args or args[0] != "build":
+        print("usage: aictrl-client build [--if-changed] [--project DIR] [--target NAME]", file=sys.stderr)
+        return 2
+
+    options = {"--project": ".", "--target": None}
+    if_changed = False
+    rest = args[1:]
+    while rest:
+        flag = rest.pop(0)
+        if flag == "--if-changed":
+            if_changed = True
+            continue
+        if flag not in options or not rest:
+            print(f"aictrl-client: unexpected argument {flag!r}", file=sys.stderr)
+            return 2
+        options[flag] = rest.pop(0)
+
+    project_root = Path(options["--project"]).resolve()
+    if if_changed:
+        # Answered before any daemon or CLI is involved: the hooks' fast path.
+        from .gittree import built_from_head
+
+        target_names = [options["--target"]] if options["--target"] else None
+        if built_from_head(project_root, target_names):
+            return 0
+    try:
+        response = request({"op": "build", "project": str(project_root), "target": options["--target"]})
+    except DaemonUnavailable:
+        return _build_in_process(args)
+
+    print_build(response)
+    return 0 if response["ok"] else 1
+
+
+def _build_in_process(args: list[str]) -> int:
+    from .cli import main as cli_main
+
+    try:
+        cli_main(args, prog_name="aictrl")
+    except SystemExit as e:
+        return e.code or 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
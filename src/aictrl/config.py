@@ -1,15 +1,17 @@
 from pathlib import Path
 from dataclasses import dataclass, field
 
-import yaml
-
 
 AICTRL_DIR = ".aictrl"
 CONFIG_FILE = "config.yaml"
+DATA_DIR = "data"
 ORG_FILE = "data/org.yaml"
 SKILLS_DIR = "data/skills"
+PACK_FILE = "data/skills.pack"
 OVERRIDES_DIR = "overrides/skills"
+TEMPLATES_DIR = "templates"
 LOCK_FILE = "skills.lock"
+CACHE_DIR = ".cache"
 
 
 @dataclass
@@ -29,7 +31,9 @@ class OrgData:
 
 
 def load_config(project_root: Path) -> AictrlConfig:
-    config_path = project_root / AICTRL_DIR / CONFIG_FILE
+    import yaml
+
+    config_path = get_config_path(project_root)
     if not config_path.exists():
         raise FileNotFoundError(f"Config not found: {config_path}")
 
@@ -45,7 +49,9 @@ def load_config(project_root: Path) -> AictrlConfig:
 
 
 def load_org(project_root: Path) -> OrgData:
-    org_path = project_root / AICTRL_DIR / ORG_FILE
+    import yaml
+
+    org_path = get_org_path(project_root)
     if not org_path.exists():
         raise FileNotFoundError(f"Org data not found: {org_path}")
 
@@ -64,13 +70,37 @@ def get_aictrl_dir(project_root: Path) -> Path:
     return project_root / AICTRL_DIR
 
 
+def get_config_path(project_root: Path) -> Path:
+    return project_root / AICTRL_DIR / CONFIG_FILE
+
+
+def get_org_path(project_root: Path) -> Path:
+    return project_root / AICTRL_DIR / ORG_FILE
+
+
+def get_data_dir(project_root: Path) -> Path:
+    return project_root / AICTRL_DIR / DATA_DIR
+
+
 def get_skills_dir(project_root: Path) -> Path:
     return project_root / AICTRL_DIR / SKILLS_DIR
 
 
+def get_pack_path(project_root: Path) -> Path:
+    return project_root / AICTRL_DIR / PACK_FILE
+
+
 def get_overrides_dir(project_root: Path) -> Path:
     return project_root / AICTRL_DIR / OVERRIDES_DIR
 
 
+def get_templates_dir(project_root: Path) -> Path:
+    return project_root / AICTRL_DIR / TEMPLATES_DIR
+
+
 def get_lock_path(project_root: Path) -> Path:
     return project_root / AICTRL_DIR / LOCK_FILE
+
+
+def get_cache_dir(project_root: Path) -> Path:
+    return project_root / AICTRL_DIR / CACHE_DIR
@@ -0,0 +1,81 @@
+"""Terminal output for the CLI.
+
+Messages use rich markup ("[red]Error:[/red] ..."). rich is imported
+only when stdout is a terminal; piped output (git hooks, CI, scripts)
+is written as plain text with the markup stripped, so short commands
+never pay for importing it.
+"""
+
+import re
+import sys
+
+
+# The markup tag syntax rich uses, with a backslash run that may escape it.
+_TAG = re.compile(r"(\\*)(\[[a-z#/@][^[]*?])")
+
+
+def escape(text: str) -> str:
+    """Escape text so it is printed literally (same rules as rich.markup.escape)."""
+    def escape_backslashes(match: re.Match) -> str:
+        backslashes, tag = match.groups()
+        return f"{backslashes}{backslashes}\\{tag}"
+
+    text = _TAG.sub(escape_backslashes, text)
+    if text.endswith("\\") and not text.endswith("\\\\"):
+        return text + "\\"
+    return text
+
+
+def strip_markup(text: str) -> str:
+    """Drop markup tags, keeping escaped ones as literal text."""
+    def replace(match: re.Match) -> str:
+        backslashes, tag = match.groups()
+        escaped, literal = divmod(len(backslashes), 2)
+        return "\\" * escaped + (tag if literal else "")
+
+    return _TAG.sub(replace, text)
+
+
+class Console:
+    """print() and table() with rich on a terminal, plain text otherwise."""
+
+    def __init__(self):
+        self._rich = None
+
+    def print(self, text: str = "", markup: bool = True, end: str = "\n") -> None:
+        rich = self._rich_console()
+        if rich is not None:
+            rich.print(text, markup=markup, end=end)
+            return
+        sys.stdout.write((strip_markup(text) if markup else text) + end)
+
+    def table(self, title: str, columns: list[tuple[str, str]], rows: list[tuple[str, ...]]) -> None:
+        """Print rows under (header, style) columns."""
+        rich = self._rich_console()
+        if rich is not None:
+            from rich.table import Table
+
+            table = Table(title=title)
+            for header, style in columns:
+                table.add_column(header, style=style)
+            for row in rows:
+                table.add_row(*row)
+            rich.print(table)
+            return
+
+        headers = [header for header, _ in columns]
+        widths = [max(len(cell) for cell in column) for column in zip(headers, *rows)]
+        lines = [title] + [
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in [headers, *rows]
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _rich_console(self):
+        if not sys.stdout.isatty():
+            return None
+        if self._rich is None:
+            from rich.console import Console as RichConsole
+
+            self._rich = RichConsole()
+        return self._rich
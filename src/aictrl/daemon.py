@@ -0,0 +1,227 @@
+"""The build daemon: warm, repeated builds for `aictrl-client`.
+
+One daemon per user serves every project over a Unix domain socket (see
+client.py for the protocol). Each project gets a watch.BuildSession, so
+its parsed catalog stays in memory and its template environment stays
+compiled between builds; what changed on disk since the last build is
+still found the usual way, by the parse cache's stat checks and the
+build manifests, so a warm build is as correct as a cold one.
+
+Builds run one at a time: the renderer keeps per-process state. Every
+FLUSH_INTERVAL seconds the daemon also uploads spooled skill telemetry
+(see telemetry.py) in a background thread. The daemon exits after
+`idle_timeout` seconds without a request, and answers clients of another
+aictrl release with a "stale" error (they then build in-process) before
+shutting itself down.
+"""
+
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from . import __version__
+from .build import BuildResult
+from .client import DaemonUnavailable, check_socket_dir, request, socket_path, uses_default_socket
+from .config import get_config_path
+from .loader import SkillLoadError
+from .telemetry import flush, has_pending
+from .watch import BuildSession, build_errors
+
+
+DEFAULT_IDLE_TIMEOUT = 3600.0
+POLL_INTERVAL = 0.5
+FLUSH_INTERVAL = 60.0
+
+
+class BuildDaemon:
+    """Serves build requests on `path` until stopped or idle."""
+
+    def __init__(self, path: Path | None = None, idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT):
+        # Only a default socket's directory (possibly in the shared temp
+        # dir) is checked; a path given explicitly is trusted.
+        self.private_dir = path is None and uses_default_socket()
+        self.path = path or socket_path()
+        self.idle_timeout = idle_timeout
+        self.sessions: dict[tuple[Path, str | None], BuildSession] = {}
+        self._build_lock = threading.Lock()
+        self._last_request = time.monotonic()
+        self._stopping = threading.Event()
+        self._server = None
+        self._inode = None
+        self._last_flush = float("-inf")
+        self._flusher: threading.Thread | None = None
+
+    def bind(self) -> None:
+        """Listen on the socket, replacing a stale one left by a dead daemon."""
+        # No other user may connect, not even between bind() and chmod().
+        umask = os.umask(0o077)
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if self.private_dir:
+                try:
+                    check_socket_dir(self.path.parent)
+                except DaemonUnavailable as e:
+                    raise RuntimeError(str(e)) from None
+            if self.path.exists():
+                try:
+                    request({"op": "ping"}, self.path, timeout=2.0)
+                except DaemonUnavailable:
+                    self.path.unlink()
+                else:
+                    raise RuntimeError(f"A daemon is already listening on {self.path}")
+            self._server = _Server(os.fspath(self.path), _Handler)
+        finally:
+            os.umask(umask)
+        self._server.build_daemon = self
+        os.chmod(self.path, 0o600)
+        self._inode = os.stat(self.path).st_ino
+
+    def serve(self) -> None:
+        """Handle requests until stop() or the idle timeout."""
+        if self._server is None:
+            self.bind()
+        self._server.timeout = POLL_INTERVAL
+        try:
+            while not self._stopping.is_set():
+                self._server.handle_request()
+                self._flush_telemetry()
+                idle = time.monotonic() - self._last_request
+                if self.idle_timeout is not None and idle > self.idle_timeout:
+                    break
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    def _flush_telemetry(self) -> None:
+        now = time.monotonic()
+        if now - self._last_flush < FLUSH_INTERVAL or (self._flusher is not None and self._flusher.is_alive()):
+            return
+        self._last_flush = now
+        if has_pending():
+            self._flusher = threading.Thread(target=_flush_quietly, daemon=True)
+            self._flusher.start()
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            # A newer daemon may have replaced the socket by now; leave its socket alone.
+            try:
+                if os.stat(self.path).st_ino == self._inode:
+                    self.path.unlink()
+            except FileNotFoundError:
+                pass
+        with self._build_lock:
+            for (project_root, _), session in self.sessions.items():
+                if get_config_path(project_root).exists():
+                    session.close()
+            self.sessions.clear()
+
+    def handle(self, message: dict) -> dict:
+        self._last_request = time.monotonic()
+        if message.get("version") != __version__:
+            # The client runs another aictrl release: make way for a new daemon.
+            self.stop()
+            return {
+                "ok": False, "stale": True,
+                "error": f"daemon runs aictrl {__version__}, client {message.get('version')}",
+            }
+
+        op = message.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "projects": sorted(str(p) for p, _ in self.sessions)}
+        if op == "stop":
+            self.stop()
+            return {"ok": True}
+        if op == "build":
+            return self._build(Path(message["project"]), message.get("target"))
+        return {"ok": False, "error": f"unknown op: {op!r}"}
+
+    def _build(self, project_root: Path, target: str | None) -> dict:
+        start = time.perf_counter()
+        with self._build_lock:
+            key = (project_root, target)
+            session = self.sessions.get(key)
+            if session is None:
+                if not get_config_path(project_root).exists():
+                    return {"ok": False, "error": f"Config not found: {get_config_path(project_root)}"}
+                session = BuildSession(project_root, target_names=[target] if target else None)
+                self.sessions[key] = session
+            try:
+                result = session.build()
+            except SkillLoadError as e:
+                return {
+                    "ok": False,
+                    "error": f"{len(e.errors)} skill file(s) failed to load:",
+                    "messages": [message for _, message in e.errors],
+                }
+            except build_errors() as e:
+                return {"ok": False, "error": str(e)}
+        return {"ok": True, "seconds": time.perf_counter() - start, **_result_fields(result)}
+
+
+def _result_fields(result: BuildResult) -> dict:
+    return {
+        "skills": len(result.skills),
+        "targets": result.targets,
+        "files": result.files,
+        "rendered": result.rendered,
+        "reused": result.reused,
+        "written": result.written,
+        "unchanged": result.unchanged,
+        "pruned": result.pruned,
+        "gitignore_added": result.gitignore_added,
+        "timings": result.timings,
+    }
+
+
+def _flush_quietly() -> None:
+    try:
+        flush()
+    except OSError:
+        pass  # retried at the next interval
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                response = self.server.build_daemon.handle(json.loads(line))
+            except (ValueError, KeyError, TypeError) as e:
+                response = {"ok": False, "error": f"bad request: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+def start_background(idle_timeout: float = DEFAULT_IDLE_TIMEOUT, wait: float = 10.0) -> int:
+    """Start a detached daemon and wait until it answers. Returns its pid."""
+    subprocess.Popen(
+        [sys.executable, "-m", "aictrl.daemon", str(idle_timeout)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+    deadline = time.monotonic() + wait
+    while True:
+        try:
+            return request({"op": "ping"}, timeout=2.0)["pid"]
+        except DaemonUnavailable:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+if __name__ == "__main__":
+    BuildDaemon(idle_timeout=float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_IDLE_TIMEOUT).serve()
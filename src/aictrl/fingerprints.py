@@ -0,0 +1,271 @@
+"""Stat fingerprints of build inputs, for a fast `aictrl check`.
+
+After a build (or a check that found the build fresh) the size,
+mtime_ns and inode of every input file are recorded in
+.aictrl/.cache/sources.json, together with the lockfile's own
+fingerprint. A later check compares them in one stat sweep: if nothing
+moved, the build is fresh without parsing anything; if only skill YAML
+files moved, only those files are parsed, merged and hashed.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .cache import RACY_WINDOW_NS, ensure_cache_dir
+from .config import (
+    get_cache_dir,
+    get_config_path,
+    get_data_dir,
+    get_lock_path,
+    get_org_path,
+    get_overrides_dir,
+    get_pack_path,
+    get_skills_dir,
+    get_templates_dir,
+)
+from .hashing import HASH_ALGORITHM, compute_skill_hashes
+from .loader import SkillData, load_skill_files, load_skill_sources
+from .lockfile import is_stale, read_lockfile
+from .merger import merge_overrides
+
+
+FINGERPRINTS_FILE = "sources.json"
+FINGERPRINTS_FORMAT = 1
+
+Fingerprint = list[int]  # [size, mtime_ns, inode]
+
+
+@dataclass
+class SourceSnapshot:
+    taken_ns: int
+    files: dict[str, Fingerprint | None]
+
+
+@dataclass
+class _Record:
+    taken_ns: int
+    lock: Fingerprint | None
+    files: dict[str, Fingerprint | None]
+    content_sources: dict[str, Fingerprint | None] = field(default_factory=dict)
+    slugs: dict[str, list[str]] = field(default_factory=dict)
+
+
+def stat_fingerprint(path: Path) -> Fingerprint | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def input_paths(project_root: Path) -> list[Path]:
+    """Every file a build reads, apart from external content_files sources."""
+    paths = [get_config_path(project_root), get_org_path(project_root)]
+
+    skills_dir = get_skills_dir(project_root)
+    if skills_dir.exists():
+        paths.extend(sorted(skills_dir.glob("*.yaml")))
+
+    pack_path = get_pack_path(project_root)
+    if pack_path.exists():
+        paths.append(pack_path)
+
+    overrides_dir = get_overrides_dir(project_root)
+    if overrides_dir.exists():
+        paths.extend(sorted(overrides_dir.glob("*.yaml")))
+
+    templates_dir = get_templates_dir(project_root)
+    if templates_dir.exists():
+        paths.extend(sorted(p for p in templates_dir.rglob("*") if p.is_file()))
+
+    return paths
+
+
+def take_snapshot(project_root: Path) -> SourceSnapshot:
+    """Stat every build input. Take this before reading the inputs."""
+    taken_ns = time.time_ns()
+    files = {_rel(project_root, p): stat_fingerprint(p) for p in input_paths(project_root)}
+    return SourceSnapshot(taken_ns=taken_ns, files=files)
+
+
+def save_fingerprints(
+    project_root: Path,
+    snapshot: SourceSnapshot,
+    sources: list[tuple[Path, SkillData]],
+    merged: list[SkillData],
+) -> None:
+    """Record the snapshot taken before a build (or fresh check) read its inputs.
+
+    `sources` are the (file, skill) pairs from load_skill_sources and
+    `merged` the skills after overrides, whose external content files
+    are fingerprinted as well.
+    """
+    data_dir = get_data_dir(project_root)
+    content_sources = {}
+    for skill in merged:
+        for value in skill.content_files.values():
+            if isinstance(value, dict):
+                path = data_dir / value["source"]
+                content_sources[_rel(project_root, path)] = stat_fingerprint(path)
+
+    slugs: dict[str, list[str]] = {}
+    for path, skill in sources:
+        slugs.setdefault(_rel(project_root, path), []).append(skill.slug)
+
+    _write_record(project_root, _Record(
+        taken_ns=snapshot.taken_ns,
+        lock=stat_fingerprint(get_lock_path(project_root)),
+        files=snapshot.files,
+        content_sources=content_sources,
+        slugs=slugs,
+    ))
+
+
+def quick_check(project_root: Path, jobs: int | None = None, cache=None) -> bool | None:
+    """Decide staleness from recorded fingerprints where possible.
+
+    Returns False (fresh) or True (stale) when the answer follows from
+    the fingerprints and the changed skill files alone, or None when a
+    full check is needed: no record, the lockfile changed, or an input
+    other than a loose skill file changed.
+    """
+    record = _read_record(project_root)
+    if record is None:
+        return None
+
+    lock_fp = stat_fingerprint(get_lock_path(project_root))
+    if lock_fp is None or lock_fp != record.lock:
+        return None
+
+    trusted_before = record.taken_ns - RACY_WINDOW_NS
+
+    def unchanged(now: Fingerprint | None, then: Fingerprint | None) -> bool:
+        return then is not None and now == then and then[1] < trusted_before
+
+    for rel, then in record.content_sources.items():
+        if not unchanged(stat_fingerprint(project_root / rel), then):
+            return None
+
+    snapshot = take_snapshot(project_root)
+    changed = {
+        rel for rel in snapshot.files.keys() | record.files.keys()
+        if not unchanged(snapshot.files.get(rel), record.files.get(rel))
+    }
+    if not changed:
+        return False
+
+    skills_rel = _rel(project_root, get_skills_dir(project_root))
+    if any(Path(rel).parent.as_posix() != skills_rel for rel in changed):
+        return None
+
+    lock = read_lockfile(project_root)
+    if lock is None or lock.hash_algorithm != HASH_ALGORITHM:
+        return None
+
+    slugs = set()
+    for rel, rel_slugs in record.slugs.items():
+        if rel not in changed:
+            slugs.update(rel_slugs)
+
+    changed_files = sorted(project_root / rel for rel in changed if snapshot.files.get(rel) is not None)
+    skills = load_skill_files(changed_files, jobs=jobs, cache=cache)
+    slugs.update(s.slug for s in skills)
+    if slugs != {e.slug for e in lock.skills}:
+        return True
+
+    merged = merge_overrides(skills, project_root, cache=cache)
+    hashes = compute_skill_hashes(merged, get_data_dir(project_root))
+    lock_map = {e.slug: e for e in lock.skills}
+    for skill in merged:
+        entry = lock_map[skill.slug]
+        if entry.version != skill.version or entry.content_hash != hashes[skill.slug]:
+            return True
+
+    # Fresh: fold the changed files into the record so the next check is instant.
+    record.files = snapshot.files
+    record.taken_ns = snapshot.taken_ns
+    record.slugs = {rel: s for rel, s in record.slugs.items() if rel not in changed}
+    for path, skill in zip(changed_files, skills):
+        record.slugs.setdefault(_rel(project_root, path), []).append(skill.slug)
+    _write_record(project_root, record)
+    return False
+
+
+def check_stale(project_root: Path, jobs: int | None = None, cache=None) -> bool:
+    """True if the build is stale: quick_check where it can decide,
+    otherwise a full load and hash of every skill.
+
+    Raises FileNotFoundError without a config, SkillLoadError for
+    unreadable skill files and ValueError for bad overrides.
+    """
+    # Fast path: answer from recorded stat fingerprints, parsing at most
+    # the skill files that changed.
+    if cache is not None:
+        stale = quick_check(project_root, jobs=jobs, cache=cache)
+        if stale is not None:
+            return stale
+
+    config_path = get_config_path(project_root)
+    if not config_path.exists():
+        raise FileNotFoundError(f"Config not found: {config_path}")
+
+    snapshot = take_snapshot(project_root)
+    sources = load_skill_sources(project_root, jobs=jobs, cache=cache)
+    merged = merge_overrides([skill for _, skill in sources], project_root, cache=cache)
+    stale = is_stale(project_root, merged)
+    if not stale and cache is not None:
+        save_fingerprints(project_root, snapshot, sources, merged)
+    return stale
+
+
+def _rel(project_root: Path, path: Path) -> str:
+    try:
+        return path.relative_to(project_root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _record_path(project_root: Path) -> Path:
+    return get_cache_dir(project_root) / FINGERPRINTS_FILE
+
+
+def _read_record(project_root: Path) -> _Record | None:
+    try:
+        with open(_record_path(project_root)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("format") != FINGERPRINTS_FORMAT:
+        return None
+
+    return _Record(
+        taken_ns=data["taken_ns"],
+        lock=data["lock"],
+        files=data["files"],
+        content_sources=data.get("content_sources", {}),
+        slugs=data.get("slugs", {}),
+    )
+
+
+def _write_record(project_root: Path, record: _Record) -> None:
+    path = _record_path(project_root)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    data = {
+        "format": FINGERPRINTS_FORMAT,
+        "taken_ns": record.taken_ns,
+        "lock": record.lock,
+        "files": record.files,
+        "content_sources": record.content_sources,
+        "slugs": record.slugs,
+    }
+    try:
+        ensure_cache_dir(path.parent)
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
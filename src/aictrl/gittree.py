@@ -0,0 +1,150 @@
+"""The git tree a build was made from, for the checkout hooks' fast path.
+
+Every build records in .aictrl/.cache/git-tree.json, for each target
+it wrote, the object id of `HEAD:.aictrl` it was built from, but only
+when .aictrl/ had no uncommitted changes apart from the lockfile the
+build itself writes, so the id really describes the inputs. Records
+of targets a build did not touch are kept, so `build --target cursor`
+leaves what is known about .claude/ alone. Without --target, the
+targets to check are config.targets, saved with the tree they were
+read at. After a checkout, merge or
+rebase, `build --if-changed` (and aictrl-client, which the hooks run)
+compares it with `git rev-parse HEAD:.aictrl`: when they match and the
+outputs are still there, nothing under .aictrl/ changed and there is
+nothing to build. Git hashes trees incrementally, so this costs one
+`git rev-parse` whatever the size of the catalog.
+
+Only the standard library is imported: aictrl-client answers from here
+before it touches the daemon or the CLI.
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from . import __version__
+from .config import AICTRL_DIR, LOCK_FILE, get_cache_dir
+
+
+TREE_FILE = "git-tree.json"
+MANIFEST_FILE = ".aictrl-manifest.json"  # as manifest.MANIFEST_FILE, which imports more
+
+
+def head_tree(project_root: Path) -> str | None:
+    """The tree id of .aictrl/ in HEAD, or None outside git or when it is not committed."""
+    proc = _git(project_root, "rev-parse", "--verify", "--quiet", f"HEAD:./{AICTRL_DIR}")
+    if proc is None or proc.returncode != 0:
+        return None
+    return proc.stdout.strip() or None
+
+
+def is_clean(project_root: Path) -> bool:
+    """True if .aictrl/ matches HEAD: no modified, staged or untracked
+    (unignored) files. The lockfile is left out: builds write it, it is
+    not an input."""
+    proc = _git(project_root, "status", "--porcelain", "--", AICTRL_DIR, f":(exclude){AICTRL_DIR}/{LOCK_FILE}")
+    return proc is not None and proc.returncode == 0 and not proc.stdout.strip()
+
+
+def forget_tree(project_root: Path, target_names: list[str]) -> None:
+    """Drop the record of `target_names`; a build calls this before it
+    changes any of their outputs."""
+    record = _read_record(project_root)
+    if record is None:
+        return
+    for name in target_names:
+        record["targets"].pop(name, None)
+    _write_record(project_root, record)
+
+
+def record_tree(
+    project_root: Path,
+    tree: str | None,
+    output_dirs: dict[str, str],
+    configured: list[str],
+) -> bool:
+    """Record that a build of `output_dirs` (target name -> directory)
+    was made from `tree`, the head_tree() taken before it read its
+    inputs, with `configured` the config.targets it read. Other
+    targets' records are kept. Nothing is recorded if `tree` is None or
+    .aictrl/ now differs from HEAD. Returns whether a record was written."""
+    if tree is None or not is_clean(project_root):
+        return False
+    record = _read_record(project_root) or {"aictrl": __version__, "targets": {}}
+    for name, output_dir in output_dirs.items():
+        record["targets"][name] = {"tree": tree, "output_dir": output_dir}
+    record["configured"] = {"tree": tree, "targets": list(configured)}
+    return _write_record(project_root, record)
+
+
+def built_from_head(project_root: Path, target_names: list[str] | None = None) -> bool:
+    """True if every one of `target_names` (default: config.targets) was
+    last built by this aictrl from the tree .aictrl/ has in HEAD, and
+    their outputs are still on disk. A target with no record was not."""
+    record = _read_record(project_root)
+    if record is None:
+        return False
+    try:
+        trees = set()
+        if target_names is None:
+            # config.targets as read at the recorded tree; if HEAD has
+            # that tree, it still has that config.
+            configured = record["configured"]
+            trees.add(configured["tree"])
+            target_names = configured["targets"]
+        entries = [record["targets"][name] for name in target_names]
+        trees.update(entry["tree"] for entry in entries)
+        output_dirs = [entry["output_dir"] for entry in entries]
+    except (KeyError, TypeError):
+        return False
+
+    if not entries or len(trees) != 1:
+        return False
+    if not all(os.path.isfile(project_root / d / MANIFEST_FILE) for d in output_dirs):
+        return False
+    return head_tree(project_root) in trees
+
+
+def _git(project_root: Path, *args: str) -> subprocess.CompletedProcess | None:
+    try:
+        return subprocess.run(
+            ["git", "--no-optional-locks", "-C", str(project_root), *args],
+            capture_output=True, text=True,
+        )
+    except OSError:
+        return None
+
+
+def _record_path(project_root: Path) -> Path:
+    return get_cache_dir(project_root) / TREE_FILE
+
+
+def _read_record(project_root: Path) -> dict | None:
+    """The record, or None if there is none or another aictrl wrote it."""
+    try:
+        with open(_record_path(project_root)) as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict) or record.get("aictrl") != __version__:
+        return None
+    if not isinstance(record.get("targets"), dict):
+        return None
+    return record
+
+
+def _write_record(project_root: Path, record: dict) -> bool:
+    from .cache import ensure_cache_dir
+
+    path = _record_path(project_root)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        ensure_cache_dir(path.parent)
+        with open(tmp_path, "w") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        return False
+    return True
@@ -0,0 +1,117 @@
+"""Canonical content hashing for skills.
+
+Values are fed to the hash as a type-tagged, length-prefixed stream:
+dict keys are sorted, so equal data always hashes equally regardless
+of YAML formatting or key order, and nothing is serialized to an
+intermediate string. Content files with a `source` contribute the
+bytes of the referenced file, read in chunks.
+"""
+
+import datetime
+import hashlib
+import struct
+from pathlib import Path
+from typing import Any
+
+from .loader import SKILL_FIELDS, SkillData
+
+
+HASH_ALGORITHM = "blake2b-256"
+CHUNK_SIZE = 1024 * 1024
+
+_LEN = struct.Struct("<Q")
+
+
+def new_hasher():
+    return hashlib.blake2b(digest_size=32)
+
+
+def compute_skill_hash(skill: SkillData, data_dir: Path | None = None) -> str:
+    """Hash every field of a skill.
+
+    With `data_dir` (.aictrl/data/), external content files are hashed
+    by content; without it only their source path is hashed.
+    """
+    h = new_hasher()
+    for name in SKILL_FIELDS:
+        _feed(h, name)
+        if name == "content_files":
+            _feed_content_files(h, skill.content_files, data_dir)
+        else:
+            _feed(h, getattr(skill, name))
+    return h.hexdigest()
+
+
+def compute_skill_hashes(skills: list[SkillData], data_dir: Path | None = None) -> dict[str, str]:
+    """Hash each skill once; pass the result around instead of rehashing."""
+    return {skill.slug: compute_skill_hash(skill, data_dir) for skill in skills}
+
+
+def hash_value(value: Any) -> str:
+    """Canonical hash of any YAML-like value."""
+    h = new_hasher()
+    _feed(h, value)
+    return h.hexdigest()
+
+
+def _feed_content_files(h, content_files: dict, data_dir: Path | None) -> None:
+    h.update(b"d" + _LEN.pack(len(content_files)))
+    for file_path in sorted(content_files):
+        _feed(h, file_path)
+        value = content_files[file_path]
+        if isinstance(value, dict) and data_dir is not None:
+            _feed(h, value.get("source"))
+            _feed_file(h, data_dir / value["source"])
+        else:
+            _feed(h, value)
+
+
+def _feed_file(h, path: Path) -> None:
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        h.update(b"?")
+        return
+    with f:
+        h.update(b"c")
+        while chunk := f.read(CHUNK_SIZE):
+            h.update(_LEN.pack(len(chunk)))
+            h.update(chunk)
+        h.update(_LEN.pack(0))
+
+
+def _feed(h, value: Any) -> None:
+    """Feed a YAML-like value to h. Iterative, so nesting depth is unbounded."""
+    stack = [value]
+    while stack:
+        v = stack.pop()
+        if v is None:
+            h.update(b"n")
+        elif v is True or v is False:
+            h.update(b"T" if v else b"F")
+        elif isinstance(v, str):
+            data = v.encode()
+            h.update(b"s" + _LEN.pack(len(data)))
+            h.update(data)
+        elif isinstance(v, int):
+            data = str(v).encode()
+            h.update(b"i" + _LEN.pack(len(data)) + data)
+        elif isinstance(v, float):
+            data = repr(v).encode()
+            h.update(b"f" + _LEN.pack(len(data)) + data)
+        elif isinstance(v, (datetime.date, datetime.datetime)):
+            data = v.isoformat().encode()
+            h.update(b"t" + _LEN.pack(len(data)) + data)
+        elif isinstance(v, bytes):
+            h.update(b"b" + _LEN.pack(len(v)))
+            h.update(v)
+        elif isinstance(v, (list, tuple)):
+            h.update(b"l" + _LEN.pack(len(v)))
+            stack.extend(reversed(v))
+        elif isinstance(v, dict):
+            h.update(b"d" + _LEN.pack(len(v)))
+            for key, item in sorted(v.items(), key=lambda kv: (type(kv[0]).__name__, str(kv[0])), reverse=True):
+                stack.append(item)
+                stack.append(key)
+        else:
+            raise TypeError(f"Cannot hash value of type {type(v).__name__}")
@@ -1,13 +1,18 @@
-from pathlib import Path
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
+from pathlib import Path, PurePosixPath
+from typing import Any
 
-import yaml
+from .cache import Fingerprint, ParseCache, read_yaml
+from .config import get_pack_path, get_skills_dir
+from .parallel import pool_map
 
-from .config import get_skills_dir
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SkillData:
+    """A parsed skill. Instances are shared, never mutated: derive new ones
+    with dataclasses.replace() (see merger.merge_overrides)."""
+
     slug: str
     name: str
     description: str
@@ -18,46 +23,227 @@ class SkillData:
     allowed_tools: list[str] = field(default_factory=list)
     metadata: dict[str, str] = field(default_factory=dict)
     file_structure: dict | None = None
-    content_files: dict[str, str] = field(default_factory=dict)
+    content_files: dict[str, str | dict[str, str]] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Shallow field dict for templates and merging.
+
+        Unlike dataclasses.asdict this copies nothing below the top
+        level; nested values are shared with the skill.
+        """
+        return {name: getattr(self, name) for name in SKILL_FIELDS}
+
+
+SKILL_FIELDS = tuple(f.name for f in fields(SkillData))
+
+
+class SkillLoadError(ValueError):
+    """One or more skill files could not be loaded.
+
+    `errors` holds a (path, message) pair for every file that failed.
+    """
+
+    def __init__(self, errors: list[tuple[Path, str]]):
+        self.errors = errors
+        super().__init__("\n".join(message for _, message in errors))
+
+
+def load_skills(
+    project_root: Path,
+    jobs: int | None = None,
+    cache: ParseCache | None = None,
+) -> list[SkillData]:
+    """Load all skills from .aictrl/data/skills/ and .aictrl/data/skills.pack.
 
+    Loose files are returned sorted by filename. When a pack exists its
+    members are added, loose files win over pack members with the same
+    slug, and the combined list is sorted by slug.
 
-def load_skills(project_root: Path) -> list[SkillData]:
+    Files not served by `cache` are parsed in a process pool when `jobs`
+    allows it (see `parallel.resolve_jobs`). Every file is attempted;
+    failures are collected and raised together as a SkillLoadError.
+    """
+    return [skill for _, skill in load_skill_sources(project_root, jobs, cache)]
+
+
+def load_skill_sources(
+    project_root: Path,
+    jobs: int | None = None,
+    cache: ParseCache | None = None,
+) -> list[tuple[Path, SkillData]]:
+    """Like load_skills, but pair each skill with the file it came from
+    (the YAML file, or skills.pack for pack members)."""
     skills_dir = get_skills_dir(project_root)
-    if not skills_dir.exists():
-        return []
+    yaml_files = sorted(skills_dir.glob("*.yaml")) if skills_dir.exists() else []
+    sources, errors = _load_skill_files(yaml_files, jobs, cache)
+
+    pack_path = get_pack_path(project_root)
+    if pack_path.exists():
+        from .pack import load_pack_skills
+
+        loose_slugs = {s.slug for _, s in sources}
+        packed, pack_errors = load_pack_skills(pack_path, exclude=loose_slugs, jobs=jobs, cache=cache)
+        sources = sorted(sources + [(pack_path, s) for s in packed], key=lambda item: item[1].slug)
+        errors.extend(pack_errors)
+
+    if errors:
+        raise SkillLoadError(errors)
+
+    return sources
+
+
+def load_skill_files(
+    yaml_files: list[Path],
+    jobs: int | None = None,
+    cache: ParseCache | None = None,
+) -> list[SkillData]:
+    """Load the given skill files in order, raising SkillLoadError on any failure."""
+    sources, errors = _load_skill_files(yaml_files, jobs, cache)
+    if errors:
+        raise SkillLoadError(errors)
+    return [skill for _, skill in sources]
+
+
+def _load_skill_files(
+    yaml_files: list[Path],
+    jobs: int | None,
+    cache: ParseCache | None,
+) -> tuple[list[tuple[Path, SkillData]], list[tuple[Path, str]]]:
+    documents: dict[Path, Any] = {}
+    if cache is not None:
+        for yaml_file in yaml_files:
+            hit, document = cache.get(yaml_file)
+            if hit:
+                documents[yaml_file] = document
+
+    misses = [p for p in yaml_files if p not in documents]
+    errors: dict[Path, str] = {}
+    for yaml_file, (document, fingerprint, error) in zip(misses, pool_map(_try_read_yaml, misses, jobs=jobs)):
+        if error is not None:
+            errors[yaml_file] = error
+            continue
+        documents[yaml_file] = document
+        if cache is not None:
+            cache.put(yaml_file, fingerprint, document)
 
-    skills = []
-    for yaml_file in sorted(skills_dir.glob("*.yaml")):
-        skill = _parse_skill_yaml(yaml_file)
-        skills.append(skill)
+    sources = []
+    for yaml_file in yaml_files:
+        if yaml_file in errors:
+            continue
+        try:
+            sources.append((yaml_file, skill_from_document(documents[yaml_file], yaml_file)))
+        except ValueError as e:
+            errors[yaml_file] = str(e)
 
-    return skills
+    return sources, [(p, errors[p]) for p in yaml_files if p in errors]
 
 
 def load_skill(yaml_path: Path) -> SkillData:
     return _parse_skill_yaml(yaml_path)
 
 
+def _try_read_yaml(yaml_path: Path) -> tuple[Any, Fingerprint | None, str | None]:
+    import yaml
+
+    try:
+        document, fingerprint = read_yaml(yaml_path)
+    except (OSError, yaml.YAMLError) as e:
+        return None, None, f"{yaml_path}: {e}"
+    return document, fingerprint, None
+
+
 def _parse_skill_yaml(yaml_path: Path) -> SkillData:
+    import yaml
+
     with open(yaml_path) as f:
         data = yaml.safe_load(f)
+    return skill_from_document(data, yaml_path)
+
 
+def skill_from_document(data: Any, yaml_path: Path) -> SkillData:
+    """Build a SkillData from a parsed skill document; `yaml_path` names
+    it in errors. Raises ValueError for an invalid document."""
     if not data:
         raise ValueError(f"Empty skill file: {yaml_path}")
 
+    if not isinstance(data, dict):
+        raise ValueError(f"Skill file must contain a mapping: {yaml_path}")
+
     if "slug" not in data:
         raise ValueError(f"Skill file missing 'slug': {yaml_path}")
 
+    check_content_files(data.get("content_files"), yaml_path)
+
     return SkillData(
         slug=data["slug"],
         name=data.get("name", data["slug"]),
         description=data.get("description", ""),
         version=data.get("version", "0.0.0"),
         instructions=data.get("instructions", ""),
-        sections=data.get("sections", {}),
-        tags=data.get("tags", []),
-        allowed_tools=data.get("allowed_tools", []),
-        metadata=data.get("metadata", {}),
+        sections=_intern_keys(data.get("sections", {})),
+        tags=_intern_list(data.get("tags", [])),
+        allowed_tools=_intern_list(data.get("allowed_tools", [])),
+        metadata=_intern_mapping(data.get("metadata", {})),
         file_structure=data.get("file_structure"),
         content_files=data.get("content_files", {}),
     )
+
+
+# Tags, tool names and metadata keys repeat across most skills in a
+# catalog; interning stores each distinct string once.
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_list(values: Any) -> Any:
+    if not isinstance(values, list):
+        return values
+    return [_intern(v) for v in values]
+
+
+def _intern_keys(mapping: Any) -> Any:
+    if not isinstance(mapping, dict):
+        return mapping
+    return {_intern(k): v for k, v in mapping.items()}
+
+
+def _intern_mapping(mapping: Any) -> Any:
+    if not isinstance(mapping, dict):
+        return mapping
+    return {_intern(k): _intern(v) for k, v in mapping.items()}
+
+
+def check_content_files(content_files: Any, origin: Path | str) -> None:
+    """Validate a skill's content_files; `origin` names the file(s) they came from.
+
+    Raises ValueError unless each entry maps a relative output path to
+    inline text or to {source: path under .aictrl/data/}.
+    """
+    if content_files is None:
+        return
+    if not isinstance(content_files, dict):
+        raise ValueError(f"content_files must be a mapping: {origin}")
+    for file_path, file_content in content_files.items():
+        _check_content_file(file_path, file_content, origin)
+
+
+def _check_content_file(file_path: Any, file_content: Any, yaml_path: Path | str) -> None:
+    """Validate a content_files entry: inline text or {source: path under .aictrl/data/}."""
+    output_path = PurePosixPath(str(file_path))
+    if not isinstance(file_path, str) or output_path.is_absolute() or ".." in output_path.parts:
+        raise ValueError(f"content_files[{file_path!r}] must be a path inside the skill's directory: {yaml_path}")
+    if isinstance(file_content, str):
+        return
+
+    source = file_content.get("source") if isinstance(file_content, dict) else None
+    if not isinstance(source, str):
+        raise ValueError(
+            f"content_files[{file_path!r}] must be a string or a mapping with 'source': {yaml_path}"
+        )
+
+    source_path = PurePosixPath(source)
+    if source_path.is_absolute() or ".." in source_path.parts:
+        raise ValueError(
+            f"content_files[{file_path!r}] source must be relative to .aictrl/data/: {yaml_path}"
+        )
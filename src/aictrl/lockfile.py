@@ -1,13 +1,18 @@
 import hashlib
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
-
-from .config import get_lock_path
+from .config import get_data_dir, get_lock_path
+from .hashing import HASH_ALGORITHM, compute_skill_hash, compute_skill_hashes  # noqa: F401
 from .loader import SkillData
 
 
+LOCK_VERSION = 2
+# Version 1 lockfiles hashed yaml.dump(sort_keys=True) output with SHA-256
+# and left out content_files and file_structure.
+LEGACY_HASH_ALGORITHM = "sha256-yaml"
+
+
 @dataclass
 class LockEntry:
     slug: str
@@ -19,10 +24,13 @@ class LockEntry:
 class LockFile:
     version: int
     skills: list[LockEntry]
+    hash_algorithm: str = HASH_ALGORITHM
 
 
-def compute_skill_hash(skill: SkillData) -> str:
-    """Compute SHA256 hash of a skill's serialized YAML content."""
+def legacy_skill_hash(skill: SkillData) -> str:
+    """Compute the version 1 lockfile hash of a skill."""
+    import yaml
+
     data = {
         "slug": skill.slug,
         "name": skill.name,
@@ -39,10 +47,18 @@ def compute_skill_hash(skill: SkillData) -> str:
 
 
 def read_lockfile(project_root: Path) -> LockFile | None:
+    """Read skills.lock, accepting both version 1 and version 2 files.
+
+    Version 1 files come back with hash_algorithm set to
+    LEGACY_HASH_ALGORITHM so is_stale can still compare them; the next
+    write_lockfile upgrades them to version 2.
+    """
     lock_path = get_lock_path(project_root)
     if not lock_path.exists():
         return None
 
+    import yaml
+
     with open(lock_path) as f:
         data = yaml.safe_load(f)
 
@@ -57,28 +73,48 @@ def read_lockfile(project_root: Path) -> LockFile | None:
             content_hash=entry["content_hash"],
         ))
 
-    return LockFile(version=data.get("version", 1), skills=entries)
+    version = data.get("version", 1)
+    if version == 1:
+        algorithm = LEGACY_HASH_ALGORITHM
+    else:
+        algorithm = data.get("hash_algorithm", HASH_ALGORITHM)
 
+    return LockFile(version=version, skills=entries, hash_algorithm=algorithm)
 
-def write_lockfile(project_root: Path, skills: list[SkillData]) -> None:
+
+def write_lockfile(
+    project_root: Path,
+    skills: list[SkillData],
+    hashes: dict[str, str] | None = None,
+) -> None:
+    """Write skills.lock. Pass `hashes` from compute_skill_hashes to avoid rehashing."""
     lock_path = get_lock_path(project_root)
     lock_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if hashes is None:
+        hashes = compute_skill_hashes(skills, get_data_dir(project_root))
+
     entries = []
     for skill in sorted(skills, key=lambda s: s.slug):
         entries.append({
             "slug": skill.slug,
             "version": skill.version,
-            "content_hash": compute_skill_hash(skill),
+            "content_hash": hashes[skill.slug],
         })
 
-    data = {"version": 1, "skills": entries}
+    data = {"version": LOCK_VERSION, "hash_algorithm": HASH_ALGORITHM, "skills": entries}
+
+    import yaml
 
     with open(lock_path, "w") as f:
         yaml.dump(data, f, default_flow_style=False, sort_keys=False)
 
 
-def is_stale(project_root: Path, skills: list[SkillData]) -> bool:
+def is_stale(
+    project_root: Path,
+    skills: list[SkillData],
+    hashes: dict[str, str] | None = None,
+) -> bool:
     """Check if the lockfile is stale (skills have changed since last build)."""
     lock = read_lockfile(project_root)
     if lock is None:
@@ -91,13 +127,20 @@ def is_stale(project_root: Path, skills: list[SkillData]) -> bool:
     if current_slugs != lock_slugs:
         return True
 
+    if lock.hash_algorithm == LEGACY_HASH_ALGORITHM:
+        hashes = {s.slug: legacy_skill_hash(s) for s in skills}
+    elif lock.hash_algorithm != HASH_ALGORITHM:
+        return True
+    elif hashes is None:
+        hashes = compute_skill_hashes(skills, get_data_dir(project_root))
+
     for skill in skills:
         entry = lock_map.get(skill.slug)
         if entry is None:
             return True
         if entry.version != skill.version:
             return True
-        if entry.content_hash != compute_skill_hash(skill):
+        if entry.content_hash != hashes[skill.slug]:
             return True
 
     return False
@@ -0,0 +1,204 @@
+"""Build manifests: what a build wrote, for drift checks and pruning.
+
+Each target directory gets a `.aictrl-manifest.json` listing every
+output file the build produced under it with its size, BLAKE2b hash
+and executable flag. Keeping the manifest inside the target directory
+means it always describes the tree it sits in.
+
+Manifests written by incremental builds (see build.py) also record the
+render unit each file came from, each file's mtime and inode as written,
+and, per unit, the digest of the inputs it was rendered from.
+"""
+
+import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+from .config import get_data_dir
+from .hashing import CHUNK_SIZE, HASH_ALGORITHM, new_hasher
+from .targets.base import OutputFile
+
+
+MANIFEST_FILE = ".aictrl-manifest.json"
+MANIFEST_FORMAT = 2
+# Format 1 manifests have no render units; they still verify.
+READABLE_FORMATS = (1, 2)
+
+
+@dataclass
+class ManifestEntry:
+    size: int
+    hash: str
+    executable: bool = False
+    unit: str | None = None
+    mtime_ns: int | None = None
+    inode: int | None = None
+
+
+@dataclass
+class UnitRecord:
+    key: str
+    inputs: dict
+
+
+@dataclass
+class Manifest:
+    files: dict[str, ManifestEntry] = field(default_factory=dict)
+    units: dict[str, UnitRecord] = field(default_factory=dict)
+
+
+@dataclass
+class VerifyResult:
+    checked: int = 0
+    modified: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.modified and not self.missing
+
+
+def output_dir_of(path: str) -> str:
+    """The target directory an output path belongs to (its first component)."""
+    return PurePosixPath(path).parts[0]
+
+
+def manifest_path(project_root: Path, output_dir: str) -> Path:
+    return project_root / output_dir / MANIFEST_FILE
+
+
+def entry_for(f: OutputFile, project_root: Path, unit: str | None = None) -> ManifestEntry:
+    """Manifest entry for an output file as it will be written."""
+    if f.source is not None:
+        source = get_data_dir(project_root) / f.source
+        size, digest = hash_file(source)
+        executable = bool(os.stat(source).st_mode & 0o111)
+        return ManifestEntry(size=size, hash=digest, executable=executable, unit=unit)
+
+    data = f.content.encode()
+    h = new_hasher()
+    h.update(data)
+    return ManifestEntry(size=len(data), hash=h.hexdigest(), executable=f.executable, unit=unit)
+
+
+def hash_file(path: Path) -> tuple[int, str]:
+    """Return (size, hash) of a file, hashing through mmap so no copy is made."""
+    h = new_hasher()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    h.update(mm)
+            except (OSError, ValueError):
+                f.seek(0)
+                while chunk := f.read(CHUNK_SIZE):
+                    h.update(chunk)
+    return size, h.hexdigest()
+
+
+def build_manifests(files: list[OutputFile], project_root: Path) -> dict[str, dict[str, ManifestEntry]]:
+    """Group manifest entries for files by target directory."""
+    manifests: dict[str, dict[str, ManifestEntry]] = {}
+    for f in files:
+        manifests.setdefault(output_dir_of(f.path), {})[f.path] = entry_for(f, project_root)
+    return manifests
+
+
+def write_manifest(project_root: Path, output_dir: str, manifest: Manifest) -> bool:
+    """Write a target's manifest. Returns False if it was already current."""
+    files = {}
+    for path, e in sorted(manifest.files.items()):
+        files[path] = {"size": e.size, "hash": e.hash, "executable": e.executable}
+        if e.unit is not None:
+            files[path]["unit"] = e.unit
+        if e.mtime_ns is not None:
+            files[path]["mtime_ns"] = e.mtime_ns
+            files[path]["inode"] = e.inode
+    data = {
+        "format": MANIFEST_FORMAT,
+        "hash_algorithm": HASH_ALGORITHM,
+        "files": files,
+        "units": {
+            unit_id: {"key": u.key, "inputs": u.inputs}
+            for unit_id, u in sorted(manifest.units.items())
+        },
+    }
+    encoded = (json.dumps(data, indent=1) + "\n").encode()
+    path = manifest_path(project_root, output_dir)
+    try:
+        if path.read_bytes() == encoded:
+            return False
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(encoded)
+    os.replace(tmp_path, path)
+    return True
+
+
+def read_manifest(project_root: Path, output_dir: str) -> Manifest | None:
+    try:
+        with open(manifest_path(project_root, output_dir)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("format") not in READABLE_FORMATS:
+        return None
+    if data.get("hash_algorithm") != HASH_ALGORITHM:
+        return None
+
+    return Manifest(
+        files={path: ManifestEntry(**entry) for path, entry in data["files"].items()},
+        units={unit_id: UnitRecord(**u) for unit_id, u in data.get("units", {}).items()},
+    )
+
+
+def verify_outputs(
+    project_root: Path,
+    manifests: dict[str, dict[str, ManifestEntry]],
+    jobs: int | None = None,
+) -> VerifyResult:
+    """Compare files on disk with their manifest entries.
+
+    Sizes and modes are checked first; only same-size files are hashed,
+    in a thread pool (hashlib releases the GIL on large buffers).
+    """
+    result = VerifyResult()
+    to_hash: list[tuple[str, ManifestEntry]] = []
+
+    for entries in manifests.values():
+        for path, entry in entries.items():
+            result.checked += 1
+            try:
+                st = os.stat(project_root / path)
+            except FileNotFoundError:
+                result.missing.append(path)
+                continue
+            if st.st_size != entry.size or bool(st.st_mode & 0o111) != entry.executable:
+                result.modified.append(path)
+                continue
+            to_hash.append((path, entry))
+
+    def matches(item: tuple[str, ManifestEntry]) -> bool:
+        path, entry = item
+        try:
+            return hash_file(project_root / path) == (entry.size, entry.hash)
+        except OSError:
+            return False
+
+    workers = jobs if jobs and jobs > 0 else min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for (path, _), ok in zip(to_hash, pool.map(matches, to_hash)):
+            if not ok:
+                result.modified.append(path)
+
+    result.modified.sort()
+    result.missing.sort()
+    return result
@@ -0,0 +1,110 @@
+import errno
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# ioctl request number for FICLONE on Linux (_IOW(0x94, 9, int)).
+FICLONE = 0x40049409
+
+COPY_CHUNK = 1024 * 1024
+
+_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EPERM,
+    errno.EBADF,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+}
+
+
+def materialize_file(src: Path, dst: Path, hardlink: bool = False) -> str:
+    """Create dst with the contents of src without reading it into Python memory.
+
+    Strategies, in order: hardlink (only when `hardlink` is set, since
+    edits to the output would then edit the source), reflink, in-kernel
+    copy_file_range, streamed copy. Any existing dst is replaced, never
+    written through. Executable bits are carried over from src.
+    Returns the name of the strategy used.
+    """
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+
+    if hardlink:
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED and e.errno != errno.EMLINK:
+                raise
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        method = _clone(fsrc, fdst) or _copy_range(fsrc, fdst)
+        if method is None:
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, COPY_CHUNK)
+            method = "stream"
+
+    if os.stat(src).st_mode & 0o111:
+        dst.chmod(0o755)
+    return method
+
+
+def same_file_contents(src: Path, dst: Path) -> bool:
+    """True if dst exists with the same size, bytes and executable bits as src."""
+    try:
+        st_src, st_dst = os.stat(src), os.stat(dst)
+    except FileNotFoundError:
+        return False
+    if st_src.st_size != st_dst.st_size:
+        return False
+    if bool(st_src.st_mode & 0o111) != bool(st_dst.st_mode & 0o111):
+        return False
+    if (st_src.st_dev, st_src.st_ino) == (st_dst.st_dev, st_dst.st_ino):
+        return True
+
+    with open(src, "rb") as fsrc, open(dst, "rb") as fdst:
+        while True:
+            a = fsrc.read(COPY_CHUNK)
+            if a != fdst.read(COPY_CHUNK):
+                return False
+            if not a:
+                return True
+
+
+def _clone(fsrc, fdst) -> str | None:
+    if sys.platform != "linux":
+        return None
+    try:
+        import fcntl
+
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except OSError as e:
+        if e.errno in _UNSUPPORTED:
+            return None
+        raise
+    return "reflink"
+
+
+def _copy_range(fsrc, fdst) -> str | None:
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return None
+
+    size = os.fstat(fsrc.fileno()).st_size
+    copied = 0
+    try:
+        while copied < size:
+            n = copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+            if n == 0:
+                break
+            copied += n
+    except OSError as e:
+        if e.errno in _UNSUPPORTED and copied == 0:
+            return None
+        raise
+    return "copy_file_range"
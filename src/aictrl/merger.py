@@ -1,11 +1,9 @@
-from copy import deepcopy
-from dataclasses import asdict
 from pathlib import Path
 
-import yaml
-
+from .cache import ParseCache, read_yaml
 from .config import get_overrides_dir
-from .loader import SkillData
+from .loader import SKILL_FIELDS, SkillData, check_content_files
+from .skill_index import SELECT_KEY, Selector, SkillIndex, parse_selector
 
 
 def deep_merge(base: dict, override: dict) -> dict:
@@ -16,63 +14,154 @@ def deep_merge(base: dict, override: dict) -> dict:
     - Lists: override replaces base (not appended)
     - Dicts: deep merge (override keys win)
     - Special key `_delete` with a list of keys removes those keys from result
+
+    The merge is copy-on-write: only dicts on a path the override touches
+    are copied, everything else is shared with `base` or `override`.
+    Neither input is mutated, but the result must be treated as
+    read-only. Nesting is walked iteratively, so depth is unbounded.
     """
-    result = deepcopy(base)
+    result = dict(base)
+    stack = [(result, override)]
+
+    while stack:
+        target, changes = stack.pop()
+        for key, value in changes.items():
+            if key == "_delete":
+                if isinstance(value, list):
+                    for k in value:
+                        target.pop(k, None)
+                continue
+
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                copied = dict(current)
+                target[key] = copied
+                stack.append((copied, value))
+            else:
+                target[key] = value
 
-    for key, value in override.items():
-        if key == "_delete":
-            if isinstance(value, list):
-                for k in value:
-                    result.pop(k, None)
-            continue
+    return result
 
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = deepcopy(value)
 
-    return result
+def load_overrides(project_root: Path, cache: ParseCache | None = None) -> dict[str, dict]:
+    """Load all per-skill override files from .aictrl/overrides/skills/.
+
+    Returns a dict mapping skill slug (the file stem) to override data.
+    Selector overrides (files with a `_select` key) are not included;
+    see load_selector_overrides. Files whose fingerprint matches an
+    entry in `cache` are not re-parsed.
+    """
+    by_slug, _ = _split_overrides(_load_override_files(project_root, cache))
+    return {slug: data for slug, (_, data) in by_slug.items()}
 
 
-def load_overrides(project_root: Path) -> dict[str, dict]:
-    """Load all override files from .aictrl/overrides/skills/.
+def load_selector_overrides(
+    project_root: Path,
+    cache: ParseCache | None = None,
+) -> list[tuple[Selector, dict]]:
+    """Load override files that target skills by `_select` rather than filename.
 
-    Returns a dict mapping skill slug to override data.
+    Returns (selector, override data without `_select`) pairs in filename order.
     """
+    _, selector_overrides = _split_overrides(_load_override_files(project_root, cache))
+    return [(selector, body) for _, selector, body in selector_overrides]
+
+
+def _split_overrides(
+    override_files: list[tuple[Path, dict]],
+) -> tuple[dict[str, tuple[Path, dict]], list[tuple[Path, Selector, dict]]]:
+    by_slug = {}
+    selector_overrides = []
+    for path, data in override_files:
+        if SELECT_KEY in data:
+            body = {k: v for k, v in data.items() if k != SELECT_KEY}
+            selector_overrides.append((path, parse_selector(data[SELECT_KEY], path), body))
+        else:
+            by_slug[path.stem] = (path, data)
+    return by_slug, selector_overrides
+
+
+def _load_override_files(project_root: Path, cache: ParseCache | None) -> list[tuple[Path, dict]]:
     overrides_dir = get_overrides_dir(project_root)
     if not overrides_dir.exists():
-        return {}
+        return []
 
-    overrides = {}
+    loaded = []
     for yaml_file in sorted(overrides_dir.glob("*.yaml")):
-        slug = yaml_file.stem
-        with open(yaml_file) as f:
-            data = yaml.safe_load(f)
-        if data:
-            overrides[slug] = data
+        hit, data = cache.get(yaml_file) if cache is not None else (False, None)
+        if not hit:
+            data, fingerprint = read_yaml(yaml_file)
+            if cache is not None:
+                cache.put(yaml_file, fingerprint, data)
+        if not data:
+            continue
+        if not isinstance(data, dict):
+            raise ValueError(f"Override file must contain a mapping: {yaml_file}")
+        loaded.append((yaml_file, data))
 
-    return overrides
+    return loaded
 
 
-def merge_overrides(skills: list[SkillData], project_root: Path) -> list[SkillData]:
+def merge_overrides(
+    skills: list[SkillData],
+    project_root: Path,
+    cache: ParseCache | None = None,
+) -> list[SkillData]:
     """Apply overrides to skill data.
 
     Loads override files from .aictrl/overrides/skills/ and deep-merges
-    matching overrides onto each skill's data.
+    them onto matching skills: first every selector override that
+    matches the skill (in filename order), then the override named
+    after the skill's slug, so the most specific override wins. Raises
+    ValueError for an override that is not a mapping or sets a field
+    SkillData does not have, or if the merged content_files are invalid
+    (see loader.check_content_files).
     """
-    overrides = load_overrides(project_root)
-    if not overrides:
-        return skills
+    merged, _ = merge_overrides_with_sources(skills, project_root, cache)
+    return merged
+
+
+def merge_overrides_with_sources(
+    skills: list[SkillData],
+    project_root: Path,
+    cache: ParseCache | None = None,
+) -> tuple[list[SkillData], dict[str, list[Path]]]:
+    """Like merge_overrides, but also return the override files applied
+    to each skill slug, in the order they were merged."""
+    by_slug, selector_overrides = _split_overrides(_load_override_files(project_root, cache))
+    if not by_slug and not selector_overrides:
+        return skills, {}
+
+    selected: dict[int, list[tuple[Path, dict]]] = {}
+    if selector_overrides:
+        index = SkillIndex(skills)
+        for path, selector, body in selector_overrides:
+            for i in index.resolve(selector):
+                selected.setdefault(i, []).append((path, body))
 
     merged = []
-    for skill in skills:
-        override = overrides.get(skill.slug)
-        if override is None:
+    applied: dict[str, list[Path]] = {}
+    for i, skill in enumerate(skills):
+        layers = selected.get(i, [])
+        override = by_slug.get(skill.slug)
+        if override is not None:
+            layers = [*layers, override]
+        if not layers:
             merged.append(skill)
             continue
 
-        skill_dict = asdict(skill)
-        merged_dict = deep_merge(skill_dict, override)
-        merged.append(SkillData(**merged_dict))
-
-    return merged
+        # as_dict() is shallow and deep_merge copy-on-write, so the new
+        # skill shares every value the overrides do not touch.
+        skill_dict = skill.as_dict()
+        for path, layer in layers:
+            unknown = set(layer) - set(SKILL_FIELDS)
+            if unknown:
+                raise ValueError(f"Unknown skill fields {sorted(map(str, unknown))}: {path}")
+            skill_dict = deep_merge(skill_dict, layer)
+        # Overrides can add or rewrite content_files: validate what the
+        # build will actually read and write.
+        check_content_files(skill_dict.get("content_files"), ", ".join(str(path) for path, _ in layers))
+        merged.append(SkillData(**skill_dict))
+        applied[skill.slug] = [path for path, _ in layers]
+
+    return merged, applied
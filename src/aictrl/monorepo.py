@@ -0,0 +1,149 @@
+"""Building and checking every aictrl project under a directory.
+
+Projects are found by their .aictrl/config.yaml. In a git work tree
+the search goes through `git ls-files`, so directories .gitignore
+excludes (node_modules, build output, ...) are never walked; elsewhere
+the tree is walked, skipping hidden directories.
+
+Projects are processed in one process pool, one project per task, and
+each project is built serially inside its worker. A worker keeps the
+template environment of every project it builds (see
+renderer._init_render_worker), and the bundled templates are loaded
+precompiled, so nothing is compiled per project.
+"""
+
+import os
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .build import build_project
+from .cache import ParseCache
+from .config import AICTRL_DIR, CONFIG_FILE, load_config, load_org
+from .fingerprints import check_stale
+from .loader import SkillLoadError
+from .parallel import pool_map
+
+
+# Directories never searched when walking without git.
+SKIP_DIRS = {"node_modules", "__pycache__"}
+
+
+@dataclass
+class ProjectResult:
+    project: Path
+    ok: bool = True
+    stale: bool = False       # check: the build is out of date
+    skills: int = 0
+    files: int = 0
+    written: int = 0
+    pruned: int = 0
+    error: str | None = None
+    details: list[str] | None = None   # per-file load errors
+    seconds: float = 0.0
+
+
+def find_projects(root: Path) -> list[Path]:
+    """Every directory under `root` (including itself) with a .aictrl/config.yaml, sorted."""
+    configs = _git_configs(root)
+    if configs is None:
+        configs = _walk_configs(root)
+    return sorted({(root / rel).parent.parent for rel in configs if (root / rel).is_file()})
+
+
+def _git_configs(root: Path) -> list[str] | None:
+    """Config files git knows of (tracked, or untracked and not ignored),
+    or None when `root` is not in a git work tree."""
+    try:
+        proc = subprocess.run(
+            [
+                "git", "-C", str(root), "ls-files", "-z", "--cached", "--others", "--exclude-standard",
+                "--", f":(glob)**/{AICTRL_DIR}/{CONFIG_FILE}",
+            ],
+            capture_output=True,
+        )
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        return None
+    return [os.fsdecode(path) for path in proc.stdout.split(b"\0") if path]
+
+
+def _walk_configs(root: Path) -> list[str]:
+    configs = []
+    for dirpath, dirnames, _ in os.walk(root):
+        if os.path.isfile(os.path.join(dirpath, AICTRL_DIR, CONFIG_FILE)):
+            configs.append(os.path.relpath(os.path.join(dirpath, AICTRL_DIR, CONFIG_FILE), root))
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS]
+    return configs
+
+
+def build_projects(
+    projects: list[Path],
+    target_names: list[str] | None = None,
+    jobs: int | None = None,
+    full: bool = False,
+    use_cache: bool = True,
+) -> list[ProjectResult]:
+    """Build each project in a process pool (all cores unless `jobs` says otherwise)."""
+    tasks = [(project, target_names, full, use_cache) for project in projects]
+    return pool_map(_build_project, tasks, jobs=_project_jobs(jobs))
+
+
+def check_projects(projects: list[Path], jobs: int | None = None, use_cache: bool = True) -> list[ProjectResult]:
+    """Check each project for staleness in a process pool."""
+    tasks = [(project, use_cache) for project in projects]
+    return pool_map(_check_project, tasks, jobs=_project_jobs(jobs))
+
+
+def _project_jobs(jobs: int | None) -> int:
+    # A project is a lot of work, so unlike skills even a few are worth a pool.
+    return 0 if jobs is None else jobs
+
+
+def _build_project(task: tuple[Path, list[str] | None, bool, bool]) -> ProjectResult:
+    project, target_names, full, use_cache = task
+    start = time.perf_counter()
+    try:
+        cache = ParseCache.open(project) if use_cache else None
+        result = build_project(
+            project, load_config(project), load_org(project),
+            target_names=target_names, jobs=1, cache=cache, full=full,
+        )
+    except Exception as e:  # bad YAML, a broken template, ...: fail this project, not the run
+        return _failed(project, e, start)
+    return ProjectResult(
+        project=project,
+        skills=len(result.skills),
+        files=result.files,
+        written=result.written,
+        pruned=result.pruned,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _check_project(task: tuple[Path, bool]) -> ProjectResult:
+    project, use_cache = task
+    start = time.perf_counter()
+    try:
+        cache = ParseCache.open(project) if use_cache else None
+        stale = check_stale(project, jobs=1, cache=cache)
+        if cache is not None:
+            cache.save()
+    except Exception as e:  # as in _build_project
+        return _failed(project, e, start)
+    return ProjectResult(project=project, stale=stale, seconds=time.perf_counter() - start)
+
+
+def _failed(project: Path, error: Exception, start: float) -> ProjectResult:
+    if isinstance(error, SkillLoadError):
+        message = f"{len(error.errors)} skill file(s) failed to load"
+        details = [m for _, m in error.errors]
+    elif isinstance(error, (ValueError, OSError)):
+        message, details = str(error), None
+    else:
+        message, details = f"{type(error).__name__}: {error}", None
+    return ProjectResult(
+        project=project, ok=False, error=message, details=details, seconds=time.perf_counter() - start,
+    )
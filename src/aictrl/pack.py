@@ -0,0 +1,236 @@
+"""Packed skill archive: many skill YAML files in one indexed file.
+
+Layout (integers little-endian):
+
+    header   8s magic, u32 format, u32 reserved, u64 index offset, u64 index length
+    members  raw skill YAML bytes, back to back
+    index    UTF-8 JSON: {"skills": [{"slug", "file", "offset", "length", "digest"}, ...]}
+
+Members are stored byte-for-byte, so unpacking restores the original
+files exactly. The index is sorted by slug and records a content digest
+per member, letting readers skip (or serve from cache) members that
+have not changed without touching their bytes.
+"""
+
+import json
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from .cache import ParseCache, content_digest
+from .config import get_pack_path, get_skills_dir
+from .loader import SkillData, load_skill_files, skill_from_document
+from .parallel import pool_map
+
+
+MAGIC = b"AICTRLPK"
+PACK_FORMAT = 1
+HEADER = struct.Struct("<8sIIQQ")
+
+
+@dataclass
+class PackEntry:
+    slug: str
+    file: str
+    offset: int
+    length: int
+    digest: str
+
+
+class SkillPack:
+    """Read-only, memory-mapped view of a skill pack."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"Not a skill pack: {path}")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, fmt, _, index_offset, index_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a skill pack: {path}")
+        if fmt != PACK_FORMAT:
+            self.close()
+            raise ValueError(f"Unsupported skill pack format {fmt}: {path}")
+
+        index = json.loads(self._map[index_offset:index_offset + index_length])
+        self.entries: dict[str, PackEntry] = {
+            e["slug"]: PackEntry(**e) for e in index["skills"]
+        }
+
+    def __enter__(self) -> "SkillPack":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    @property
+    def slugs(self) -> list[str]:
+        return list(self.entries)
+
+    def read_bytes(self, slug: str) -> bytes:
+        entry = self.entries[slug]
+        return self._map[entry.offset:entry.offset + entry.length]
+
+    def load(self, slug: str) -> SkillData:
+        """Parse a single member by slug without touching the rest of the pack."""
+        return skill_from_document(yaml.safe_load(self.read_bytes(slug)), self.member_label(slug))
+
+    def member_label(self, slug: str) -> Path:
+        """Path-like label for a member, used in error messages."""
+        return Path(f"{self.path}#{self.entries[slug].file}")
+
+
+def write_pack(pack_path: Path, members: list[tuple[str, str, bytes]]) -> int:
+    """Write (slug, filename, raw YAML) members to pack_path atomically. Returns member count."""
+    members = sorted(members, key=lambda m: m[0])
+    index = []
+    offset = HEADER.size
+    for slug, file, raw in members:
+        index.append({
+            "slug": slug,
+            "file": file,
+            "offset": offset,
+            "length": len(raw),
+            "digest": content_digest(raw),
+        })
+        offset += len(raw)
+
+    index_bytes = json.dumps({"skills": index}, sort_keys=True).encode()
+    tmp_path = pack_path.with_name(f"{pack_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, PACK_FORMAT, 0, offset, len(index_bytes)))
+        for _, _, raw in members:
+            f.write(raw)
+        f.write(index_bytes)
+    os.replace(tmp_path, pack_path)
+    return len(members)
+
+
+def load_pack_skills(
+    pack_path: Path,
+    exclude: set[str] = frozenset(),
+    jobs: int | None = None,
+    cache: ParseCache | None = None,
+) -> tuple[list[SkillData], list[tuple[Path, str]]]:
+    """Load every pack member not in `exclude`, in slug order.
+
+    Members whose indexed digest is in `cache` are served without
+    reading their bytes. Returns (skills, errors) like the loose-file
+    loader so callers can report all failures together.
+    """
+    with SkillPack(pack_path) as pack:
+        slugs = [slug for slug in pack.entries if slug not in exclude]
+        pack_key = cache.key(pack_path) if cache is not None else str(pack_path)
+
+        documents = {}
+        if cache is not None:
+            for slug in slugs:
+                hit, document = cache.get_by_digest(f"{pack_key}#{slug}", pack.entries[slug].digest)
+                if hit:
+                    documents[slug] = document
+
+        misses = [slug for slug in slugs if slug not in documents]
+        work = [(str(pack.member_label(slug)), pack.read_bytes(slug)) for slug in misses]
+
+    errors: dict[str, str] = {}
+    for slug, (document, error) in zip(misses, pool_map(_try_parse_member, work, jobs=jobs)):
+        if error is not None:
+            errors[slug] = error
+            continue
+        documents[slug] = document
+        if cache is not None:
+            entry = pack.entries[slug]
+            cache.put_by_digest(f"{pack_key}#{slug}", entry.digest, entry.length, document)
+
+    skills = []
+    for slug in slugs:
+        if slug in errors:
+            continue
+        try:
+            skills.append(skill_from_document(documents[slug], pack.member_label(slug)))
+        except ValueError as e:
+            errors[slug] = str(e)
+
+    return skills, [(pack_path, errors[slug]) for slug in slugs if slug in errors]
+
+
+def _try_parse_member(member: tuple[str, bytes]):
+    label, raw = member
+    try:
+        return yaml.safe_load(raw), None
+    except yaml.YAMLError as e:
+        return None, f"{label}: {e}"
+
+
+def pack_skills(project_root: Path, remove_sources: bool = True) -> int:
+    """Pack .aictrl/data/skills/*.yaml into .aictrl/data/skills.pack. Returns member count.
+
+    Members already in an existing pack are kept unless a loose file
+    with the same slug replaces them. Loose files are validated first;
+    a SkillLoadError leaves everything untouched.
+    """
+    skills_dir = get_skills_dir(project_root)
+    pack_path = get_pack_path(project_root)
+
+    yaml_files = sorted(skills_dir.glob("*.yaml")) if skills_dir.exists() else []
+    skills = load_skill_files(yaml_files)
+
+    members: dict[str, tuple[str, str, bytes]] = {}
+    if pack_path.exists():
+        with SkillPack(pack_path) as pack:
+            for slug, entry in pack.entries.items():
+                members[slug] = (slug, entry.file, pack.read_bytes(slug))
+
+    for yaml_file, skill in zip(yaml_files, skills):
+        members[skill.slug] = (skill.slug, yaml_file.name, yaml_file.read_bytes())
+
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    count = write_pack(pack_path, list(members.values()))
+
+    if remove_sources:
+        for yaml_file in yaml_files:
+            yaml_file.unlink()
+    return count
+
+
+def unpack_skills(project_root: Path, keep_pack: bool = False) -> int:
+    """Extract every pack member back into .aictrl/data/skills/. Returns member count.
+
+    Loose files that already exist take precedence over the pack and
+    are left alone.
+    """
+    pack_path = get_pack_path(project_root)
+    skills_dir = get_skills_dir(project_root)
+    skills_dir.mkdir(parents=True, exist_ok=True)
+
+    count = 0
+    with SkillPack(pack_path) as pack:
+        for slug, entry in pack.entries.items():
+            if Path(entry.file).name != entry.file:
+                raise ValueError(f"Invalid member file name {entry.file!r} in {pack_path}")
+            out_path = skills_dir / entry.file
+            if not out_path.exists():
+                out_path.write_bytes(pack.read_bytes(slug))
+            count += 1
+
+    if not keep_pack:
+        pack_path.unlink()
+    return count
@@ -0,0 +1,55 @@
+import os
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Below this many work items a process pool costs more to start than it saves.
+PARALLEL_THRESHOLD = 64
+
+
+def resolve_jobs(jobs: int | None, n_items: int) -> int:
+    """Resolve a requested worker count into an effective one.
+
+    - None: automatic (all cores when there is enough work, else serial)
+    - 0 or negative: all cores
+    - N: at most N workers
+    """
+    cpus = os.cpu_count() or 1
+    if jobs is None:
+        effective = cpus if n_items >= PARALLEL_THRESHOLD else 1
+    elif jobs <= 0:
+        effective = cpus
+    else:
+        effective = jobs
+    return max(1, min(effective, n_items))
+
+
+def pool_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    jobs: int | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> list[R]:
+    """Map fn over items, in a process pool when worthwhile.
+
+    Results are returned in input order regardless of completion order.
+    fn must be a picklable module-level function. `initializer` sets up
+    per-worker state; when the map runs serially it is called once in
+    this process instead.
+    """
+    items = list(items)
+    workers = resolve_jobs(jobs, len(items))
+    if workers <= 1:
+        if initializer is not None and items:
+            initializer(*initargs)
+        return [fn(item) for item in items]
+
+    # Imported here: it pulls in multiprocessing, which serial callers
+    # (and CLI startup) should not pay for.
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize))
@@ -0,0 +1,104 @@
+"""Precompiled copies of the bundled templates.
+
+The bundled templates are compiled to Python modules ahead of time and
+shipped in aictrl/templates_compiled/, so builds load them with
+jinja2.ModuleLoader instead of lexing and compiling them on every run.
+index.json records the Jinja version they were compiled with, the
+environment options, and each template's source digest and the
+templates it references (what build.TemplateDigests needs, without the
+source).
+
+After editing anything under aictrl/templates/, regenerate with:
+
+    python -m aictrl.precompile
+
+The test suite fails while the compiled copy is stale.
+"""
+
+import functools
+import json
+import shutil
+from pathlib import Path
+
+import jinja2
+from jinja2 import Environment, PackageLoader, meta
+
+from .hashing import new_hasher
+
+
+COMPILED_DIR = Path(__file__).parent / "templates_compiled"
+INDEX_FILE = "index.json"
+INDEX_FORMAT = 1
+
+# Options every template environment is created with; compiled code
+# depends on them.
+ENV_OPTIONS = {
+    "keep_trailing_newline": True,
+    "trim_blocks": True,
+    "lstrip_blocks": True,
+}
+
+
+def source_digest(source: str) -> str:
+    h = new_hasher()
+    h.update(source.encode())
+    return h.hexdigest()
+
+
+def bundled_source_env() -> Environment:
+    return Environment(loader=PackageLoader("aictrl", "templates"), **ENV_OPTIONS)
+
+
+def build_index(env: Environment) -> dict:
+    templates = {}
+    for name in env.list_templates(extensions=["j2"]):
+        source, _, _ = env.loader.get_source(env, name)
+        references = meta.find_referenced_templates(env.parse(source))
+        templates[name] = {
+            "digest": source_digest(source),
+            "references": sorted(references, key=lambda ref: (ref is None, ref or "")),
+        }
+    return {
+        "format": INDEX_FORMAT,
+        "jinja": jinja2.__version__,
+        "options": ENV_OPTIONS,
+        "templates": templates,
+    }
+
+
+def compile_bundled(dest: Path = COMPILED_DIR) -> int:
+    """Compile every bundled template into `dest`. Returns the template count."""
+    env = bundled_source_env()
+    if dest.exists():
+        shutil.rmtree(dest)
+    dest.mkdir(parents=True)
+    env.compile_templates(str(dest), extensions=["j2"], zip=None, ignore_errors=False)
+
+    index = build_index(env)
+    with open(dest / INDEX_FILE, "w") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+        f.write("\n")
+    return len(index["templates"])
+
+
+@functools.lru_cache(maxsize=1)
+def compiled_index() -> dict | None:
+    """The index of the shipped compiled templates, or None if they are
+    missing or were compiled for another Jinja release or other options."""
+    try:
+        with open(COMPILED_DIR / INDEX_FILE) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if index.get("format") != INDEX_FORMAT or index.get("options") != ENV_OPTIONS:
+        return None
+    # Generated code calls into jinja2.runtime, which is stable within a
+    # minor release.
+    if index.get("jinja", "").split(".")[:2] != jinja2.__version__.split(".")[:2]:
+        return None
+    return index
+
+
+if __name__ == "__main__":
+    print(f"Compiled {compile_bundled()} templates into {COMPILED_DIR}")
@@ -0,0 +1,163 @@
+"""Build profiling: timed spans, a summary, and Chrome trace export.
+
+A Profiler records spans (name, start, duration, process, thread) for
+each build phase, its steps, and each unit a render worker renders.
+Render workers in other processes profile into their own Profiler and
+send the spans back with their results. Timestamps come from
+time.perf_counter_ns(), which is CLOCK_MONOTONIC on Linux and so
+comparable across processes.
+
+With `memory=True`, tracemalloc also records the peak Python memory
+reached during each top-level span in this process. Render workers are
+not traced.
+
+Code that is not profiling uses NULL_PROFILER. Its span() returns a
+shared no-op context manager, so instrumented code costs almost nothing
+when profiling is off.
+
+write_trace() saves the Chrome trace event format, which
+chrome://tracing and https://ui.perfetto.dev open.
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class Span:
+    name: str
+    start_ns: int
+    duration_ns: int
+    pid: int
+    tid: int
+    parents: tuple[str, ...] = ()  # names of the enclosing spans, outermost first
+    args: dict = field(default_factory=dict)
+
+
+@dataclass
+class SpanSummary:
+    name: str
+    depth: int = 0  # nesting level, 0 for phases
+    calls: int = 0
+    total_ns: int = 0
+    peak_bytes: int | None = None
+
+
+class Profiler:
+    enabled = True
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.spans: list[Span] = []
+        self.peak_bytes: int | None = None
+        self._open: list[str] = []
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> "Profiler":
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.memory and tracemalloc.is_tracing():
+            self.peak_bytes = max(self.peak_bytes or 0, tracemalloc.get_traced_memory()[1])
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    @contextmanager
+    def span(self, name: str, **args):
+        """Time the enclosed block as one span."""
+        parents = tuple(self._open)
+        # Nested spans would reset the enclosing span's peak, so only
+        # top-level spans measure memory.
+        track_memory = self.memory and not parents and tracemalloc.is_tracing()
+        if track_memory:
+            peak_so_far = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+        self._open.append(name)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - start
+            self._open.pop()
+            if track_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                args["peak_bytes"] = peak
+                self.peak_bytes = max(peak, peak_so_far, self.peak_bytes or 0)
+            self.spans.append(Span(
+                name=name, start_ns=start, duration_ns=duration,
+                pid=os.getpid(), tid=threading.get_native_id(), parents=parents, args=args,
+            ))
+
+    def extend(self, spans: list[Span]) -> None:
+        """Add spans recorded elsewhere (a render worker) under the spans open here."""
+        for s in spans:
+            s.parents = (*self._open, *s.parents)
+            self.spans.append(s)
+
+    def summary(self) -> list[SpanSummary]:
+        """Spans grouped by name and enclosing spans, in order of first
+        appearance, durations summed (render spans from parallel workers
+        can add up to more than the wall time of their phase)."""
+        by_path: dict[tuple[str, ...], SpanSummary] = {}
+        for s in sorted(self.spans, key=lambda s: s.start_ns):
+            path = (*s.parents, s.name)
+            entry = by_path.setdefault(path, SpanSummary(name=s.name, depth=len(s.parents)))
+            entry.calls += 1
+            entry.total_ns += s.duration_ns
+            if "peak_bytes" in s.args:
+                entry.peak_bytes = max(entry.peak_bytes or 0, s.args["peak_bytes"])
+        # Parents start before their children, so they come first.
+        return list(by_path.values())
+
+    def chrome_trace(self) -> dict:
+        origin = min((s.start_ns for s in self.spans), default=0)
+        events = [
+            {
+                "name": s.name,
+                "cat": "aictrl",
+                "ph": "X",
+                "ts": (s.start_ns - origin) / 1000,
+                "dur": s.duration_ns / 1000,
+                "pid": s.pid,
+                "tid": s.tid,
+                "args": s.args,
+            }
+            for s in self.spans
+        ]
+        main_pid = os.getpid()
+        for pid in sorted({s.pid for s in self.spans}):
+            name = "aictrl" if pid == main_pid else f"render worker {pid}"
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}})
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if self.peak_bytes is not None:
+            trace["otherData"] = {"peak_bytes": self.peak_bytes}
+        return trace
+
+    def write_trace(self, path: Path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+            f.write("\n")
+
+
+class _NullProfiler:
+    enabled = False
+    _span = nullcontext()
+
+    def span(self, name: str, **args):
+        return self._span
+
+    def extend(self, spans: list[Span]) -> None:
+        pass
+
+
+NULL_PROFILER = _NullProfiler()
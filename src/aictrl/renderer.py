@@ -1,42 +1,78 @@
+import os
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 
-from jinja2 import Environment, FileSystemLoader, PackageLoader, ChoiceLoader
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    PackageLoader,
+)
 
-from .config import AictrlConfig, OrgData, AICTRL_DIR
+from .config import (
+    AictrlConfig,
+    OrgData,
+    get_data_dir,
+    get_templates_dir,
+)
 from .loader import SkillData
-from .targets.base import OutputFile, BuildTarget
-from .targets.claude import ClaudeTarget
-from .targets.cursor import CursorTarget
+from .manifest import Manifest, build_manifests, write_manifest
+from .materialize import materialize_file, same_file_contents
+from .parallel import pool_map
+from .precompile import COMPILED_DIR, ENV_OPTIONS, compiled_index
+from .profiling import NULL_PROFILER, Profiler
+from .targets import TARGETS
+from .targets.base import OutputFile, BuildTarget, render_skill_document
 
 
-TARGETS: dict[str, type[BuildTarget]] = {
-    "claude": ClaudeTarget,
-    "cursor": CursorTarget,
-}
-
-
-def create_templates_env(project_root: Path) -> Environment:
+def create_templates_env(project_root: Path, bytecode_cache: bool = True) -> Environment:
     """Create Jinja2 environment with template loaders.
 
     Looks for templates in:
     1. .aictrl/templates/ (project-local overrides, checked first)
-    2. Bundled package templates (fallback)
+    2. Bundled package templates (fallback), loaded precompiled when
+       the shipped copy matches this Jinja release (see precompile.py)
+
+    Templates compiled from source are kept in Jinja's per-user bytecode
+    cache in the temp dir, keyed by source checksum, unless
+    `bytecode_cache` is False.
     """
     loaders = []
 
-    local_templates = project_root / AICTRL_DIR / "templates"
+    local_templates = get_templates_dir(project_root)
     if local_templates.exists():
         loaders.append(FileSystemLoader(str(local_templates)))
 
-    loaders.append(PackageLoader("aictrl", "templates"))
+    precompiled = compiled_index() is not None
+    if precompiled:
+        loaders.append(ModuleLoader(str(COMPILED_DIR)))
+    else:
+        loaders.append(PackageLoader("aictrl", "templates"))
+
+    cache = None
+    if bytecode_cache and (local_templates.exists() or not precompiled):
+        cache = _bytecode_cache()
+
+    return Environment(loader=ChoiceLoader(loaders), bytecode_cache=cache, **ENV_OPTIONS)
 
-    return Environment(
-        loader=ChoiceLoader(loaders),
-        keep_trailing_newline=True,
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
+
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    # Not under .aictrl/.cache/: bytecode is loaded as code, and the
+    # working tree holds whatever a checkout brings. Jinja's default
+    # directory is private to the user; it checks the owner and mode.
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+def get_target(name: str) -> BuildTarget:
+    target_cls = TARGETS.get(name)
+    if target_cls is None:
+        raise ValueError(f"Unknown target: {name}. Available: {list(TARGETS.keys())}")
+    return target_cls()
 
 
 def render_all(
@@ -45,35 +81,177 @@ def render_all(
     org: OrgData,
     project_root: Path,
     target_names: list[str] | None = None,
+    jobs: int | None = None,
 ) -> list[OutputFile]:
-    """Render all output files for the specified targets."""
-    env = create_templates_env(project_root)
+    """Render all output files for the specified targets.
 
-    targets_to_build = target_names or config.targets
-    org_dict = asdict(org)
+    Output is ordered by target, then skill, then the target's shared
+    files, whether or not rendering ran in parallel (see render_items).
+    """
+    targets = tuple(get_target(name).name for name in (target_names or config.targets))
+    items = [(skill, targets) for skill in skills] + [(None, targets)]
+    rendered = render_items(items, org, project_root, jobs=jobs)
 
     all_files: list[OutputFile] = []
-    for target_name in targets_to_build:
-        target_cls = TARGETS.get(target_name)
-        if target_cls is None:
-            raise ValueError(f"Unknown target: {target_name}. Available: {list(TARGETS.keys())}")
+    for target_name in targets:
+        for by_target in rendered:
+            all_files.extend(by_target[target_name])
+    return all_files
 
-        target = target_cls()
-        skill_dicts = [asdict(s) for s in skills]
-        files = target.render(skill_dicts, org_dict, env)
-        all_files.extend(files)
 
-    return all_files
+# A render work item: a skill, or None for the shared (org-level) output,
+# and the names of the targets to render it for.
+RenderItem = tuple[SkillData | None, tuple[str, ...]]
+
+
+def render_items(
+    items: list[RenderItem],
+    org: OrgData,
+    project_root: Path,
+    jobs: int | None = None,
+    profiler=NULL_PROFILER,
+) -> list[dict[str, list[OutputFile]]]:
+    """Render work items, returning the files per target for each, in order.
+
+    Items are spread over a process pool when `jobs` allows it (see
+    parallel.resolve_jobs). Each worker builds its template environment
+    once and renders every target for the skills it is handed, so a
+    skill is sent to exactly one process. With a `profiler`, workers
+    time each render and their spans are added to it.
+    """
+    initargs = (project_root, asdict(org))
+    if not profiler.enabled:
+        return pool_map(_render_item, items, jobs=jobs, initializer=_init_render_worker, initargs=initargs)
+
+    results = []
+    for by_target, spans in pool_map(
+        _render_item_profiled, items, jobs=jobs, initializer=_init_render_worker, initargs=initargs,
+    ):
+        profiler.extend(spans)
+        results.append(by_target)
+    return results
+
+
+_worker_env: Environment | None = None
+_worker_envs: dict[Path, tuple[bool, Environment]] = {}
+_worker_org: dict | None = None
+_worker_targets: dict[str, BuildTarget] = {}
 
 
-def write_output_files(files: list[OutputFile], project_root: Path) -> int:
-    """Write rendered output files to disk. Returns count of files written."""
-    count = 0
+def _init_render_worker(project_root: Path, org_dict: dict) -> None:
+    global _worker_env, _worker_org
+    # Serial renders run in this process, so a long-running caller (see
+    # watch.BuildSession and daemon.py) keeps each project's compiled
+    # templates between builds; Jinja's auto_reload still picks up
+    # edited project templates.
+    has_local = get_templates_dir(project_root).exists()
+    cached = _worker_envs.get(project_root)
+    if cached is None or cached[0] != has_local:
+        cached = _worker_envs[project_root] = (has_local, create_templates_env(project_root))
+    _worker_env = cached[1]
+    _worker_org = org_dict
+    _worker_targets.clear()
+
+
+def _render_item(item: RenderItem, profiler=NULL_PROFILER) -> dict[str, list[OutputFile]]:
+    skill, target_names = item
+    # The skill body is rendered once and wrapped by each target.
+    doc = None
+    if skill is not None:
+        with profiler.span("render skill body", skill=skill.slug):
+            doc = render_skill_document(skill.as_dict(), _worker_org, _worker_env)
+    by_target = {}
+    for name in target_names:
+        target = _worker_targets.get(name)
+        if target is None:
+            target = _worker_targets[name] = get_target(name)
+        if doc is None:
+            with profiler.span(f"render {name} shared", templates=list(target.shared_templates)):
+                by_target[name] = target.render_shared(_worker_org, _worker_env)
+        else:
+            with profiler.span(f"render {name} skill", skill=skill.slug, templates=list(target.skill_templates)):
+                by_target[name] = target.render_skill(doc, _worker_org, _worker_env)
+    return by_target
+
+
+def _render_item_profiled(item: RenderItem) -> tuple[dict[str, list[OutputFile]], list]:
+    profiler = Profiler()
+    return _render_item(item, profiler), profiler.spans
+
+
+@dataclass
+class WriteStats:
+    written: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.written + self.unchanged
+
+
+def write_output_files(files: list[OutputFile], project_root: Path) -> WriteStats:
+    """Write rendered output files to disk, skipping files already up to date.
+
+    Each target directory gets a manifest of the output (see manifest.py).
+    """
+    stats = write_files(files, project_root)
+    for output_dir, entries in build_manifests(files, project_root).items():
+        write_manifest(project_root, output_dir, Manifest(files=entries))
+    return stats
+
+
+def write_files(
+    files: list[OutputFile],
+    project_root: Path,
+    dest_root: Path | None = None,
+) -> WriteStats:
+    """Write output files without touching manifests.
+
+    Files are written under `dest_root` (default: project_root); a
+    staging directory passes its own root. A file whose size, bytes and
+    executable bit already match is left alone, so its mtime only moves
+    when its content does. Changed files are replaced rather than
+    written through, so a hardlinked copy elsewhere keeps its content.
+    Files with a `source` are materialized from .aictrl/data/ without
+    passing through Python memory (see materialize_file).
+    """
+    data_dir = get_data_dir(project_root)
+    dest_root = dest_root or project_root
+    stats = WriteStats()
     for f in files:
-        out_path = project_root / f.path
+        out_path = dest_root / f.path
+        if f.source is not None:
+            source_path = data_dir / f.source
+            if not source_path.is_file():
+                raise FileNotFoundError(f"Content file source not found: {source_path}")
+            if same_file_contents(source_path, out_path):
+                stats.unchanged += 1
+                continue
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            materialize_file(source_path, out_path)
+            stats.written += 1
+            continue
+
+        data = f.content.encode()
+        if _is_current(out_path, data, f.executable):
+            stats.unchanged += 1
+            continue
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(f.content)
+        out_path.unlink(missing_ok=True)
+        out_path.write_bytes(data)
         if f.executable:
             out_path.chmod(0o755)
-        count += 1
-    return count
+        stats.written += 1
+    return stats
+
+
+def _is_current(path: Path, data: bytes, executable: bool) -> bool:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    if st.st_size != len(data):
+        return False
+    if bool(st.st_mode & 0o111) != executable:
+        return False
+    return path.read_bytes() == data
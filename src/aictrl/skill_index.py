@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from .loader import SkillData
+
+
+SELECT_KEY = "_select"
+GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass
+class Selector:
+    """Which skills an override applies to.
+
+    Each list matches if any of its values matches; all non-empty lists
+    must match. A selector with no criteria matches every skill.
+    """
+
+    tags: list[str] = field(default_factory=list)
+    slugs: list[str] = field(default_factory=list)  # exact slugs or fnmatch globs
+    metadata: dict[str, list[str]] = field(default_factory=dict)
+
+
+def parse_selector(data: object, source: Path) -> Selector:
+    if data is None:
+        return Selector()
+    if not isinstance(data, dict):
+        raise ValueError(f"'{SELECT_KEY}' must be a mapping: {source}")
+
+    unknown = set(data) - {"tags", "slugs", "metadata"}
+    if unknown:
+        raise ValueError(f"Unknown '{SELECT_KEY}' keys {sorted(unknown)}: {source}")
+
+    metadata = data.get("metadata") or {}
+    if not isinstance(metadata, dict):
+        raise ValueError(f"'{SELECT_KEY}.metadata' must be a mapping: {source}")
+
+    return Selector(
+        tags=[str(t) for t in _as_list(data.get("tags"))],
+        slugs=[str(s) for s in _as_list(data.get("slugs"))],
+        metadata={str(k): [str(v) for v in _as_list(values)] for k, values in metadata.items()},
+    )
+
+
+def _as_list(value: object) -> list:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+class SkillIndex:
+    """Tag, slug and metadata lookup tables over a list of skills.
+
+    Built once per merge so each selector resolves through set
+    operations instead of testing every skill against every selector.
+    Metadata values are indexed per comma-separated item, so
+    `stack: "api,ui"` matches a selector for `stack: api`.
+    """
+
+    def __init__(self, skills: list[SkillData]):
+        self.size = len(skills)
+        self.slugs = [s.slug for s in skills]
+        self.by_slug: dict[str, set[int]] = {}
+        self.by_tag: dict[str, set[int]] = {}
+        self.by_metadata: dict[tuple[str, str], set[int]] = {}
+
+        for i, skill in enumerate(skills):
+            self.by_slug.setdefault(skill.slug, set()).add(i)
+            for tag in skill.tags:
+                self.by_tag.setdefault(tag, set()).add(i)
+            for key, value in skill.metadata.items():
+                for item in str(value).split(","):
+                    self.by_metadata.setdefault((key, item.strip()), set()).add(i)
+
+    def resolve(self, selector: Selector) -> set[int]:
+        """Return the positions of the skills matched by selector."""
+        matched: set[int] | None = None
+
+        def narrow(candidates: set[int]) -> None:
+            nonlocal matched
+            matched = candidates if matched is None else matched & candidates
+
+        if selector.tags:
+            narrow(set().union(*(self.by_tag.get(t, ()) for t in selector.tags)))
+
+        if selector.slugs:
+            narrow(set().union(*(self._match_slug(p) for p in selector.slugs)))
+
+        for key, values in selector.metadata.items():
+            narrow(set().union(*(self.by_metadata.get((key, v), ()) for v in values)))
+
+        return set(range(self.size)) if matched is None else matched
+
+    def _match_slug(self, pattern: str) -> set[int]:
+        if GLOB_CHARS.isdisjoint(pattern):
+            return self.by_slug.get(pattern, set())
+        return {i for i, slug in enumerate(self.slugs) if fnmatchcase(slug, pattern)}
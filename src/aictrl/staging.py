@@ -0,0 +1,220 @@
+"""Staged output: build a target directory aside, then swap it in.
+
+A stage starts as a hardlink clone of the live target directory, so
+files the build does not touch cost a directory entry rather than a
+copy, and files it does not own (user settings, hand-written rules)
+carry over. Output files are always replaced, never written through
+(see renderer.write_files), so writing into the stage cannot reach the
+live tree through a shared inode.
+
+Files are only ever replaced in the live directory too, by whoever
+writes there: an assistant saving settings.local.json mid-build creates
+a new inode. So before publishing, live files whose inode is not the
+one the stage was cloned from are carried into the stage, and files
+deleted meanwhile are deleted from it, unless the build itself wrote or
+removed that path. Only a change landing between that pass and the swap
+can still be lost.
+
+Publishing exchanges the two directories with renameat2(RENAME_EXCHANGE)
+where the kernel and filesystem support it, otherwise with two renames.
+Either way readers see the old tree or the new one, never a mix. A
+build that dies leaves only its stage behind; the next build deletes
+it, first moving the previous tree back if the process died between
+the two renames.
+"""
+
+import ctypes
+import errno
+import os
+import shutil
+import stat
+import sys
+from pathlib import Path
+
+from .cache import ensure_cache_dir
+from .config import get_cache_dir
+
+
+STAGE_DIR = "stage"
+LIVE_FILE = "live"   # records the directory a stage publishes to
+OLD_TREE = "old"     # previous tree, between the two fallback renames
+
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
+_renameat2 = None
+
+
+class OutputStage:
+    """A staged copy of one target directory.
+
+    Use as a context manager: write under `root` (it mirrors the project
+    layout, so `root / output_dir` is the staged target directory), call
+    publish() to swap it in, and the stage is removed on exit either way.
+    """
+
+    def __init__(self, project_root: Path, output_dir: str):
+        self.output_dir = output_dir
+        # Publish through a symlinked target directory, not over it.
+        self.live = Path(os.path.realpath(project_root / output_dir))
+        self.base = _stage_base(project_root, self.live)
+        self.dir = self.base / f"{os.getpid()}-{self.live.name}"
+        self.root = self.dir / "root"
+        self.tree = self.root / output_dir
+        # Relative path -> (live inode, staged inode) of each cloned file.
+        self.cloned: dict[str, tuple[int, int]] = {}
+
+    def __enter__(self) -> "OutputStage":
+        recover_stages(self.base)
+        self.dir.mkdir(parents=True)
+        try:
+            (self.dir / LIVE_FILE).write_text(str(self.live))
+            if self.live.is_dir():
+                shutil.copytree(self.live, self.tree, symlinks=True, copy_function=self._clone)
+            else:
+                self.tree.mkdir(parents=True)
+        except BaseException:
+            shutil.rmtree(self.dir, ignore_errors=True)
+            raise
+        return self
+
+    def __exit__(self, *exc) -> None:
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def publish(self) -> None:
+        """Atomically replace the live directory with the staged tree,
+        after carrying over what changed in it since the stage was cloned."""
+        if not self.live.exists():
+            self.live.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(self.tree, self.live)
+            return
+        self._carry_over()
+        if _exchange(self.tree, self.live):
+            return
+        old = self.dir / OLD_TREE
+        os.rename(self.live, old)
+        os.rename(self.tree, self.live)
+
+    def _clone(self, src: str, dst: str) -> None:
+        _link_or_copy(src, dst)
+        rel = os.path.relpath(src, self.live)
+        self.cloned[rel] = (os.lstat(src).st_ino, os.lstat(dst).st_ino)
+
+    def _carry_over(self) -> None:
+        """Bring live files created, replaced or deleted during the build
+        into the stage, where the build left the path alone."""
+        seen = set()
+        for dirpath, dirnames, filenames in os.walk(self.live):
+            for name in [*dirnames, *filenames]:
+                live_path = os.path.join(dirpath, name)
+                rel = os.path.relpath(live_path, self.live)
+                try:
+                    st = os.lstat(live_path)
+                except FileNotFoundError:
+                    continue
+                if stat.S_ISDIR(st.st_mode):
+                    continue
+                seen.add(rel)
+                cloned = self.cloned.get(rel)
+                if cloned is not None and cloned[0] == st.st_ino:
+                    continue
+                staged = self.tree / rel
+                staged_ino = _inode(staged)
+                if staged_ino != (cloned[1] if cloned is not None else None):
+                    continue  # the build wrote or removed it: the build wins
+                if staged_ino is not None:
+                    staged.unlink()
+                staged.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    if stat.S_ISLNK(st.st_mode):
+                        os.symlink(os.readlink(live_path), staged)
+                    else:
+                        _link_or_copy(live_path, os.fspath(staged))
+                except FileNotFoundError:
+                    pass  # gone again already
+        for rel, (_, staged_ino) in self.cloned.items():
+            staged = self.tree / rel
+            if rel not in seen and _inode(staged) == staged_ino:
+                staged.unlink()
+
+
+def recover_stages(base: Path) -> None:
+    """Remove stages left by builds that are no longer running.
+
+    A build that died between the two fallback renames left the live
+    directory missing and the previous tree in its stage; that tree is
+    moved back first.
+    """
+    if not base.is_dir():
+        return
+    for stage_dir in base.iterdir():
+        pid, _, _ = stage_dir.name.partition("-")
+        if not stage_dir.is_dir() or not pid.isdigit() or _pid_alive(int(pid)):
+            continue
+        try:
+            live = Path((stage_dir / LIVE_FILE).read_text())
+        except OSError:
+            live = None
+        old = stage_dir / OLD_TREE
+        if live is not None and not live.exists() and old.is_dir():
+            os.rename(old, live)
+        shutil.rmtree(stage_dir, ignore_errors=True)
+
+
+def _stage_base(project_root: Path, live: Path) -> Path:
+    """Where to stage: the cache directory, unless it is on another
+    filesystem than the target directory, in which case beside it."""
+    base = ensure_cache_dir(get_cache_dir(project_root)) / STAGE_DIR
+    try:
+        same_device = os.stat(base.parent).st_dev == os.stat(live.parent).st_dev
+    except FileNotFoundError:
+        same_device = True
+    if same_device:
+        return base
+    return live.parent / f".{live.name}.aictrl-stage"
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _inode(path: Path) -> int | None:
+    try:
+        return os.lstat(path).st_ino
+    except FileNotFoundError:
+        return None
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _exchange(a: Path, b: Path) -> bool:
+    """Swap two paths with renameat2(RENAME_EXCHANGE); False if unsupported."""
+    global _renameat2
+    if sys.platform != "linux":
+        return False
+    if _renameat2 is None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        _renameat2 = getattr(libc, "renameat2", False)
+        if _renameat2:
+            _renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    if not _renameat2:
+        return False
+
+    if _renameat2(_AT_FDCWD, os.fsencode(a), _AT_FDCWD, os.fsencode(b), _RENAME_EXCHANGE) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP):
+        return False
+    raise OSError(err, os.strerror(err), str(b))
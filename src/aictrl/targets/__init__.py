@@ -0,0 +1,9 @@
+from .base import BuildTarget
+from .claude import ClaudeTarget
+from .cursor import CursorTarget
+
+
+TARGETS: dict[str, type[BuildTarget]] = {
+    "claude": ClaudeTarget,
+    "cursor": CursorTarget,
+}
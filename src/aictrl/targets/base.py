@@ -8,12 +8,56 @@ class OutputFile:
     path: str      # relative path from project root
     content: str
     executable: bool = False
+    source: str | None = None  # copy from this path relative to .aictrl/data/ instead of content
+
+
+# Renders a skill's markdown body: its instructions and sections.
+BODY_TEMPLATE = "skill/body.md.j2"
+
+
+@dataclass(frozen=True)
+class SkillDocument:
+    """A skill rendered once per build and shared by every target.
+
+    Targets wrap `body` in their own front matter and file layout
+    instead of rendering the skill's content again.
+    """
+
+    skill: dict  # SkillData.as_dict()
+    body: str
+
+
+def render_skill_document(skill: dict, org: dict, templates_env: Any) -> SkillDocument:
+    body = templates_env.get_template(BODY_TEMPLATE).render(skill=skill, org=org)
+    return SkillDocument(skill=skill, body=body)
 
 
 class BuildTarget(ABC):
+    """A tool-specific output format.
+
+    Output is produced in units: one per skill (render_skill) plus one
+    for files that depend only on the org (render_shared). The template
+    names each unit uses are declared so incremental builds can tell
+    when a unit's output is out of date.
+    """
+
     name: str
     output_dir: str
+    skill_templates: tuple[str, ...] = ()
+    shared_templates: tuple[str, ...] = ()
 
     @abstractmethod
-    def render(self, skills: list[dict], org: dict, templates_env: Any) -> list[OutputFile]:
+    def render_skill(self, doc: SkillDocument, org: dict, templates_env: Any) -> list[OutputFile]:
+        ...
+
+    @abstractmethod
+    def render_shared(self, org: dict, templates_env: Any) -> list[OutputFile]:
         ...
+
+    def render(self, skills: list[dict], org: dict, templates_env: Any) -> list[OutputFile]:
+        files: list[OutputFile] = []
+        for skill in skills:
+            doc = render_skill_document(skill, org, templates_env)
+            files.extend(self.render_skill(doc, org, templates_env))
+        files.extend(self.render_shared(org, templates_env))
+        return files
@@ -1,27 +1,40 @@
-from jinja2 import Environment
+from typing import TYPE_CHECKING
 
-from .base import BuildTarget, OutputFile
+from .base import BODY_TEMPLATE, BuildTarget, OutputFile, SkillDocument
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
 
 class ClaudeTarget(BuildTarget):
     name = "claude"
     output_dir = ".claude"
+    skill_templates = ("claude/skill.md.j2", BODY_TEMPLATE)
+    shared_templates = ("claude/settings.json.j2", "claude/telemetry.sh.j2")
 
-    def render(self, skills: list[dict], org: dict, templates_env: Environment) -> list[OutputFile]:
+    def render_skill(self, doc: SkillDocument, org: dict, templates_env: "Environment") -> list[OutputFile]:
         files: list[OutputFile] = []
+        skill = doc.skill
 
-        # Render each skill as a markdown file
+        # Wrap the shared body in Claude's front matter
         skill_template = templates_env.get_template("claude/skill.md.j2")
-        for skill in skills:
-            content = skill_template.render(skill=skill, org=org)
-            path = f".claude/skills/{skill['slug']}/{skill['slug']}.md"
-            files.append(OutputFile(path=path, content=content))
-
-            # Write content_files if present
-            for file_path, file_content in skill.get("content_files", {}).items():
-                full_path = f".claude/skills/{skill['slug']}/{file_path}"
+        content = skill_template.render(skill=skill, body=doc.body, org=org)
+        path = f".claude/skills/{skill['slug']}/{skill['slug']}.md"
+        files.append(OutputFile(path=path, content=content))
+
+        # Write content_files if present
+        for file_path, file_content in skill.get("content_files", {}).items():
+            full_path = f".claude/skills/{skill['slug']}/{file_path}"
+            if isinstance(file_content, dict):
+                files.append(OutputFile(path=full_path, content="", source=file_content["source"]))
+            else:
                 files.append(OutputFile(path=full_path, content=file_content))
 
+        return files
+
+    def render_shared(self, org: dict, templates_env: "Environment") -> list[OutputFile]:
+        files: list[OutputFile] = []
+
         # Render settings.json with hook config
         settings_template = templates_env.get_template("claude/settings.json.j2")
         settings_content = settings_template.render(org=org)
@@ -1,13 +1,25 @@
-from jinja2 import Environment
+from typing import TYPE_CHECKING
 
-from .base import BuildTarget, OutputFile
+from .base import BODY_TEMPLATE, BuildTarget, OutputFile, SkillDocument
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
 
 class CursorTarget(BuildTarget):
     name = "cursor"
     output_dir = ".cursor"
+    skill_templates = ("cursor/rule.mdc.j2", BODY_TEMPLATE)
+    shared_templates = ("cursor/hooks.json.j2", "cursor/telemetry.sh.j2")
+
+    def render_skill(self, doc: SkillDocument, org: dict, templates_env: "Environment") -> list[OutputFile]:
+        # Each skill becomes a Cursor rule, applied when the agent finds
+        # its description relevant
+        rule_template = templates_env.get_template("cursor/rule.mdc.j2")
+        content = rule_template.render(skill=doc.skill, body=doc.body, org=org)
+        return [OutputFile(path=f".cursor/rules/{doc.skill['slug']}.mdc", content=content)]
 
-    def render(self, skills: list[dict], org: dict, templates_env: Environment) -> list[OutputFile]:
+    def render_shared(self, org: dict, templates_env: "Environment") -> list[OutputFile]:
         files: list[OutputFile] = []
 
         # Render hooks.json with telemetry config
@@ -0,0 +1,326 @@
+"""Skill usage telemetry: a local spool and batched uploads.
+
+The generated skill-telemetry.sh hooks never touch the network: each
+skill load appends one JSON line to a per-user spool,
+${XDG_STATE_HOME:-~/.local/state}/aictrl/telemetry.jsonl, and stops
+appending once the spool reaches MAX_SPOOL_BYTES. flush() uploads the
+spool later -- from `aictrl telemetry flush`, cron, the daemon, or in
+the background after `aictrl build`.
+
+A flush renames the spool aside first, so hooks keep appending to a
+fresh file while it uploads. Events are grouped by organization and
+POSTed in batches of up to BATCH_EVENTS as a gzip-compressed
+{"events": [...]} body to <telemetry_url>/<org_id>/skill-usage/batch,
+over one keep-alive connection per host. A server without the batch
+route (404 or 405) gets the rest of that organization's events one
+plain JSON POST each to <telemetry_url>/<org_id>/skill-usage, the
+endpoint the hooks used to call directly. Connection errors, timeouts,
+429 and 5xx responses are retried with exponential backoff (honoring
+Retry-After). A batch the server rejects outright (any other 4xx) is
+dropped. Batches that still failed are kept for the next flush, oldest
+events dropped first beyond MAX_SPOOL_BYTES. Delivery is at least once:
+a flush that dies mid-upload sends its last batch again next time.
+"""
+
+import fcntl
+import gzip
+import http.client
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlsplit
+
+from . import __version__
+
+
+SPOOL_ENV = "AICTRL_TELEMETRY_SPOOL"
+SPOOL_NAME = "telemetry.jsonl"
+# The hooks stop appending at this size (the number is repeated in the
+# telemetry.sh templates); a flush keeps at most this much unsent.
+MAX_SPOOL_BYTES = 8 * 1024 * 1024
+BATCH_EVENTS = 500
+MAX_ATTEMPTS = 4
+BACKOFF = 0.5  # seconds before the first retry, doubled for each next one
+MAX_RETRY_AFTER = 30.0
+TIMEOUT = 10.0
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+NO_BATCH_STATUSES = {404, 405}
+
+
+class UploadError(Exception):
+    """A batch could not be delivered; it is kept for the next flush."""
+
+
+class BatchRejected(UploadError):
+    """The server refused a batch; sending it again would not help."""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class FlushResult:
+    sent: int = 0
+    requests: int = 0
+    dropped: int = 0   # unparseable, rejected, or over the spool cap
+    pending: int = 0   # kept for the next flush
+    busy: bool = False  # another flush holds the lock
+    errors: list[str] = field(default_factory=list)
+
+
+def spool_path() -> Path:
+    """$AICTRL_TELEMETRY_SPOOL if set, else aictrl/telemetry.jsonl under $XDG_STATE_HOME."""
+    override = os.environ.get(SPOOL_ENV)
+    if override:
+        return Path(override)
+    state_home = os.environ.get("XDG_STATE_HOME") or os.path.join(os.path.expanduser("~"), ".local", "state")
+    return Path(state_home) / "aictrl" / SPOOL_NAME
+
+
+def has_pending(path: Path | None = None) -> bool:
+    """True if there are spooled events to upload (a stat or two, no reading)."""
+    path = path or spool_path()
+    try:
+        if os.path.getsize(path) > 0:
+            return True
+    except OSError:
+        pass
+    return any(_claimed(path))
+
+
+class Uploader:
+    """POSTs events, keeping one HTTP/1.1 connection open per host."""
+
+    def __init__(
+        self,
+        timeout: float = TIMEOUT,
+        max_attempts: int = MAX_ATTEMPTS,
+        backoff: float = BACKOFF,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.sleep = sleep
+        self.connections: dict[tuple[str, str], http.client.HTTPConnection] = {}
+
+    def post(self, url: str, body: bytes, compressed: bool = True) -> None:
+        """Send one JSON body, gzip-compressed unless `compressed` is
+        false. Raises BatchRejected or, once retries are used up,
+        UploadError."""
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        headers = {"Content-Type": "application/json", "User-Agent": f"aictrl/{__version__}"}
+        if compressed:
+            headers["Content-Encoding"] = "gzip"
+        error = ""
+        for attempt in range(self.max_attempts):
+            delay = self.backoff * 2 ** attempt
+            try:
+                conn = self._connection(parts.scheme, parts.netloc)
+                conn.request("POST", path, body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException) as e:
+                # Also what a keep-alive connection the server has since
+                # closed looks like: reconnect on the next attempt.
+                self._discard(parts.scheme, parts.netloc)
+                error = str(e) or type(e).__name__
+            else:
+                if response.will_close:
+                    self._discard(parts.scheme, parts.netloc)
+                if 200 <= response.status < 300:
+                    return
+                if response.status not in RETRY_STATUSES:
+                    raise BatchRejected(f"{url}: HTTP {response.status} {response.reason}", response.status)
+                error = f"HTTP {response.status} {response.reason}"
+                delay = _retry_after(response.getheader("Retry-After"), delay)
+            if attempt + 1 < self.max_attempts:
+                self.sleep(delay)
+        raise UploadError(f"{url}: {error}")
+
+    def close(self) -> None:
+        for conn in self.connections.values():
+            conn.close()
+        self.connections.clear()
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        conn = self.connections.get((scheme, netloc))
+        if conn is None:
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            elif scheme == "http":
+                conn = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            else:
+                raise BatchRejected(f"unsupported telemetry URL scheme: {scheme!r}")
+            self.connections[scheme, netloc] = conn
+        return conn
+
+    def _discard(self, scheme: str, netloc: str) -> None:
+        conn = self.connections.pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+
+def flush(
+    path: Path | None = None,
+    uploader: Uploader | None = None,
+    batch_events: int = BATCH_EVENTS,
+    max_bytes: int = MAX_SPOOL_BYTES,
+) -> FlushResult:
+    """Upload every spooled event. Only one flush runs at a time; a
+    second one returns at once with `busy` set."""
+    path = path or spool_path()
+    result = FlushResult()
+    if not path.parent.is_dir():
+        return result
+
+    with open(path.parent / f"{path.name}.lock", "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            result.busy = True
+            return result
+
+        try:
+            os.rename(path, _claim_name(path))
+        except FileNotFoundError:
+            pass
+        claimed = _claimed(path)
+        if not claimed:
+            return result
+
+        by_org: dict[tuple[str, str], list[dict]] = {}
+        for event in _read_events(claimed, result):
+            by_org.setdefault((event["telemetryUrl"], event["orgId"]), []).append(event)
+
+        owned = uploader is None
+        uploader = uploader or Uploader()
+        unsent: list[dict] = []
+        try:
+            for (telemetry_url, org_id), events in by_org.items():
+                url = f"{telemetry_url.rstrip('/')}/{org_id}/skill-usage"
+                batch_route = True
+                start = 0
+                while start < len(events):
+                    if batch_route:
+                        batch = events[start:start + batch_events]
+                        payload = [_payload(event) for event in batch]
+                        body = gzip.compress(json.dumps({"events": payload}).encode())
+                    else:
+                        batch = events[start:start + 1]
+                        body = json.dumps(_payload(batch[0])).encode()
+                    try:
+                        uploader.post(f"{url}/batch" if batch_route else url, body, compressed=batch_route)
+                    except BatchRejected as e:
+                        if batch_route and e.status in NO_BATCH_STATUSES:
+                            # An older server: send this batch and the rest one by one.
+                            batch_route = False
+                            continue
+                        result.dropped += len(batch)
+                        result.errors.append(str(e))
+                        start += len(batch)
+                        continue
+                    except UploadError as e:
+                        # The endpoint is down: keep the rest of its events.
+                        unsent.extend(events[start:])
+                        result.errors.append(str(e))
+                        break
+                    result.sent += len(batch)
+                    result.requests += 1
+                    start += len(batch)
+        finally:
+            if owned:
+                uploader.close()
+
+        result.pending, result.dropped = _keep(path, unsent, max_bytes, result.dropped)
+        for claimed_path in claimed:
+            claimed_path.unlink(missing_ok=True)
+    return result
+
+
+def flush_in_background() -> None:
+    """Flush from a detached process that outlives this one."""
+    subprocess.Popen(
+        [sys.executable, "-m", "aictrl.telemetry"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+
+
+def _claim_name(path: Path) -> Path:
+    return path.with_name(f"{path.name}.{time.time_ns()}.sending")
+
+
+def _claimed(path: Path) -> list[Path]:
+    """Spool files set aside by this or an earlier, interrupted flush, oldest first."""
+    try:
+        return sorted(path.parent.glob(f"{path.name}.*.sending"))
+    except OSError:
+        return []
+
+
+def _read_events(paths: list[Path], result: FlushResult) -> list[dict]:
+    events = []
+    for p in paths:
+        with open(p, "rb") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    event = None
+                # The hooks write JSON with printf; skip whatever came out malformed.
+                if isinstance(event, dict) and event.get("telemetryUrl") and event.get("orgId"):
+                    events.append(event)
+                elif line.strip():
+                    result.dropped += 1
+    return events
+
+
+def _payload(event: dict) -> dict:
+    """An event as uploaded: the organization and endpoint are in the URL."""
+    return {k: v for k, v in event.items() if k not in ("telemetryUrl", "orgId")}
+
+
+def _keep(path: Path, events: list[dict], max_bytes: int, dropped: int) -> tuple[int, int]:
+    """Write unsent events to a new claimed file, newest kept within
+    `max_bytes`. Returns (kept, dropped)."""
+    if not events:
+        return 0, dropped
+    lines = [json.dumps(event).encode() + b"\n" for event in events]
+    kept, size = [], 0
+    for line in reversed(lines):
+        if size + len(line) > max_bytes:
+            break
+        kept.append(line)
+        size += len(line)
+    dropped += len(lines) - len(kept)
+
+    target = _claim_name(path)
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.writelines(reversed(kept))
+    os.replace(tmp_path, target)
+    return len(kept), dropped
+
+
+def _retry_after(value: str | None, default: float) -> float:
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return default
+
+
+if __name__ == "__main__":
+    flush()
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'claude/telemetry.sh.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '#!/bin/bash\n# aictrl skill usage telemetry\n# Fires after PostToolUse in Claude Code\n# Appends the event to a local spool that `aictrl telemetry flush`\n# uploads in batches, so the hook never waits on the network.\n\nset -euo pipefail\n\nINPUT=$(cat)\n\nTOOL_NAME=$(echo "$INPUT" | jq -r \'.tool_name // empty\' 2>/dev/null)\nif [ "$TOOL_NAME" != "mcp__session-control__load_skill" ]; then\n  exit 0\nfi\n\nSKILL_NAME=$(echo "$INPUT" | jq -r \'.tool_input.name // .tool_input.skill_id // empty\' 2>/dev/null)\nDURATION=$(echo "$INPUT" | jq -r \'.duration // 0\' 2>/dev/null)\nMACHINE_ID=$(hostname | sha256sum | cut -d\' \' -f1 | head -c 16)\nTIMESTAMP=$(date -u +"%Y-%m-%dT%H:%M:%SZ")\n\nif [ -z "$SKILL_NAME" ] || [ -z "$AICTRL_ORG_ID" ] || [ -z "$AICTRL_TELEMETRY_URL" ]; then\n  exit 0\nfi\n\nSPOOL="${AICTRL_TELEMETRY_SPOOL:-${XDG_STATE_HOME:-$HOME/.local/state}/aictrl/telemetry.jsonl}"\n\n# Uploads have fallen behind; stop recording (aictrl.telemetry.MAX_SPOOL_BYTES).\nif [ -f "$SPOOL" ] && [ "$(wc -c < "$SPOOL")" -ge 8388608 ]; then\n  exit 0\nfi\n\n[ -d "${SPOOL%/*}" ] || mkdir -p "${SPOOL%/*}" 2>/dev/null || exit 0\nprintf \'%s\\n\' "{\\"skillName\\": \\"$SKILL_NAME\\", \\"source\\": \\"claude-code\\", \\"duration\\": $DURATION, \\"machineId\\": \\"$MACHINE_ID\\", \\"timestamp\\": \\"$TIMESTAMP\\", \\"orgId\\": \\"$AICTRL_ORG_ID\\", \\"telemetryUrl\\": \\"$AICTRL_TELEMETRY_URL\\"}" \\\n  >> "$SPOOL" 2>/dev/null || true\n'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
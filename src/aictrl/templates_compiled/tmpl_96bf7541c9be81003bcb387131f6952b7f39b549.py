@@ -0,0 +1,25 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'skill/body.md.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_skill = resolve('skill')
+    pass
+    yield str(environment.getattr((undefined(name='skill') if l_0_skill is missing else l_0_skill), 'instructions'))
+    yield '\n'
+    for (l_1_name, l_1_content) in context.call(environment.getattr(environment.getattr((undefined(name='skill') if l_0_skill is missing else l_0_skill), 'sections'), 'items')):
+        _loop_vars = {}
+        pass
+        yield '\n---\n\n## '
+        yield str(l_1_name)
+        yield '\n\n'
+        yield str(l_1_content)
+        yield '\n'
+    l_1_name = l_1_content = missing
+
+blocks = {}
+debug_info = '1=12&2=14&6=18&8=20'
\ No newline at end of file
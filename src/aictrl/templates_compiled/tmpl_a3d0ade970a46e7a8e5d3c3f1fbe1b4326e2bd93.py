@@ -0,0 +1,19 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'cursor/hooks.json.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_org = resolve('org')
+    pass
+    yield '{\n  "version": 1,\n  "hooks": {\n    "afterMCPExecution": [\n      {\n        "command": ".cursor/hooks/skill-telemetry.sh",\n        "timeout": 5000,\n        "env": {\n          "AICTRL_ORG_ID": "'
+    yield str(environment.getattr((undefined(name='org') if l_0_org is missing else l_0_org), 'id'))
+    yield '",\n          "AICTRL_TELEMETRY_URL": "'
+    yield str(environment.getattr((undefined(name='org') if l_0_org is missing else l_0_org), 'telemetry_url'))
+    yield '"\n        }\n      }\n    ]\n  }\n}\n'
+
+blocks = {}
+debug_info = '9=13&10=15'
\ No newline at end of file
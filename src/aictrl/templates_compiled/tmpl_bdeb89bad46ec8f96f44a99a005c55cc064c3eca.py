@@ -0,0 +1,19 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'cursor/rule.mdc.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_skill = resolve('skill')
+    l_0_body = resolve('body')
+    pass
+    yield '---\ndescription: '
+    yield str(environment.getattr((undefined(name='skill') if l_0_skill is missing else l_0_skill), 'description'))
+    yield '\nglobs:\nalwaysApply: false\n---\n\n'
+    yield str((undefined(name='body') if l_0_body is missing else l_0_body))
+
+blocks = {}
+debug_info = '2=14&7=16'
\ No newline at end of file
@@ -0,0 +1,40 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'claude/skill.md.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_skill = resolve('skill')
+    l_0_body = resolve('body')
+    pass
+    yield '---\ndescription: '
+    yield str(environment.getattr((undefined(name='skill') if l_0_skill is missing else l_0_skill), 'description'))
+    yield '\n'
+    if environment.getattr((undefined(name='skill') if l_0_skill is missing else l_0_skill), 'allowed_tools'):
+        pass
+        yield 'allowed_tools:\n'
+        for l_1_tool in environment.getattr((undefined(name='skill') if l_0_skill is missing else l_0_skill), 'allowed_tools'):
+            _loop_vars = {}
+            pass
+            yield '  - '
+            yield str(l_1_tool)
+            yield '\n'
+        l_1_tool = missing
+    if environment.getattr((undefined(name='skill') if l_0_skill is missing else l_0_skill), 'tags'):
+        pass
+        yield 'tags:\n'
+        for l_1_tag in environment.getattr((undefined(name='skill') if l_0_skill is missing else l_0_skill), 'tags'):
+            _loop_vars = {}
+            pass
+            yield '  - '
+            yield str(l_1_tag)
+            yield '\n'
+        l_1_tag = missing
+    yield '---\n\n'
+    yield str((undefined(name='body') if l_0_body is missing else l_0_body))
+
+blocks = {}
+debug_info = '2=14&3=16&4=19&5=26&6=29&9=37'
\ No newline at end of file
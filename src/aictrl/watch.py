@@ -0,0 +1,304 @@
+"""`aictrl watch`: rebuild when build inputs change.
+
+Changes under .aictrl/ (skills, packs, overrides, org and config,
+templates, content files) are picked up with inotify on Linux and by
+polling stat data elsewhere or when inotify is unavailable. Bursts of
+events, such as a git checkout rewriting many files, are debounced
+into one rebuild. A BuildSession keeps the parse cache and template
+environment in memory between builds, and builds are incremental, so a
+rebuild re-parses only changed files and re-renders only affected
+outputs.
+"""
+
+import ctypes
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from .build import BuildResult, build_project
+from .cache import ParseCache
+from .config import AICTRL_DIR, CACHE_DIR, LOCK_FILE, load_config, load_org
+
+
+DEFAULT_DEBOUNCE = 0.1
+# Keep collecting a steady stream of events no longer than this before building.
+MAX_DEBOUNCE = 2.0
+POLL_INTERVAL = 0.5
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+
+_EVENT = struct.Struct("iIII")
+
+
+def is_input(project_root: Path, path: Path) -> bool:
+    """True for paths under .aictrl/ that a build reads.
+
+    The cache directory and the lockfile are written by the build
+    itself and never count.
+    """
+    try:
+        rel = path.relative_to(project_root / AICTRL_DIR)
+    except ValueError:
+        return False
+    parts = rel.parts
+    if not parts:
+        return True
+    return parts[0] != CACHE_DIR and rel.as_posix() != LOCK_FILE
+
+
+class PollingWatcher:
+    """Detects changes by comparing stat data of every input file."""
+
+    name = "polling"
+
+    def __init__(self, project_root: Path, interval: float = POLL_INTERVAL):
+        self.project_root = project_root
+        self.interval = interval
+        self._state = self._scan()
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        """Block until something changes or `timeout` passes; return changed paths."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            state = self._scan()
+            changed = {p for p in state.keys() | self._state.keys() if state.get(p) != self._state.get(p)}
+            self._state = state
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            time.sleep(max(0.0, remaining))
+
+    def close(self) -> None:
+        pass
+
+    def _scan(self) -> dict[Path, tuple[int, int, int]]:
+        state = {}
+        root = self.project_root / AICTRL_DIR
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if is_input(self.project_root, Path(dirpath, d))]
+            for name in filenames:
+                path = Path(dirpath, name)
+                if not is_input(self.project_root, path):
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                state[path] = (st.st_size, st.st_mtime_ns, st.st_ino)
+        return state
+
+
+class InotifyWatcher:
+    """Detects changes with inotify, watching every directory under .aictrl/."""
+
+    name = "inotify"
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._dirs: dict[int, Path] = {}
+        try:
+            self._add_tree(project_root / AICTRL_DIR)
+        except OSError:
+            self.close()
+            raise
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        """Block until something changes or `timeout` passes; return changed paths."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return set()
+            changed = self._read_events()
+            if changed:
+                return changed
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def _add_tree(self, root: Path) -> None:
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if is_input(self.project_root, Path(dirpath, d))]
+            self._add(Path(dirpath))
+
+    def _add(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return  # gone again already
+            raise OSError(err, os.strerror(err), str(directory))
+        self._dirs[wd] = directory
+
+    def _read_events(self) -> set[Path]:
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+                offset += _EVENT.size + length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were lost: report the whole tree as changed.
+                    changed.add(self.project_root / AICTRL_DIR)
+                    continue
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                path = directory / os.fsdecode(name) if name else directory
+                if not is_input(self.project_root, path):
+                    continue
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_tree(path)
+                changed.add(path)
+
+
+def create_watcher(project_root: Path, polling: bool = False):
+    """An InotifyWatcher where possible, otherwise a PollingWatcher."""
+    if not polling and sys.platform == "linux":
+        try:
+            return InotifyWatcher(project_root)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(project_root)
+
+
+def collect_burst(watcher, first: set[Path], debounce: float, max_delay: float = MAX_DEBOUNCE) -> set[Path]:
+    """Keep collecting changes until none arrive for `debounce` seconds
+    (or `max_delay` has passed), so a burst triggers one rebuild."""
+    changed = set(first)
+    deadline = time.monotonic() + max_delay
+    while time.monotonic() < deadline:
+        more = watcher.wait(min(debounce, max(0.0, deadline - time.monotonic())))
+        if not more:
+            break
+        changed |= more
+    return changed
+
+
+def build_errors() -> tuple[type[Exception], ...]:
+    """What a build raises for inputs that are wrong, or half-saved by an
+    editor: bad YAML or overrides, a broken template, a missing file."""
+    import yaml
+    from jinja2 import TemplateError
+
+    return (ValueError, OSError, yaml.YAMLError, TemplateError)
+
+
+class BuildSession:
+    """Warm state for repeated builds of one project.
+
+    The parse cache stays in memory between builds and is written back
+    by close(); the render worker keeps its template environment (see
+    renderer._init_render_worker).
+    """
+
+    def __init__(self, project_root: Path, target_names: list[str] | None = None, jobs: int | None = None):
+        self.project_root = project_root
+        self.target_names = target_names
+        self.jobs = jobs
+        on_disk = ParseCache.open(project_root)
+        self._cache_path = on_disk.path
+        on_disk.path = None  # saved once, on close
+        self.cache = on_disk
+
+    def build(self) -> BuildResult:
+        config = load_config(self.project_root)
+        org = load_org(self.project_root)
+        return build_project(
+            self.project_root, config, org,
+            target_names=self.target_names, jobs=self.jobs, cache=self.cache,
+        )
+
+    def close(self) -> None:
+        self.cache.path = self._cache_path
+        self.cache.save()
+
+
+def watch_project(
+    project_root: Path,
+    on_build: Callable[[BuildResult, set[Path], float], None],
+    on_error: Callable[[Exception], None],
+    target_names: list[str] | None = None,
+    jobs: int | None = None,
+    debounce: float = DEFAULT_DEBOUNCE,
+    polling: bool = False,
+    stop: threading.Event | None = None,
+    on_ready: Callable[[str], None] | None = None,
+) -> None:
+    """Build once, then rebuild on every (debounced) change until `stop` is set.
+
+    `on_build` gets the result, the changed paths (empty for the first
+    build) and the build's wall time in seconds. Build errors (see
+    build_errors) go to `on_error` and watching continues.
+    """
+    errors = build_errors()
+    stop = stop or threading.Event()
+    session = BuildSession(project_root, target_names=target_names, jobs=jobs)
+    # Start watching before the first build so no edit is missed.
+    watcher = create_watcher(project_root, polling=polling)
+    try:
+        if on_ready is not None:
+            on_ready(watcher.name)
+        changed: set[Path] = set()
+        while True:
+            start = time.perf_counter()
+            try:
+                result = session.build()
+            except errors as e:
+                on_error(e)
+            else:
+                on_build(result, changed, time.perf_counter() - start)
+
+            changed = set()
+            while not changed and not stop.is_set():
+                changed = watcher.wait(0.25)
+            if stop.is_set():
+                return
+            changed = collect_burst(watcher, changed, debounce)
+    finally:
+        watcher.close()
+        session.close()
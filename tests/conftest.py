@@ -10,3 +10,11 @@ def sample_project():
 @pytest.fixture
 def aictrl_dir(sample_project):
     return sample_project / ".aictrl"
+
+
+@pytest.fixture(autouse=True)
+def telemetry_spool(tmp_path, monkeypatch):
+    """Keep builds and flushes away from the user's real telemetry spool."""
+    path = tmp_path / "state" / "aictrl" / "telemetry.jsonl"
+    monkeypatch.setenv("AICTRL_TELEMETRY_SPOOL", str(path))
+    return path
@@ -0,0 +1,160 @@
+import os
+import shutil
+
+import pytest
+
+from aictrl.build import build_project
+from aictrl.config import load_config, load_org
+from aictrl.manifest import MANIFEST_FILE, read_manifest
+
+
+@pytest.fixture
+def project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    return dst
+
+
+def _build(project, **kwargs):
+    return build_project(project, load_config(project), load_org(project), **kwargs)
+
+
+def _skill_md(project, slug):
+    return project / ".claude" / "skills" / slug / f"{slug}.md"
+
+
+def test_first_build_renders_everything(project):
+    result = _build(project)
+    assert [s.slug for s in result.skills] == ["code-review", "testing-guide"]
+    assert result.files == 8
+    assert result.rendered == 8
+    assert result.reused == 0
+
+
+def test_build_reports_phase_timings(project):
+    timings = _build(project).timings
+    assert list(timings) == ["load", "merge", "hash", "plan", "render", "write"]
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_parallel_build_matches_serial(project, tmp_path):
+    serial_project = tmp_path / "serial"
+    shutil.copytree(project, serial_project)
+
+    _build(serial_project, jobs=1)
+    _build(project, jobs=2)
+
+    for path in (serial_project / ".claude").rglob("*"):
+        if path.is_file() and path.name != MANIFEST_FILE:
+            assert (project / path.relative_to(serial_project)).read_bytes() == path.read_bytes()
+    # Manifests differ only in the mtimes and inodes they record.
+    serial, parallel = read_manifest(serial_project, ".claude"), read_manifest(project, ".claude")
+    assert serial.units == parallel.units
+    assert {p: (e.size, e.hash, e.unit) for p, e in serial.files.items()} == {
+        p: (e.size, e.hash, e.unit) for p, e in parallel.files.items()
+    }
+
+
+def test_unchanged_rebuild_renders_nothing(project):
+    _build(project)
+    result = _build(project)
+    assert result.rendered == 0
+    assert result.reused == 8
+
+
+def test_manifest_records_unit_inputs(project):
+    _build(project)
+    manifest = read_manifest(project, ".claude")
+    assert manifest.files[".claude/skills/code-review/code-review.md"].unit == "skill:code-review"
+    assert manifest.files[".claude/settings.json"].unit == "shared"
+
+    inputs = manifest.units["skill:code-review"].inputs
+    assert inputs["skill"].startswith("code-review@")
+    assert inputs["overrides"] == ["code-review.yaml"]
+    assert list(inputs["templates"]) == ["claude/skill.md.j2", "skill/body.md.j2"]
+    assert manifest.units["skill:testing-guide"].inputs["overrides"] == []
+
+
+def test_override_change_rerenders_one_skill(project):
+    _build(project)
+    override = project / ".aictrl" / "overrides" / "skills" / "code-review.yaml"
+    override.write_text(override.read_text() + "description: Changed by override\n")
+
+    result = _build(project)
+    assert result.rendered == 2  # its Claude skill file and Cursor rule
+    assert "Changed by override" in _skill_md(project, "code-review").read_text()
+
+
+def test_org_change_rerenders_everything(project):
+    _build(project)
+    org = project / ".aictrl" / "data" / "org.yaml"
+    org.write_text(org.read_text().replace("Test Org", "Renamed Org"))
+
+    assert _build(project).rendered == 8
+
+
+def test_template_override_rerenders_its_units(project):
+    _build(project)
+    templates = project / ".aictrl" / "templates" / "claude"
+    templates.mkdir(parents=True)
+    (templates / "skill.md.j2").write_text("{% include 'claude/part.j2' %}{{ skill.slug }}\n")
+    (templates / "part.j2").write_text("v1 ")
+
+    result = _build(project)
+    assert result.rendered == 2
+    assert _skill_md(project, "code-review").read_text() == "v1 code-review\n"
+
+    # Included templates are dependencies too.
+    (templates / "part.j2").write_text("v2 ")
+    assert _build(project).rendered == 2
+    assert _skill_md(project, "code-review").read_text() == "v2 code-review\n"
+
+
+def test_missing_output_is_rerendered(project):
+    _build(project)
+    _skill_md(project, "testing-guide").unlink()
+
+    result = _build(project)
+    assert result.rendered == 1
+    assert _skill_md(project, "testing-guide").exists()
+
+
+def test_same_size_edit_or_replaced_output_is_rerendered(project):
+    _build(project)
+    path = _skill_md(project, "testing-guide")
+    original = path.read_bytes()
+    path.write_bytes(original.swapcase())
+    assert _build(project).rendered == 1
+    assert path.read_bytes() == original
+
+    # Replaced by a file with the same size and mtime: only the inode moved.
+    st = path.stat()
+    replacement = path.with_name("replacement")
+    replacement.write_bytes(original.swapcase())
+    os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(replacement, path)
+    assert _build(project).rendered == 1
+    assert path.read_bytes() == original
+
+
+def test_manifest_records_mtime_and_inode(project):
+    _build(project)
+    entry = read_manifest(project, ".claude").files[".claude/skills/code-review/code-review.md"]
+    st = _skill_md(project, "code-review").stat()
+    assert (entry.mtime_ns, entry.inode) == (st.st_mtime_ns, st.st_ino)
+
+
+def test_full_rerenders_everything(project):
+    _build(project)
+    result = _build(project, full=True)
+    assert result.rendered == 8
+    # Re-rendered output identical to what is on disk is not rewritten.
+    assert result.written == 0
+    assert result.unchanged == 8
+
+
+def test_no_skills_writes_nothing(project):
+    shutil.rmtree(project / ".aictrl" / "data" / "skills")
+    result = _build(project)
+    assert result.skills == []
+    assert not (project / ".claude").exists()
@@ -0,0 +1,199 @@
+import os
+import pickle
+import shutil
+
+import pytest
+
+from aictrl import loader
+from aictrl.cache import LAST_USED_RESOLUTION_NS, ParseCache, read_yaml
+from aictrl.loader import load_skills
+from aictrl.merger import load_overrides
+
+
+@pytest.fixture
+def project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    return dst
+
+
+def _age(path, seconds=60):
+    """Backdate mtime so the cache trusts stat data without re-hashing."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _put(cache, path):
+    document, fingerprint = read_yaml(path)
+    cache.put(path, fingerprint, document)
+
+
+class TestParseCache:
+    def test_miss_then_hit(self, tmp_path):
+        path = tmp_path / "a.yaml"
+        path.write_text("slug: a\n")
+        cache = ParseCache(root=tmp_path)
+
+        assert cache.get(path) == (False, None)
+        _put(cache, path)
+
+        assert cache.get(path) == (True, {"slug": "a"})
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_content_change_invalidates(self, tmp_path):
+        path = tmp_path / "a.yaml"
+        path.write_text("slug: a\n")
+        cache = ParseCache(root=tmp_path)
+        _put(cache, path)
+
+        path.write_text("slug: b\n")
+        assert cache.get(path) == (False, None)
+
+    def test_same_size_and_mtime_verified_by_hash(self, tmp_path):
+        path = tmp_path / "a.yaml"
+        path.write_text("slug: a\n")
+        cache = ParseCache(root=tmp_path)
+        _put(cache, path)
+
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text("slug: b\n")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        assert cache.get(path) == (False, None)
+
+    def test_touch_without_change_still_hits(self, tmp_path):
+        path = tmp_path / "a.yaml"
+        path.write_text("slug: a\n")
+        cache = ParseCache(root=tmp_path)
+        _put(cache, path)
+
+        path.touch()
+        assert cache.get(path) == (True, {"slug": "a"})
+
+    def test_save_and_reopen(self, project):
+        path = project / ".aictrl" / "data" / "org.yaml"
+        cache = ParseCache.open(project)
+        _put(cache, path)
+        cache.save()
+
+        cache_dir = project / ".aictrl" / ".cache"
+        assert (cache_dir / ".gitignore").read_text() == "*\n"
+
+        reopened = ParseCache.open(project)
+        hit, document = reopened.get(path)
+        assert hit
+        assert document["id"] == "org-test-123"
+
+    def test_corrupt_cache_file_ignored(self, project):
+        cache_dir = project / ".aictrl" / ".cache"
+        cache_dir.mkdir()
+        (cache_dir / "parsed.json").write_bytes(b"not json")
+
+        cache = ParseCache.open(project)
+        assert cache.entries == {}
+
+    def test_legacy_pickle_is_never_loaded(self, project, monkeypatch):
+        cache_dir = project / ".aictrl" / ".cache"
+        cache_dir.mkdir()
+        legacy = cache_dir / "parsed.pickle"
+        legacy.write_bytes(pickle.dumps({"format": 1, "entries": {}}))
+        monkeypatch.setattr(pickle, "load", lambda *args: pytest.fail("loaded a pickle"))
+
+        cache = ParseCache.open(project)
+        _put(cache, project / ".aictrl" / "data" / "org.yaml")
+        cache.save()
+        assert not legacy.exists()
+        assert (cache_dir / "parsed.json").exists()
+
+    def test_documents_json_cannot_round_trip_are_not_cached(self, tmp_path):
+        path = tmp_path / "a.yaml"
+        path.write_text("released: 2024-01-02\n1: one\n")
+        cache = ParseCache(root=tmp_path)
+        _put(cache, path)
+        assert cache.get(path) == (False, None)
+
+    def test_malformed_entries_are_ignored(self, project):
+        cache_dir = project / ".aictrl" / ".cache"
+        cache_dir.mkdir()
+        (cache_dir / "parsed.json").write_text('{"format": 2, "entries": {"x": [[1, "2", "d"], "{}", 0, 0]}}')
+        assert ParseCache.open(project).entries == {}
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ParseCache(root=tmp_path, max_bytes=1)
+        for name in ("old", "new"):
+            path = tmp_path / f"{name}.yaml"
+            path.write_text(f"slug: {name}\n")
+            _put(cache, path)
+        cache.max_bytes = len(cache.entries["new.yaml"].payload)
+
+        cache.evict()
+        assert list(cache.entries) == ["new.yaml"]
+
+    def test_hit_bumps_last_used_only_when_a_day_old(self, tmp_path):
+        path = tmp_path / "a.yaml"
+        path.write_text("slug: a\n")
+        _age(path)
+        cache = ParseCache(root=tmp_path)
+        _put(cache, path)
+        cache._dirty = False
+        entry = cache.entries["a.yaml"]
+
+        used = entry.last_used_ns
+        assert cache.get(path)[0]
+        assert entry.last_used_ns == used
+        assert not cache._dirty
+
+        entry.last_used_ns -= LAST_USED_RESOLUTION_NS + 1
+        assert cache.get(path)[0]
+        assert entry.last_used_ns > used
+        assert cache._dirty
+
+
+class TestWarmLoad:
+    def test_warm_load_skips_parsing(self, project, monkeypatch):
+        for path in (project / ".aictrl").rglob("*.yaml"):
+            _age(path)
+
+        cache = ParseCache.open(project)
+        cold_skills = load_skills(project, cache=cache)
+        cold_overrides = load_overrides(project, cache=cache)
+        cache.save()
+
+        def fail(path):
+            raise AssertionError(f"re-parsed {path}")
+
+        monkeypatch.setattr(loader, "read_yaml", fail)
+        monkeypatch.setattr("aictrl.merger.read_yaml", fail)
+
+        cache = ParseCache.open(project)
+        assert load_skills(project, cache=cache) == cold_skills
+        assert load_overrides(project, cache=cache) == cold_overrides
+        assert cache.misses == 0
+
+    def test_warm_load_does_not_rewrite_cache(self, project):
+        for path in (project / ".aictrl").rglob("*.yaml"):
+            _age(path)
+        cache = ParseCache.open(project)
+        load_skills(project, cache=cache)
+        cache.save()
+        before = os.stat(cache.path)
+
+        cache = ParseCache.open(project)
+        load_skills(project, cache=cache)
+        cache.save()
+        after = os.stat(cache.path)
+        assert cache.hits
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+    def test_changed_file_reparsed(self, project):
+        cache = ParseCache.open(project)
+        load_skills(project, cache=cache)
+        cache.save()
+
+        path = project / ".aictrl" / "data" / "skills" / "testing-guide.yaml"
+        path.write_text(path.read_text().replace('"2.0.1"', '"2.0.2"'))
+
+        cache = ParseCache.open(project)
+        skills = load_skills(project, cache=cache)
+        tg = next(s for s in skills if s.slug == "testing-guide")
+        assert tg.version == "2.0.2"
+        assert cache.misses == 1
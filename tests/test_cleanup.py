@@ -0,0 +1,129 @@
+import shutil
+import time
+
+import pytest
+
+from aictrl.build import build_project
+from aictrl.cleanup import clean_outputs, remove_files
+from aictrl.config import load_config, load_org
+from aictrl.manifest import read_manifest
+
+
+OUTPUT_DIRS = [".claude", ".cursor"]
+
+
+@pytest.fixture
+def project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    return dst
+
+
+def _build(project, **kwargs):
+    return build_project(project, load_config(project), load_org(project), **kwargs)
+
+
+def _wait_for_empty_trash(project, timeout=10.0):
+    trash = project / ".aictrl" / ".cache" / "trash"
+    deadline = time.monotonic() + timeout
+    while trash.exists() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return not trash.exists()
+
+
+def test_remove_files_prunes_empty_dirs(tmp_path):
+    (tmp_path / ".claude/skills/a").mkdir(parents=True)
+    (tmp_path / ".claude/skills/a/a.md").write_text("a")
+    (tmp_path / ".claude/skills/b").mkdir()
+    (tmp_path / ".claude/skills/b/b.md").write_text("b")
+
+    assert remove_files(tmp_path, [".claude/skills/a/a.md", ".claude/skills/missing.md"]) == 1
+    assert not (tmp_path / ".claude/skills/a").exists()
+    assert (tmp_path / ".claude/skills/b/b.md").exists()
+
+
+class TestPrune:
+    def test_removed_skill_is_pruned(self, project):
+        _build(project)
+        (project / ".aictrl" / "data" / "skills" / "testing-guide.yaml").unlink()
+
+        result = _build(project)
+
+        assert result.pruned == 2  # Claude skill file and Cursor rule
+        assert not (project / ".claude" / "skills" / "testing-guide").exists()
+        assert not (project / ".cursor" / "rules" / "testing-guide.mdc").exists()
+        assert (project / ".claude" / "skills" / "code-review" / "code-review.md").exists()
+        assert ".claude/skills/testing-guide/testing-guide.md" not in read_manifest(project, ".claude").files
+
+    def test_user_files_are_never_pruned(self, project):
+        _build(project)
+        user_file = project / ".claude" / "skills" / "testing-guide" / "notes.md"
+        user_file.write_text("mine\n")
+        (project / ".aictrl" / "data" / "skills" / "testing-guide.yaml").unlink()
+
+        _build(project)
+
+        assert user_file.read_text() == "mine\n"
+        assert not (project / ".claude" / "skills" / "testing-guide" / "testing-guide.md").exists()
+
+    def test_full_build_still_prunes(self, project):
+        _build(project)
+        (project / ".aictrl" / "data" / "skills" / "testing-guide.yaml").unlink()
+        assert _build(project, full=True).pruned == 2
+
+
+class TestClean:
+    def test_removes_fully_tracked_dirs(self, project):
+        _build(project)
+        result = clean_outputs(project, OUTPUT_DIRS)
+
+        assert result.removed == OUTPUT_DIRS
+        assert result.files == 8
+        assert not (project / ".claude").exists()
+        assert not (project / ".cursor").exists()
+        assert _wait_for_empty_trash(project)
+
+    def test_keeps_user_files(self, project):
+        _build(project)
+        (project / ".claude" / "settings.local.json").write_text("{}\n")
+        (project / ".claude" / "skills" / "mine").mkdir()
+        (project / ".claude" / "skills" / "mine" / "mine.md").write_text("mine\n")
+
+        clean_outputs(project, OUTPUT_DIRS)
+
+        remaining = sorted(p.relative_to(project).as_posix() for p in (project / ".claude").rglob("*"))
+        assert remaining == [
+            ".claude/settings.local.json",
+            ".claude/skills",
+            ".claude/skills/mine",
+            ".claude/skills/mine/mine.md",
+        ]
+        assert _wait_for_empty_trash(project)
+
+    def test_keeps_symlinked_and_empty_user_dirs(self, project, tmp_path):
+        _build(project)
+        external = tmp_path / "ext"
+        external.mkdir()
+        (external / "notes.md").write_text("mine\n")
+        (project / ".claude" / "my-notes").symlink_to(external)
+        (project / ".claude" / "empty-user-dir").mkdir()
+
+        clean_outputs(project, OUTPUT_DIRS)
+
+        remaining = sorted(p.relative_to(project).as_posix() for p in (project / ".claude").iterdir())
+        assert remaining == [".claude/empty-user-dir", ".claude/my-notes"]
+        assert (external / "notes.md").read_text() == "mine\n"
+        assert not (project / ".cursor").exists()
+        assert _wait_for_empty_trash(project)
+
+    def test_untracked_dir_needs_force(self, project):
+        (project / ".claude").mkdir()
+        (project / ".claude" / "handmade.md").write_text("x\n")
+
+        result = clean_outputs(project, OUTPUT_DIRS)
+        assert result.untracked == [".claude"]
+        assert (project / ".claude" / "handmade.md").exists()
+
+        result = clean_outputs(project, OUTPUT_DIRS, force=True)
+        assert result.removed == [".claude"]
+        assert not (project / ".claude").exists()
@@ -66,6 +66,7 @@ class TestBuild:
         result = runner.invoke(main, ["build", "--target", "cursor", "--project", str(writable_project)])
         assert result.exit_code == 0
         assert (writable_project / ".cursor" / "hooks.json").exists()
+        assert (writable_project / ".cursor" / "rules" / "code-review.mdc").exists()
         assert not (writable_project / ".claude").exists()
 
     def test_build_creates_lockfile(self, runner, writable_project):
@@ -99,6 +100,79 @@ class TestBuild:
         # Override replaces team_standards
         assert "Our Team Standards" in content
 
+    def test_build_reports_all_bad_skill_files(self, runner, writable_project):
+        skills_dir = writable_project / ".aictrl" / "data" / "skills"
+        (skills_dir / "empty.yaml").write_text("")
+        (skills_dir / "no-slug.yaml").write_text("name: x\n")
+
+        result = runner.invoke(main, ["build", "--project", str(writable_project)])
+        assert result.exit_code == 1
+        assert "2 skill file(s) failed to load" in result.output
+        assert "empty.yaml" in result.output
+        assert "no-slug.yaml" in result.output
+
+    def test_build_with_selector_override(self, runner, writable_project):
+        overrides = writable_project / ".aictrl" / "overrides" / "skills"
+        (overrides / "quality.yaml").write_text("_select:\n  tags: [quality]\nsections:\n  policy: Team policy\n")
+
+        result = runner.invoke(main, ["build", "--project", str(writable_project)])
+        assert result.exit_code == 0
+        for slug in ("code-review", "testing-guide"):
+            md = writable_project / ".claude" / "skills" / slug / f"{slug}.md"
+            assert "Team policy" in md.read_text()
+
+    def test_build_bad_selector(self, runner, writable_project):
+        overrides = writable_project / ".aictrl" / "overrides" / "skills"
+        (overrides / "bad.yaml").write_text("_select:\n  owner: me\nversion: '1'\n")
+
+        result = runner.invoke(main, ["build", "--project", str(writable_project)])
+        assert result.exit_code == 1
+        assert "Unknown '_select' keys ['owner']" in result.output
+
+    def test_build_with_jobs(self, runner, writable_project):
+        result = runner.invoke(main, ["build", "--jobs", "2", "--project", str(writable_project)])
+        assert result.exit_code == 0
+        assert "Built 2 skills" in result.output
+
+    def test_rebuild_is_incremental(self, runner, writable_project):
+        runner.invoke(main, ["build", "--project", str(writable_project)])
+        result = runner.invoke(main, ["build", "--project", str(writable_project)])
+        assert result.exit_code == 0
+        assert "0 written, 8 unchanged" in result.output
+
+        skill_md = writable_project / ".claude" / "skills" / "code-review" / "code-review.md"
+        skill_md.write_text("hand edit\n")
+        result = runner.invoke(main, ["build", "--full", "--project", str(writable_project)])
+        assert result.exit_code == 0
+        assert "1 written, 7 unchanged" in result.output
+
+    def test_build_timings(self, runner, writable_project):
+        result = runner.invoke(main, ["build", "--timings", "--project", str(writable_project)])
+        assert result.exit_code == 0
+        assert "Timings: load" in result.output
+        assert "render" in result.output
+
+    def test_build_recursive(self, runner, sample_project, tmp_path):
+        for name in ("one", "two"):
+            shutil.copytree(sample_project / ".aictrl", tmp_path / name / ".aictrl")
+        (tmp_path / "two" / ".aictrl" / "data" / "skills" / "broken.yaml").write_text("name: [unclosed\n")
+
+        result = runner.invoke(main, ["build", "--recursive", "--project", str(tmp_path), "--jobs", "1"])
+        assert result.exit_code == 1
+        assert "Built 1 of 2 projects" in result.output
+        assert "broken.yaml" in result.output
+        assert (tmp_path / "one" / ".claude" / "settings.json").exists()
+
+        (tmp_path / "two" / ".aictrl" / "data" / "skills" / "broken.yaml").unlink()
+        result = runner.invoke(main, ["build", "-r", "--project", str(tmp_path), "--jobs", "1"])
+        assert result.exit_code == 0
+        assert "Built 2 of 2 projects" in result.output
+
+    def test_build_recursive_finds_nothing(self, runner, tmp_path):
+        result = runner.invoke(main, ["build", "--recursive", "--project", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "No .aictrl/ projects found" in result.output
+
     def test_build_telemetry_script_executable(self, runner, writable_project):
         result = runner.invoke(main, ["build", "--project", str(writable_project)])
         assert result.exit_code == 0
@@ -108,6 +182,13 @@ class TestBuild:
         assert sh.stat().st_mode & 0o111
 
 
+class TestWatch:
+    def test_watch_missing_config(self, runner, tmp_path):
+        result = runner.invoke(main, ["watch", "--project", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "Config not found" in result.output
+
+
 class TestCheck:
     def test_check_stale_without_build(self, runner, writable_project):
         result = runner.invoke(main, ["check", "--project", str(writable_project)])
@@ -120,6 +201,43 @@ class TestCheck:
         assert result.exit_code == 0
         assert "up to date" in result.output.lower()
 
+    def test_check_recursive(self, runner, sample_project, tmp_path):
+        for name in ("one", "two"):
+            shutil.copytree(sample_project / ".aictrl", tmp_path / name / ".aictrl")
+        runner.invoke(main, ["build", "--project", str(tmp_path / "one")])
+
+        result = runner.invoke(main, ["check", "--recursive", "--project", str(tmp_path), "--jobs", "1"])
+        assert result.exit_code == 1
+        assert "1 of 2 projects need attention" in result.output
+
+        runner.invoke(main, ["build", "--project", str(tmp_path / "two")])
+        result = runner.invoke(main, ["check", "-r", "--project", str(tmp_path), "--jobs", "1"])
+        assert result.exit_code == 0
+        assert "All 2 projects are up to date" in result.output
+
+
+class TestVerify:
+    def test_verify_after_build(self, runner, writable_project):
+        runner.invoke(main, ["build", "--project", str(writable_project)])
+        result = runner.invoke(main, ["verify", "--project", str(writable_project)])
+        assert result.exit_code == 0
+        assert "match the build manifest" in result.output
+
+    def test_verify_detects_hand_edit(self, runner, writable_project):
+        runner.invoke(main, ["build", "--project", str(writable_project)])
+        md = writable_project / ".claude" / "skills" / "code-review" / "code-review.md"
+        md.write_text(md.read_text() + "hand edit\n")
+
+        result = runner.invoke(main, ["verify", "--project", str(writable_project)])
+        assert result.exit_code == 1
+        assert "modified:" in result.output
+        assert "code-review.md" in result.output
+
+    def test_verify_without_build(self, runner, writable_project):
+        result = runner.invoke(main, ["verify", "--project", str(writable_project)])
+        assert result.exit_code == 1
+        assert "No build manifest" in result.output
+
 
 class TestClean:
     def test_clean_removes_output(self, runner, writable_project):
@@ -132,6 +250,13 @@ class TestClean:
         assert not (writable_project / ".claude").exists()
         assert not (writable_project / ".cursor").exists()
 
+    def test_clean_keeps_untracked_dir(self, runner, writable_project):
+        (writable_project / ".claude").mkdir()
+        result = runner.invoke(main, ["clean", "--project", str(writable_project)])
+        assert result.exit_code == 0
+        assert "no build manifest" in result.output
+        assert (writable_project / ".claude").exists()
+
     def test_clean_nothing_to_clean(self, runner, writable_project):
         result = runner.invoke(main, ["clean", "--project", str(writable_project)])
         assert result.exit_code == 0
@@ -171,6 +296,54 @@ class TestInit:
         assert "already exists" in result.output
 
 
+class TestPack:
+    def test_pack_then_build(self, runner, writable_project):
+        result = runner.invoke(main, ["pack", "--project", str(writable_project)])
+        assert result.exit_code == 0
+        assert "Packed 2 skills" in result.output
+
+        result = runner.invoke(main, ["build", "--project", str(writable_project)])
+        assert result.exit_code == 0
+        assert "Built 2 skills" in result.output
+
+    def test_unpack(self, runner, writable_project):
+        runner.invoke(main, ["pack", "--project", str(writable_project)])
+        result = runner.invoke(main, ["unpack", "--project", str(writable_project)])
+        assert result.exit_code == 0
+        assert "Unpacked 2 skills" in result.output
+        assert (writable_project / ".aictrl" / "data" / "skills" / "code-review.yaml").exists()
+
+    def test_unpack_without_pack(self, runner, writable_project):
+        result = runner.invoke(main, ["unpack", "--project", str(writable_project)])
+        assert result.exit_code == 1
+        assert "No skills.pack" in result.output
+
+
+class TestDaemon:
+    @pytest.fixture(autouse=True)
+    def sock_path(self, tmp_path, monkeypatch):
+        path = tmp_path / "d.sock"
+        monkeypatch.setenv("AICTRL_DAEMON_SOCKET", str(path))
+        return path
+
+    def test_status_without_daemon(self, runner):
+        result = runner.invoke(main, ["daemon", "status"])
+        assert result.exit_code == 1
+        assert "No daemon running" in result.output
+
+    def test_start_status_stop(self, runner):
+        result = runner.invoke(main, ["daemon", "start", "--idle-timeout", "60"])
+        assert result.exit_code == 0, result.output
+        assert "Daemon started" in result.output
+        try:
+            assert "already running" in runner.invoke(main, ["daemon", "start"]).output
+            status = runner.invoke(main, ["daemon", "status"])
+            assert status.exit_code == 0
+            assert "Daemon running" in status.output
+        finally:
+            assert "Daemon stopped" in runner.invoke(main, ["daemon", "stop"]).output
+
+
 class TestInstallHook:
     def test_install_hook_no_git(self, runner, tmp_path):
         result = runner.invoke(main, ["install-hook", "--project", str(tmp_path)])
@@ -183,10 +356,10 @@ class TestInstallHook:
         assert result.exit_code == 0
         assert "Installed" in result.output
 
-        hook = tmp_path / ".git" / "hooks" / "post-checkout"
-        assert hook.exists()
-        assert hook.stat().st_mode & 0o111
-        assert "aictrl" in hook.read_text()
+        for name in ("post-checkout", "post-merge", "post-rewrite"):
+            hook = tmp_path / ".git" / "hooks" / name
+            assert hook.stat().st_mode & 0o111
+            assert "aictrl-client build --if-changed" in hook.read_text()
 
     def test_install_hook_already_installed(self, runner, tmp_path):
         (tmp_path / ".git").mkdir()
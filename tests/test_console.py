@@ -0,0 +1,36 @@
+from rich.markup import escape as rich_escape
+
+from aictrl.console import Console, escape, strip_markup
+
+
+def test_escape_matches_rich():
+    for text in ["plain", "[red]x[/red]", "list[str]", "a\\[b]", "trailing\\", "[/] and [@click]"]:
+        assert escape(text) == rich_escape(text)
+
+
+def test_strip_markup():
+    assert strip_markup("[red]Error:[/red] bad") == "Error: bad"
+    assert strip_markup("[green]Built[/green] → 8 files") == "Built → 8 files"
+    assert strip_markup("not a tag: [1, 2]") == "not a tag: [1, 2]"
+
+
+def test_escaped_text_survives_stripping():
+    text = "key [sections] in a\\[b]"
+    assert strip_markup(f"[red]{escape(text)}[/red]") == text
+
+
+def test_plain_output_when_not_a_terminal(capsys):
+    console = Console()
+    console.print("[yellow]Skipped[/yellow] [dim]x[/dim]")
+    console.print("[kept]", markup=False, end="")
+    assert capsys.readouterr().out == "Skipped x\n[kept]"
+
+
+def test_plain_table(capsys):
+    Console().table("Skills", [("Skill", "cyan"), ("Version", "green")], [("a", "1.0"), ("longer", "2")])
+    assert capsys.readouterr().out.splitlines() == [
+        "Skills",
+        "Skill   Version",
+        "a       1.0",
+        "longer  2",
+    ]
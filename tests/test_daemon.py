@@ -0,0 +1,197 @@
+import os
+import shutil
+import socket
+import threading
+
+import pytest
+
+from aictrl import __version__, client
+from aictrl.client import DaemonUnavailable, request
+from aictrl.daemon import BuildDaemon
+
+
+@pytest.fixture
+def project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    return dst
+
+
+@pytest.fixture
+def sock_path(tmp_path, monkeypatch):
+    path = tmp_path / "d.sock"
+    monkeypatch.setenv(client.SOCKET_ENV, str(path))
+    return path
+
+
+@pytest.fixture
+def daemon(sock_path):
+    d = BuildDaemon(sock_path, idle_timeout=None)
+    d.bind()
+    thread = threading.Thread(target=d.serve)
+    thread.start()
+    yield d
+    d.stop()
+    thread.join(10)
+
+
+def _build(project, target=None):
+    return request({"op": "build", "project": str(project), "target": target})
+
+
+def test_ping(daemon):
+    response = request({"op": "ping"})
+    assert response["ok"]
+    assert response["projects"] == []
+
+
+def test_build_then_warm_rebuild(daemon, project):
+    first = _build(project)
+    assert first["ok"]
+    assert first["skills"] == 2
+    assert first["files"] == 8
+    assert (project / ".claude" / "skills" / "code-review" / "code-review.md").exists()
+
+    override = project / ".aictrl" / "overrides" / "skills" / "code-review.yaml"
+    override.write_text(override.read_text() + "description: Changed via daemon\n")
+    second = _build(project)
+    assert second["ok"]
+    assert second["reused"] > 0
+    assert "Changed via daemon" in (project / ".claude" / "skills" / "code-review" / "code-review.md").read_text()
+    assert request({"op": "ping"})["projects"] == [str(project)]
+
+
+def test_build_errors_are_reported(daemon, project, tmp_path):
+    missing = _build(tmp_path / "nowhere")
+    assert not missing["ok"]
+    assert "Config not found" in missing["error"]
+
+    (project / ".aictrl" / "data" / "skills" / "broken.yaml").write_text("name: [unclosed\n")
+    broken = _build(project)
+    assert not broken["ok"]
+    assert "broken.yaml" in broken["messages"][0]
+
+
+def test_yaml_and_template_errors_are_answered(daemon, project):
+    override = project / ".aictrl" / "overrides" / "skills" / "code-review.yaml"
+    override.write_text("description: [half typed\n")
+    bad_yaml = _build(project)
+    assert not bad_yaml["ok"]
+    assert bad_yaml["error"]
+
+    override.write_text("description: Fixed\n")
+    template = project / ".aictrl" / "templates" / "claude" / "skill.md.j2"
+    template.parent.mkdir(parents=True, exist_ok=True)
+    template.write_text("{% if %}\n")
+    assert not _build(project)["ok"]
+
+    template.unlink()
+    assert _build(project)["ok"]
+
+
+class TestSocketDir:
+    @pytest.fixture
+    def runtime_dir(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(client.SOCKET_ENV, raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+        return tmp_path / "run" / "aictrl"
+
+    def test_created_private(self, runtime_dir):
+        d = BuildDaemon(idle_timeout=None)
+        d.bind()
+        try:
+            assert os.stat(runtime_dir).st_mode & 0o777 == 0o700
+            assert os.stat(d.path).st_mode & 0o777 == 0o600
+        finally:
+            d.close()
+
+    def test_shared_dir_is_refused(self, runtime_dir, project):
+        runtime_dir.mkdir(parents=True, mode=0o755)
+        os.chmod(runtime_dir, 0o755)
+        with pytest.raises(RuntimeError, match="not a private directory"):
+            BuildDaemon(idle_timeout=None).bind()
+        with pytest.raises(DaemonUnavailable, match="not a private directory"):
+            request({"op": "ping"})
+        # The client builds in-process instead.
+        assert client.main(["build", "--project", str(project)]) == 0
+        assert (project / ".claude" / "settings.json").exists()
+
+    def test_symlinked_dir_is_refused(self, runtime_dir, tmp_path):
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir(mode=0o700)
+        runtime_dir.parent.mkdir()
+        runtime_dir.symlink_to(elsewhere)
+        with pytest.raises(RuntimeError, match="not a private directory"):
+            BuildDaemon(idle_timeout=None).bind()
+
+
+def test_other_release_is_told_to_go_away(daemon):
+    with pytest.raises(DaemonUnavailable, match="daemon runs aictrl"):
+        request({"op": "ping", "version": "0.0.0-other"})
+
+
+def test_stale_socket_is_replaced(sock_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(sock_path))
+    stale.close()
+
+    d = BuildDaemon(sock_path, idle_timeout=None)
+    d.bind()
+    d.close()
+    assert not sock_path.exists()
+
+
+def test_second_daemon_refuses_to_start(daemon, sock_path):
+    with pytest.raises(RuntimeError, match="already listening"):
+        BuildDaemon(sock_path).bind()
+
+
+def test_idle_daemon_exits(sock_path):
+    d = BuildDaemon(sock_path, idle_timeout=0.1)
+    thread = threading.Thread(target=d.serve)
+    thread.start()
+    thread.join(10)
+    assert not thread.is_alive()
+    assert not sock_path.exists()
+
+
+def test_flushes_spooled_telemetry(sock_path, telemetry_spool, monkeypatch):
+    flushed = threading.Event()
+    monkeypatch.setattr("aictrl.daemon.flush", flushed.set)
+    telemetry_spool.parent.mkdir(parents=True)
+    telemetry_spool.write_text('{"skillName": "x"}\n')
+
+    d = BuildDaemon(sock_path, idle_timeout=None)
+    thread = threading.Thread(target=d.serve)
+    thread.start()
+    try:
+        assert flushed.wait(10)
+    finally:
+        d.stop()
+        thread.join(10)
+
+
+class TestClient:
+    def test_builds_through_daemon(self, daemon, project, capsys):
+        assert client.main(["build", "--project", str(project)]) == 0
+        assert "Built 2 skills → 8 files" in capsys.readouterr().out
+        assert request({"op": "ping"})["projects"] == [str(project)]
+
+    def test_falls_back_without_daemon(self, sock_path, project, capsys):
+        assert client.main(["build", "--project", str(project), "--target", "claude"]) == 0
+        assert "Built 2 skills" in capsys.readouterr().out
+        assert (project / ".claude" / "settings.json").exists()
+        assert not (project / ".cursor").exists()
+
+    def test_falls_back_on_version_mismatch(self, daemon, project, monkeypatch):
+        monkeypatch.setattr(client, "__version__", __version__ + ".dev")
+        assert client.main(["build", "--project", str(project)]) == 0
+        assert (project / ".claude" / "settings.json").exists()
+
+    def test_reports_daemon_errors(self, daemon, tmp_path, capsys):
+        assert client.main(["build", "--project", str(tmp_path)]) == 1
+        assert "Config not found" in capsys.readouterr().out
+
+    def test_usage(self, capsys):
+        assert client.main([]) == 2
+        assert client.main(["build", "--bogus", "x"]) == 2
@@ -0,0 +1,113 @@
+import os
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from aictrl import fingerprints
+from aictrl.cli import main
+from aictrl.fingerprints import quick_check
+
+
+@pytest.fixture
+def built_project(sample_project, tmp_path):
+    """A built copy of the fixture whose inputs are old enough to trust by stat."""
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    _age_tree(dst / ".aictrl")
+    result = CliRunner().invoke(main, ["build", "--project", str(dst)])
+    assert result.exit_code == 0
+    return dst
+
+
+def _age_tree(root, seconds=60):
+    for path in root.rglob("*"):
+        if path.is_file():
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _skill_path(project, slug):
+    return project / ".aictrl" / "data" / "skills" / f"{slug}.yaml"
+
+
+def test_no_record_needs_full_check(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    assert quick_check(dst) is None
+
+
+def test_unchanged_is_fresh(built_project):
+    assert quick_check(built_project) is False
+
+
+def test_recently_written_inputs_are_reparsed(sample_project, tmp_path, monkeypatch):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    _age_tree(dst / ".aictrl")
+    path = _skill_path(dst, "testing-guide")
+    path.write_text(path.read_text())
+    CliRunner().invoke(main, ["build", "--project", str(dst)])
+
+    parsed = []
+    real_load = fingerprints.load_skill_files
+
+    def spy(paths, **kwargs):
+        parsed.extend(p.name for p in paths)
+        return real_load(paths, **kwargs)
+
+    monkeypatch.setattr(fingerprints, "load_skill_files", spy)
+    # The file was modified within the racy window of the recorded
+    # snapshot, so its stat data alone is not trusted.
+    assert quick_check(dst) is False
+    assert parsed == ["testing-guide.yaml"]
+
+
+def test_cosmetic_skill_edit_is_fresh(built_project):
+    path = _skill_path(built_project, "testing-guide")
+    path.write_text("# a comment\n" + path.read_text())
+    assert quick_check(built_project) is False
+
+
+def test_skill_content_change_is_stale(built_project):
+    path = _skill_path(built_project, "testing-guide")
+    path.write_text(path.read_text().replace("Vitest for unit tests", "Jest for unit tests"))
+    assert quick_check(built_project) is True
+
+
+def test_skill_added_is_stale(built_project):
+    _skill_path(built_project, "new-skill").write_text("slug: new-skill\n")
+    assert quick_check(built_project) is True
+
+
+def test_skill_removed_is_stale(built_project):
+    _skill_path(built_project, "testing-guide").unlink()
+    assert quick_check(built_project) is True
+
+
+@pytest.mark.parametrize("relpath", [
+    ".aictrl/overrides/skills/code-review.yaml",
+    ".aictrl/data/org.yaml",
+    ".aictrl/skills.lock",
+])
+def test_other_inputs_need_full_check(built_project, relpath):
+    path = built_project / relpath
+    path.write_text(path.read_text() + "\n")
+    assert quick_check(built_project) is None
+
+
+def test_local_template_added_needs_full_check(built_project):
+    templates = built_project / ".aictrl" / "templates" / "claude"
+    templates.mkdir(parents=True)
+    (templates / "skill.md.j2").write_text("{{ skill.instructions }}\n")
+    assert quick_check(built_project) is None
+
+
+def test_check_fast_path_skips_loading(built_project, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("full check should not run")
+
+    monkeypatch.setattr("aictrl.fingerprints.load_skill_sources", fail)
+    result = CliRunner().invoke(main, ["check", "--project", str(built_project)])
+    assert result.exit_code == 0
+    assert "up to date" in result.output.lower()
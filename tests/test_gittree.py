@@ -0,0 +1,151 @@
+import shutil
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+from aictrl import gittree
+from aictrl.build import build_project
+from aictrl.cli import main
+from aictrl.client import main as client_main
+from aictrl.config import load_config, load_org
+from aictrl.gittree import built_from_head, head_tree, is_clean
+
+
+def _git(root, *args):
+    subprocess.run(
+        ["git", "-C", str(root), "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        check=True, capture_output=True,
+    )
+
+
+def _commit(root, message="update"):
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(sample_project, tmp_path):
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    dst = tmp_path / "repo"
+    shutil.copytree(sample_project, dst)
+    _git(dst, "init", "-q")
+    _commit(dst, "initial")
+    return dst
+
+
+def _build(root, target_names=None):
+    return build_project(root, load_config(root), load_org(root), target_names=target_names, jobs=1)
+
+
+def test_head_tree(repo, tmp_path):
+    assert head_tree(repo) is not None
+    assert head_tree(tmp_path) is None
+
+
+def test_build_records_tree(repo):
+    assert not built_from_head(repo)
+    _build(repo)
+    assert built_from_head(repo)
+    assert built_from_head(repo, ["claude"])
+
+
+def test_commit_touching_aictrl_invalidates(repo):
+    _build(repo)
+    skill = repo / ".aictrl" / "data" / "skills" / "code-review.yaml"
+    skill.write_text(skill.read_text().replace('version: "1.2.3"', 'version: "1.2.4"'))
+    _commit(repo)
+    assert not built_from_head(repo)
+
+
+def test_commit_elsewhere_keeps_record(repo):
+    _build(repo)
+    (repo / "README.md").write_text("unrelated\n")
+    _git(repo, "add", "README.md")
+    _git(repo, "commit", "-q", "-m", "docs")
+    assert built_from_head(repo)
+
+
+def test_dirty_build_is_not_recorded(repo):
+    _build(repo)
+    skill = repo / ".aictrl" / "data" / "skills" / "code-review.yaml"
+    skill.write_text(skill.read_text().replace('version: "1.2.3"', 'version: "1.2.4"'))
+    assert not is_clean(repo)
+    _build(repo)
+    # The outputs now match the edit, not HEAD: a checkout back must rebuild.
+    assert not built_from_head(repo)
+
+
+def test_other_target_or_release_or_missing_output(repo, monkeypatch):
+    _build(repo, ["claude"])
+    assert built_from_head(repo, ["claude"])
+    assert not built_from_head(repo, ["cursor"])
+
+    monkeypatch.setattr(gittree, "__version__", "0.0.0")
+    assert not built_from_head(repo)
+    monkeypatch.undo()
+
+    shutil.rmtree(repo / ".claude")
+    assert not built_from_head(repo)
+
+
+def test_target_build_keeps_other_targets_stale(repo):
+    _build(repo)
+    skill = repo / ".aictrl" / "data" / "skills" / "testing-guide.yaml"
+    skill.write_text(skill.read_text().replace('version: "2.0.1"', 'version: "2.0.2"'))
+    _commit(repo)
+
+    _build(repo, ["cursor"])
+    assert built_from_head(repo, ["cursor"])
+    # .claude/ was built from the previous commit: the default targets are not up to date.
+    assert not built_from_head(repo, ["claude"])
+    assert not built_from_head(repo)
+
+    _build(repo, ["claude"])
+    assert built_from_head(repo)
+
+
+def test_cli_target_then_if_changed(repo):
+    runner = CliRunner()
+    runner.invoke(main, ["build", "--project", str(repo)])
+    skill = repo / ".aictrl" / "data" / "skills" / "testing-guide.yaml"
+    skill.write_text(skill.read_text().replace('"Comprehensive', '"Revised. Comprehensive'))
+    _commit(repo)
+
+    runner.invoke(main, ["build", "--target", "cursor", "--project", str(repo)])
+    result = runner.invoke(main, ["build", "--if-changed", "--project", str(repo)])
+    assert result.exit_code == 0, result.output
+    assert "Up to date" not in result.output
+    assert "Revised." in (repo / ".claude" / "skills" / "testing-guide" / "testing-guide.md").read_text()
+
+
+def test_cli_if_changed(repo):
+    runner = CliRunner()
+    result = runner.invoke(main, ["build", "--if-changed", "--project", str(repo)])
+    assert result.exit_code == 0, result.output
+    assert "Built" in result.output
+
+    result = runner.invoke(main, ["build", "--if-changed", "--project", str(repo)])
+    assert result.exit_code == 0
+    assert "Up to date" in result.output
+
+
+def test_cli_if_changed_recursive(repo):
+    runner = CliRunner()
+    runner.invoke(main, ["build", "--project", str(repo)])
+    result = runner.invoke(main, ["build", "-r", "--if-changed", "--project", str(repo)])
+    assert result.exit_code == 0
+    assert "1 of 1 projects unchanged" in result.output
+
+
+def test_client_if_changed_skips_daemon(repo, monkeypatch, capsys):
+    _build(repo)
+
+    def no_daemon(*args, **kwargs):
+        raise AssertionError("contacted the daemon")
+
+    monkeypatch.setattr("aictrl.client.request", no_daemon)
+    assert client_main(["build", "--if-changed", "--project", str(repo)]) == 0
+    assert capsys.readouterr().out == ""
+
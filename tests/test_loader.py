@@ -1,4 +1,13 @@
-from aictrl.loader import load_skills, load_skill, SkillData
+import dataclasses
+
+import pytest
+
+from aictrl.loader import load_skills, load_skill, SkillLoadError
+
+
+def _write_skill(skills_dir, slug, **fields):
+    lines = [f"slug: {slug}"] + [f"{k}: {v}" for k, v in fields.items()]
+    (skills_dir / f"{slug}.yaml").write_text("\n".join(lines) + "\n")
 
 
 def test_load_skills_returns_all_skills(sample_project):
@@ -55,3 +64,88 @@ def test_load_skills_sorted(sample_project):
     skills = load_skills(sample_project)
     slugs = [s.slug for s in skills]
     assert slugs == sorted(slugs)
+
+
+def test_load_skills_parallel_matches_serial(tmp_path):
+    skills_dir = tmp_path / ".aictrl" / "data" / "skills"
+    skills_dir.mkdir(parents=True)
+    for i in range(12):
+        _write_skill(skills_dir, f"skill-{i:02d}", version=f'"1.{i}"')
+
+    serial = load_skills(tmp_path, jobs=1)
+    parallel = load_skills(tmp_path, jobs=3)
+
+    assert [s.slug for s in parallel] == [f"skill-{i:02d}" for i in range(12)]
+    assert parallel == serial
+
+
+def test_load_skills_collects_all_errors(tmp_path):
+    skills_dir = tmp_path / ".aictrl" / "data" / "skills"
+    skills_dir.mkdir(parents=True)
+    _write_skill(skills_dir, "good")
+    (skills_dir / "empty.yaml").write_text("")
+    (skills_dir / "no-slug.yaml").write_text("name: x\n")
+    (skills_dir / "broken.yaml").write_text("slug: [unclosed\n")
+
+    for jobs in (1, 2):
+        with pytest.raises(SkillLoadError) as exc_info:
+            load_skills(tmp_path, jobs=jobs)
+
+        failed = [path.name for path, _ in exc_info.value.errors]
+        assert failed == ["broken.yaml", "empty.yaml", "no-slug.yaml"]
+        assert "Empty skill file" in str(exc_info.value)
+        assert "missing 'slug'" in str(exc_info.value)
+
+
+def test_load_skills_external_content_file(tmp_path):
+    skills_dir = tmp_path / ".aictrl" / "data" / "skills"
+    skills_dir.mkdir(parents=True)
+    (skills_dir / "docs.yaml").write_text(
+        "slug: docs\n"
+        "content_files:\n"
+        "  inline.md: hello\n"
+        "  reference.md:\n"
+        "    source: references/docs/reference.md\n"
+    )
+
+    [skill] = load_skills(tmp_path)
+    assert skill.content_files == {
+        "inline.md": "hello",
+        "reference.md": {"source": "references/docs/reference.md"},
+    }
+
+
+@pytest.mark.parametrize("entry", [
+    "ref.md: {source: ../secrets.txt}", "ref.md: {source: /etc/passwd}", "ref.md: {path: x}", "ref.md: [a, b]",
+    "../ref.md: inline", "/ref.md: inline",
+])
+def test_load_skills_rejects_bad_content_file_source(tmp_path, entry):
+    skills_dir = tmp_path / ".aictrl" / "data" / "skills"
+    skills_dir.mkdir(parents=True)
+    (skills_dir / "docs.yaml").write_text(f"slug: docs\ncontent_files:\n  {entry}\n")
+
+    with pytest.raises(SkillLoadError) as exc_info:
+        load_skills(tmp_path)
+    assert "ref.md']" in str(exc_info.value)
+
+
+def test_skill_data_is_frozen_and_slotted(sample_project):
+    skill = load_skills(sample_project)[0]
+    assert not hasattr(skill, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        skill.version = "9.9.9"
+
+
+def test_repeated_strings_are_interned(sample_project):
+    cr, tg = load_skills(sample_project)
+    cr_quality = cr.tags[cr.tags.index("quality")]
+    tg_quality = tg.tags[tg.tags.index("quality")]
+    assert cr_quality is tg_quality
+    assert next(iter(cr.metadata)) is next(iter(tg.metadata))
+
+
+def test_as_dict_is_shallow(sample_project):
+    skill = load_skills(sample_project)[0]
+    view = skill.as_dict()
+    assert view == dataclasses.asdict(skill)
+    assert view["sections"] is skill.sections
@@ -1,16 +1,21 @@
+import yaml
+
+from aictrl.hashing import compute_skill_hashes
 from aictrl.loader import SkillData, load_skills
 from aictrl.lockfile import (
+    LEGACY_HASH_ALGORITHM,
     compute_skill_hash,
+    legacy_skill_hash,
     read_lockfile,
     write_lockfile,
     is_stale,
 )
 
 
-def _make_skill(slug="test", version="1.0", instructions="do things"):
+def _make_skill(slug="test", version="1.0", instructions="do things", **fields):
     return SkillData(
         slug=slug, name=slug, description=f"Test {slug}",
-        version=version, instructions=instructions,
+        version=version, instructions=instructions, **fields,
     )
 
 
@@ -30,6 +35,34 @@ class TestComputeHash:
         s2 = _make_skill(instructions="b")
         assert compute_skill_hash(s1) != compute_skill_hash(s2)
 
+    def test_covers_content_files_and_file_structure(self):
+        base = _make_skill()
+        assert compute_skill_hash(base) != compute_skill_hash(_make_skill(content_files={"a.md": "x"}))
+        assert compute_skill_hash(base) != compute_skill_hash(_make_skill(file_structure={"dirs": ["src"]}))
+
+    def test_independent_of_key_order(self):
+        s1 = _make_skill(sections={"a": "1", "b": "2"}, metadata={"x": "1", "y": "2"})
+        s2 = _make_skill(sections={"b": "2", "a": "1"}, metadata={"y": "2", "x": "1"})
+        assert compute_skill_hash(s1) == compute_skill_hash(s2)
+
+    def test_distinguishes_types_and_boundaries(self):
+        assert compute_skill_hash(_make_skill(tags=["ab", "c"])) != compute_skill_hash(_make_skill(tags=["a", "bc"]))
+        assert compute_skill_hash(_make_skill(metadata={"n": 1})) != compute_skill_hash(_make_skill(metadata={"n": "1"}))
+
+    def test_external_content_file_hashed_by_content(self, tmp_path):
+        (tmp_path / "ref.md").write_text("one")
+        skill = _make_skill(content_files={"ref.md": {"source": "ref.md"}})
+        before = compute_skill_hash(skill, tmp_path)
+
+        (tmp_path / "ref.md").write_text("two")
+        assert compute_skill_hash(skill, tmp_path) != before
+        # Without a data dir only the reference is hashed
+        assert compute_skill_hash(skill) == compute_skill_hash(skill)
+
+    def test_hashes_by_slug(self):
+        skills = [_make_skill("a"), _make_skill("b")]
+        assert compute_skill_hashes(skills) == {s.slug: compute_skill_hash(s) for s in skills}
+
 
 class TestReadWriteLockfile:
     def test_write_and_read(self, tmp_path):
@@ -43,7 +76,8 @@ class TestReadWriteLockfile:
         lock = read_lockfile(tmp_path)
 
         assert lock is not None
-        assert lock.version == 1
+        assert lock.version == 2
+        assert lock.hash_algorithm == "blake2b-256"
         assert len(lock.skills) == 2
         assert lock.skills[0].slug == "alpha"
         assert lock.skills[1].slug == "beta"
@@ -110,6 +144,37 @@ class TestIsStale:
         updated = [_make_skill("a")]
         assert is_stale(tmp_path, updated) is True
 
+    def test_v1_lockfile_migrates_transparently(self, tmp_path):
+        aictrl_dir = tmp_path / ".aictrl"
+        aictrl_dir.mkdir()
+        skills = [_make_skill("a"), _make_skill("b", instructions="other")]
+        v1 = {
+            "version": 1,
+            "skills": [
+                {"slug": s.slug, "version": s.version, "content_hash": legacy_skill_hash(s)}
+                for s in skills
+            ],
+        }
+        (aictrl_dir / "skills.lock").write_text(yaml.dump(v1))
+
+        lock = read_lockfile(tmp_path)
+        assert lock.version == 1
+        assert lock.hash_algorithm == LEGACY_HASH_ALGORITHM
+        assert is_stale(tmp_path, skills) is False
+        assert is_stale(tmp_path, [skills[0], _make_skill("b", instructions="changed")]) is True
+
+        write_lockfile(tmp_path, skills)
+        assert read_lockfile(tmp_path).version == 2
+        assert is_stale(tmp_path, skills) is False
+
+    def test_precomputed_hashes(self, tmp_path):
+        aictrl_dir = tmp_path / ".aictrl"
+        aictrl_dir.mkdir()
+        skills = [_make_skill("a")]
+        hashes = compute_skill_hashes(skills)
+        write_lockfile(tmp_path, skills, hashes=hashes)
+        assert is_stale(tmp_path, skills, hashes=hashes) is False
+
     def test_with_fixture_data(self, sample_project, tmp_path):
         import shutil
         # Copy the fixture to a writable location
@@ -0,0 +1,88 @@
+import pytest
+
+from aictrl.manifest import (
+    Manifest,
+    ManifestEntry,
+    UnitRecord,
+    build_manifests,
+    hash_file,
+    read_manifest,
+    verify_outputs,
+    write_manifest,
+)
+from aictrl.renderer import write_output_files
+from aictrl.targets.base import OutputFile
+
+
+@pytest.fixture
+def files():
+    return [
+        OutputFile(path=".claude/skills/a/a.md", content="alpha\n"),
+        OutputFile(path=".claude/hooks/run.sh", content="#!/bin/sh\n", executable=True),
+        OutputFile(path=".cursor/hooks.json", content="{}\n"),
+    ]
+
+
+def test_manifest_per_target_dir(files, tmp_path):
+    manifests = build_manifests(files, tmp_path)
+    assert set(manifests) == {".claude", ".cursor"}
+    assert manifests[".claude"][".claude/hooks/run.sh"].executable is True
+    assert manifests[".cursor"][".cursor/hooks.json"].size == 3
+
+
+def test_hash_matches_written_file(files, tmp_path):
+    write_output_files(files, tmp_path)
+    entry = read_manifest(tmp_path, ".claude").files[".claude/skills/a/a.md"]
+    assert hash_file(tmp_path / ".claude/skills/a/a.md") == (entry.size, entry.hash)
+
+
+def test_round_trip(tmp_path):
+    manifest = Manifest(
+        files={".claude/x.md": ManifestEntry(size=1, hash="ab", executable=False, unit="skill:x")},
+        units={"skill:x": UnitRecord(key="k1", inputs={"skill": "x@ab", "templates": {"t.j2": "cd"}})},
+    )
+    write_manifest(tmp_path, ".claude", manifest)
+    assert read_manifest(tmp_path, ".claude") == manifest
+
+
+def test_reads_format_1(tmp_path):
+    (tmp_path / ".claude").mkdir()
+    (tmp_path / ".claude" / ".aictrl-manifest.json").write_text(
+        '{"format": 1, "hash_algorithm": "blake2b-256",'
+        ' "files": {".claude/x.md": {"size": 1, "hash": "ab", "executable": false}}}'
+    )
+    manifest = read_manifest(tmp_path, ".claude")
+    assert manifest.files[".claude/x.md"].unit is None
+    assert manifest.units == {}
+
+
+def test_read_missing_or_corrupt(tmp_path):
+    assert read_manifest(tmp_path, ".claude") is None
+    (tmp_path / ".claude").mkdir()
+    (tmp_path / ".claude" / ".aictrl-manifest.json").write_text("{not json")
+    assert read_manifest(tmp_path, ".claude") is None
+
+
+class TestVerify:
+    def _manifests(self, tmp_path):
+        return {d: read_manifest(tmp_path, d).files for d in (".claude", ".cursor")}
+
+    def test_clean_output(self, files, tmp_path):
+        write_output_files(files, tmp_path)
+        result = verify_outputs(tmp_path, self._manifests(tmp_path))
+        assert result.ok
+        assert result.checked == 3
+
+    def test_same_size_edit_detected(self, files, tmp_path):
+        write_output_files(files, tmp_path)
+        (tmp_path / ".claude/skills/a/a.md").write_text("ALPHA\n")
+        result = verify_outputs(tmp_path, self._manifests(tmp_path))
+        assert result.modified == [".claude/skills/a/a.md"]
+
+    def test_missing_and_mode_drift(self, files, tmp_path):
+        write_output_files(files, tmp_path)
+        (tmp_path / ".cursor/hooks.json").unlink()
+        (tmp_path / ".claude/hooks/run.sh").chmod(0o644)
+        result = verify_outputs(tmp_path, self._manifests(tmp_path), jobs=2)
+        assert result.missing == [".cursor/hooks.json"]
+        assert result.modified == [".claude/hooks/run.sh"]
@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from aictrl import materialize
+from aictrl.materialize import materialize_file
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = tmp_path / "src.md"
+    path.write_bytes(b"reference doc\n" * 1000)
+    return path
+
+
+def test_copies_contents(src, tmp_path):
+    dst = tmp_path / "out.md"
+    method = materialize_file(src, dst)
+    assert method in {"reflink", "copy_file_range", "stream"}
+    assert dst.read_bytes() == src.read_bytes()
+    assert not os.path.samefile(src, dst)
+
+
+def test_replaces_instead_of_writing_through(src, tmp_path):
+    dst = tmp_path / "out.md"
+    os.link(src, dst)
+    src_before = src.read_bytes()
+
+    other = tmp_path / "other.md"
+    other.write_text("new\n")
+    materialize_file(other, dst)
+
+    assert dst.read_text() == "new\n"
+    assert src.read_bytes() == src_before
+
+
+def test_hardlink_when_requested(src, tmp_path):
+    dst = tmp_path / "out.md"
+    assert materialize_file(src, dst, hardlink=True) == "hardlink"
+    assert os.path.samefile(src, dst)
+
+
+def test_stream_fallback(src, tmp_path, monkeypatch):
+    monkeypatch.setattr(materialize, "_clone", lambda fsrc, fdst: None)
+    monkeypatch.setattr(materialize, "_copy_range", lambda fsrc, fdst: None)
+
+    dst = tmp_path / "out.md"
+    assert materialize_file(src, dst) == "stream"
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_preserves_executable_bit(tmp_path):
+    script = tmp_path / "run.sh"
+    script.write_text("#!/bin/sh\necho hi\n")
+    script.chmod(0o755)
+
+    dst = tmp_path / "out.sh"
+    materialize_file(script, dst)
+    assert dst.stat().st_mode & 0o111
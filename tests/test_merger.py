@@ -1,7 +1,28 @@
+import shutil
+
 import pytest
 
 from aictrl.loader import SkillData, load_skills
-from aictrl.merger import deep_merge, load_overrides, merge_overrides
+from aictrl.merger import deep_merge, load_overrides, load_selector_overrides, merge_overrides
+from aictrl.skill_index import Selector, SkillIndex, parse_selector
+
+
+@pytest.fixture
+def project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    return dst
+
+
+def _write_override(project, name, text):
+    (project / ".aictrl" / "overrides" / "skills" / f"{name}.yaml").write_text(text)
+
+
+def _skill(slug, tags=(), **metadata):
+    return SkillData(
+        slug=slug, name=slug, description="", version="1.0", instructions="",
+        tags=list(tags), metadata=metadata,
+    )
 
 
 class TestDeepMerge:
@@ -54,6 +75,34 @@ class TestDeepMerge:
         result = deep_merge(base, override)
         assert result == {"a": 1, "b": 2}
 
+    def test_nested_delete(self):
+        base = {"sections": {"a": "1", "b": "2"}}
+        override = {"sections": {"_delete": ["a"], "c": "3"}}
+        result = deep_merge(base, override)
+        assert result["sections"] == {"b": "2", "c": "3"}
+        assert base["sections"] == {"a": "1", "b": "2"}
+
+    def test_untouched_values_are_shared(self):
+        base = {"sections": {"big": "x" * 1000}, "content_files": {"a.md": "a"}, "tags": ["t"]}
+        override = {"sections": {"extra": "y"}}
+        result = deep_merge(base, override)
+        assert result["content_files"] is base["content_files"]
+        assert result["tags"] is base["tags"]
+        assert result["sections"] is not base["sections"]
+
+    def test_very_deep_nesting(self):
+        depth = 5000
+        base = override = None
+        for i in range(depth):
+            base = {"n": base, "keep": i}
+            override = {"n": override} if override is not None else {"n": {"leaf": True}}
+        result = deep_merge(base, override)
+
+        node = result
+        for _ in range(depth - 1):
+            node = node["n"]
+        assert node["n"] == {"leaf": True}
+
 
 class TestLoadOverrides:
     def test_load_overrides(self, sample_project):
@@ -103,6 +152,16 @@ class TestMergeOverrides:
         assert tg.allowed_tools == ["Bash", "Read", "Write"]
         assert tg.version == "2.0.1"
 
+    def test_merge_shares_untouched_fields(self, sample_project):
+        skills = load_skills(sample_project)
+        merged = merge_overrides(skills, sample_project)
+
+        before = next(s for s in skills if s.slug == "code-review")
+        after = next(s for s in merged if s.slug == "code-review")
+        assert after.instructions is before.instructions
+        assert after.sections["examples"] is before.sections["examples"]
+        assert after.sections is not before.sections
+
     def test_merge_no_overrides(self, tmp_path):
         skill = SkillData(
             slug="test", name="test", description="d", version="1.0", instructions="i"
@@ -110,3 +169,98 @@ class TestMergeOverrides:
         result = merge_overrides([skill], tmp_path)
         assert len(result) == 1
         assert result[0].slug == "test"
+
+    @pytest.mark.parametrize("entry", [
+        "x.md: {source: ../../../../etc/hostname}",
+        "x.md: {mode: x}",
+        "../escape.md: inline",
+    ])
+    def test_override_content_files_are_validated(self, project, entry):
+        _write_override(project, "code-review", f"content_files:\n  {entry}\n")
+        with pytest.raises(ValueError, match=r"content_files\[.*code-review\.yaml"):
+            merge_overrides(load_skills(project), project)
+
+    def test_unknown_override_field_rejected(self, project):
+        _write_override(project, "code-review", "descripton: typo\n")
+        with pytest.raises(ValueError, match=r"Unknown skill fields \['descripton'\]: .*code-review\.yaml"):
+            merge_overrides(load_skills(project), project)
+
+    def test_override_must_be_mapping(self, project):
+        _write_override(project, "code-review", "- a list\n")
+        with pytest.raises(ValueError, match="must contain a mapping"):
+            merge_overrides(load_skills(project), project)
+
+    def test_override_can_extend_content_file(self, project):
+        _write_override(project, "code-review", "content_files:\n  x.md: inline text\n")
+        merged = {s.slug: s for s in merge_overrides(load_skills(project), project)}
+        assert merged["code-review"].content_files["x.md"] == "inline text"
+
+
+class TestSkillIndex:
+    @pytest.fixture
+    def index(self):
+        return SkillIndex([
+            _skill("api-auth", tags=["backend", "security"], stack="api"),
+            _skill("api-users", tags=["backend"], stack="api,db"),
+            _skill("ui-forms", tags=["frontend"], stack="ui"),
+        ])
+
+    def test_empty_selector_matches_all(self, index):
+        assert index.resolve(Selector()) == {0, 1, 2}
+
+    def test_tags_any_of(self, index):
+        assert index.resolve(Selector(tags=["security", "frontend"])) == {0, 2}
+
+    def test_slug_exact_and_glob(self, index):
+        assert index.resolve(Selector(slugs=["ui-forms"])) == {2}
+        assert index.resolve(Selector(slugs=["api-*"])) == {0, 1}
+
+    def test_metadata_matches_comma_separated_items(self, index):
+        assert index.resolve(Selector(metadata={"stack": ["db"]})) == {1}
+        assert index.resolve(Selector(metadata={"stack": ["api"]})) == {0, 1}
+
+    def test_criteria_are_anded(self, index):
+        assert index.resolve(Selector(tags=["backend"], metadata={"stack": ["db"]})) == {1}
+        assert index.resolve(Selector(tags=["frontend"], slugs=["api-*"])) == set()
+
+
+class TestParseSelector:
+    def test_scalars_become_lists(self, tmp_path):
+        selector = parse_selector({"tags": "backend", "metadata": {"stack": "api"}}, tmp_path)
+        assert selector == Selector(tags=["backend"], metadata={"stack": ["api"]})
+
+    def test_unknown_key_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown '_select' keys"):
+            parse_selector({"owner": "me"}, tmp_path)
+
+
+class TestSelectorOverrides:
+    def test_selector_files_excluded_from_slug_overrides(self, project):
+        _write_override(project, "quality-policy", "_select:\n  tags: [quality]\nallowed_tools: [Read]\n")
+
+        assert set(load_overrides(project)) == {"code-review"}
+        [(selector, body)] = load_selector_overrides(project)
+        assert selector.tags == ["quality"]
+        assert body == {"allowed_tools": ["Read"]}
+
+    def test_selector_applies_to_all_matches(self, project):
+        _write_override(project, "quality-policy", "_select:\n  tags: [quality]\nmetadata:\n  policy: strict\n")
+
+        merged = merge_overrides(load_skills(project), project)
+        assert all(s.metadata["policy"] == "strict" for s in merged)
+
+    def test_slug_override_wins_over_selector(self, project):
+        _write_override(project, "all-tools", "_select: {}\nallowed_tools: [Read]\n")
+
+        merged = {s.slug: s for s in merge_overrides(load_skills(project), project)}
+        assert merged["testing-guide"].allowed_tools == ["Read"]
+        # code-review.yaml is applied after the selector
+        assert merged["code-review"].allowed_tools == ["Bash", "Read", "Grep", "Edit"]
+
+    def test_selectors_apply_in_filename_order(self, project):
+        _write_override(project, "a-first", "_select:\n  slugs: [testing-*]\nversion: '1'\n")
+        _write_override(project, "b-second", "_select:\n  metadata: {stack: test}\nversion: '2'\n")
+
+        merged = {s.slug: s for s in merge_overrides(load_skills(project), project)}
+        assert merged["testing-guide"].version == "2"
+        assert merged["code-review"].version == "1.2.3"
@@ -0,0 +1,96 @@
+import shutil
+import subprocess
+
+import pytest
+
+from aictrl.monorepo import build_projects, check_projects, find_projects
+
+
+@pytest.fixture
+def monorepo(sample_project, tmp_path):
+    """Three projects: packages/a, packages/b/c and an ignored one under build/."""
+    root = tmp_path / "repo"
+    for rel in ("packages/a", "packages/b/c", "build/generated"):
+        shutil.copytree(sample_project / ".aictrl", root / rel / ".aictrl")
+    (root / ".gitignore").write_text("build/\n")
+    return root
+
+
+def _git_init(root):
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    subprocess.run(["git", "init", "-q", str(root)], check=True)
+
+
+class TestFindProjects:
+    def test_git_respects_gitignore(self, monorepo):
+        _git_init(monorepo)
+        assert find_projects(monorepo) == [monorepo / "packages" / "a", monorepo / "packages" / "b" / "c"]
+
+    def test_git_finds_root_project(self, monorepo, sample_project):
+        _git_init(monorepo)
+        shutil.copytree(sample_project / ".aictrl", monorepo / ".aictrl")
+        assert find_projects(monorepo)[0] == monorepo
+
+    def test_walk_without_git(self, monorepo):
+        (monorepo / "node_modules" / "x").mkdir(parents=True)
+        shutil.copytree(monorepo / "packages" / "a" / ".aictrl", monorepo / "node_modules" / "x" / ".aictrl")
+        assert find_projects(monorepo) == [
+            monorepo / "build" / "generated",
+            monorepo / "packages" / "a",
+            monorepo / "packages" / "b" / "c",
+        ]
+
+    def test_nothing_found(self, tmp_path):
+        assert find_projects(tmp_path) == []
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_build_projects(monorepo, jobs):
+    projects = [monorepo / "packages" / "a", monorepo / "packages" / "b" / "c"]
+    results = build_projects(projects, jobs=jobs)
+    assert [r.project for r in results] == projects
+    assert all(r.ok and r.skills == 2 and r.files == 8 and r.written == 8 for r in results)
+    for project in projects:
+        assert (project / ".claude" / "settings.json").exists()
+
+    again = build_projects(projects, jobs=jobs)
+    assert [r.written for r in again] == [0, 0]
+
+
+def test_failure_is_isolated(monorepo):
+    good, bad = monorepo / "packages" / "a", monorepo / "packages" / "b" / "c"
+    (bad / ".aictrl" / "data" / "skills" / "broken.yaml").write_text("name: [unclosed\n")
+
+    results = build_projects([good, bad], jobs=2)
+    assert results[0].ok
+    assert not results[1].ok
+    assert "1 skill file(s) failed to load" in results[1].error
+    assert "broken.yaml" in results[1].details[0]
+    assert (good / ".claude" / "settings.json").exists()
+
+
+@pytest.mark.parametrize("path, text, error", [
+    ("overrides/skills/code-review.yaml", "allowed_tools: [unclosed\n", "ParserError"),
+    ("templates/claude/skill.md.j2", "{% if %}\n", "TemplateSyntaxError"),
+])
+def test_any_project_error_is_isolated(monorepo, path, text, error):
+    good, bad = monorepo / "packages" / "a", monorepo / "packages" / "b" / "c"
+    (bad / ".aictrl" / path).parent.mkdir(parents=True, exist_ok=True)
+    (bad / ".aictrl" / path).write_text(text)
+
+    results = build_projects([good, bad], jobs=2)
+    assert results[0].ok
+    assert not results[1].ok
+    assert results[1].error.startswith(error)
+    assert (good / ".claude" / "settings.json").exists()
+
+
+def test_check_projects(monorepo):
+    a, c = monorepo / "packages" / "a", monorepo / "packages" / "b" / "c"
+    build_projects([a, c], jobs=1)
+    skill = c / ".aictrl" / "data" / "skills" / "code-review.yaml"
+    skill.write_text(skill.read_text().replace('version: "1.2.3"', 'version: "1.2.4"'))
+
+    results = check_projects([a, c], jobs=2)
+    assert [(r.ok, r.stale) for r in results] == [(True, False), (True, True)]
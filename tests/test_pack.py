@@ -0,0 +1,102 @@
+import shutil
+
+import pytest
+
+from aictrl.cache import ParseCache
+from aictrl.loader import SkillLoadError, load_skills
+from aictrl.pack import SkillPack, load_pack_skills, pack_skills, unpack_skills, write_pack
+
+
+@pytest.fixture
+def project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    return dst
+
+
+def _skills_dir(project):
+    return project / ".aictrl" / "data" / "skills"
+
+
+def _pack_path(project):
+    return project / ".aictrl" / "data" / "skills.pack"
+
+
+class TestPackUnpack:
+    def test_pack_replaces_loose_files(self, project):
+        before = load_skills(project)
+
+        assert pack_skills(project) == 2
+        assert _pack_path(project).exists()
+        assert list(_skills_dir(project).glob("*.yaml")) == []
+        assert load_skills(project) == before
+
+    def test_pack_keep_sources(self, project):
+        pack_skills(project, remove_sources=False)
+        assert len(list(_skills_dir(project).glob("*.yaml"))) == 2
+
+    def test_unpack_restores_exact_bytes(self, project):
+        originals = {p.name: p.read_bytes() for p in _skills_dir(project).glob("*.yaml")}
+
+        pack_skills(project)
+        assert unpack_skills(project) == 2
+
+        assert not _pack_path(project).exists()
+        restored = {p.name: p.read_bytes() for p in _skills_dir(project).glob("*.yaml")}
+        assert restored == originals
+
+    def test_pack_rejects_invalid_files(self, project):
+        (_skills_dir(project) / "broken.yaml").write_text("")
+        with pytest.raises(SkillLoadError):
+            pack_skills(project)
+        assert not _pack_path(project).exists()
+
+
+class TestSkillPack:
+    def test_random_access_by_slug(self, project):
+        pack_skills(project)
+        with SkillPack(_pack_path(project)) as pack:
+            assert pack.slugs == ["code-review", "testing-guide"]
+            skill = pack.load("testing-guide")
+        assert skill.version == "2.0.1"
+
+    def test_not_a_pack(self, tmp_path):
+        bogus = tmp_path / "skills.pack"
+        bogus.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError, match="Not a skill pack"):
+            SkillPack(bogus)
+
+
+class TestLoadWithPack:
+    def test_loose_file_wins_over_pack(self, project):
+        pack_skills(project, remove_sources=False)
+        tg = _skills_dir(project) / "testing-guide.yaml"
+        tg.write_text(tg.read_text().replace('"2.0.1"', '"3.0.0"'))
+        (_skills_dir(project) / "code-review.yaml").unlink()
+
+        skills = load_skills(project)
+        assert [s.slug for s in skills] == ["code-review", "testing-guide"]
+        assert skills[1].version == "3.0.0"
+
+    def test_pack_members_cached_by_digest(self, project, monkeypatch):
+        pack_skills(project)
+        cache = ParseCache.open(project)
+        cold = load_skills(project, cache=cache)
+        cache.save()
+
+        def fail(member):
+            raise AssertionError(f"re-parsed {member[0]}")
+
+        monkeypatch.setattr("aictrl.pack._try_parse_member", fail)
+        cache = ParseCache.open(project)
+        assert load_skills(project, cache=cache) == cold
+        assert cache.misses == 0
+
+    def test_bad_member_reported(self, tmp_path):
+        pack_path = tmp_path / "skills.pack"
+        write_pack(pack_path, [("ok", "ok.yaml", b"slug: ok\n"), ("bad", "bad.yaml", b"name: no slug\n")])
+
+        skills, errors = load_pack_skills(pack_path)
+        assert [s.slug for s in skills] == ["ok"]
+        assert len(errors) == 1
+        assert "bad.yaml" in errors[0][1]
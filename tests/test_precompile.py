@@ -0,0 +1,103 @@
+import filecmp
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from aictrl import precompile, renderer
+from aictrl.config import load_config, load_org
+from aictrl.loader import load_skills
+from aictrl.precompile import COMPILED_DIR, bundled_source_env, compile_bundled, compiled_index
+from aictrl.renderer import create_templates_env, render_all
+
+
+@pytest.fixture
+def bytecode_dir(tmp_path, monkeypatch):
+    """Jinja's per-user bytecode cache directory, under a fresh temp dir."""
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "tmp"))
+    (tmp_path / "tmp").mkdir()
+    return tmp_path / "tmp" / f"_jinja2-cache-{os.getuid()}"
+
+
+@pytest.fixture
+def project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    return dst
+
+
+def _compiled_files(directory):
+    return sorted(p.name for p in directory.iterdir() if p.is_file())
+
+
+def test_shipped_templates_are_current(tmp_path):
+    """Fails after a template edit until `python -m aictrl.precompile` is rerun."""
+    fresh = tmp_path / "compiled"
+    compile_bundled(fresh)
+
+    assert _compiled_files(fresh) == _compiled_files(COMPILED_DIR)
+    _, mismatch, errors = filecmp.cmpfiles(fresh, COMPILED_DIR, _compiled_files(fresh), shallow=False)
+    assert mismatch == [] and errors == []
+
+
+def test_bundled_templates_load_precompiled(sample_project):
+    assert compiled_index() is not None
+    env = create_templates_env(sample_project)
+    template = env.get_template("claude/skill.md.j2")
+    assert template.filename.startswith(str(COMPILED_DIR))
+
+
+def test_precompiled_output_matches_source(sample_project):
+    compiled_env = create_templates_env(sample_project)
+    source_env = bundled_source_env()
+    skill = load_skills(sample_project)[0].as_dict()
+    org = {"id": "o", "name": "Org", "slug": "org", "telemetry_url": "https://example.test"}
+
+    for name in compiled_index()["templates"]:
+        expected = source_env.get_template(name).render(skill=skill, org=org)
+        assert compiled_env.get_template(name).render(skill=skill, org=org) == expected
+
+
+def test_falls_back_to_source_with_bytecode_cache(project, bytecode_dir, monkeypatch):
+    monkeypatch.setattr(renderer, "compiled_index", lambda: None)
+    config, org, skills = load_config(project), load_org(project), load_skills(project)
+
+    files = render_all(skills, config, org, project)
+
+    assert any(f.path.endswith("code-review.md") for f in files)
+    assert list(bytecode_dir.iterdir())
+    # Never in the working tree, where a checkout could plant bytecode.
+    assert not (project / ".aictrl" / ".cache" / "jinja").exists()
+
+
+def test_local_templates_use_bytecode_cache(project, bytecode_dir):
+    templates = project / ".aictrl" / "templates" / "claude"
+    templates.mkdir(parents=True)
+    template = templates / "skill.md.j2"
+    template.write_text("v1 {{ skill.slug }}\n")
+    config, org, skills = load_config(project), load_org(project), load_skills(project)
+
+    files = render_all(skills, config, org, project, target_names=["claude"])
+    assert files[0].content == "v1 code-review\n"
+    assert len(list(bytecode_dir.iterdir())) == 1
+
+    # The cache is keyed by source checksum, so an edit is picked up.
+    template.write_text("v2 {{ skill.slug }}\n")
+    files = render_all(skills, config, org, project, target_names=["claude"])
+    assert files[0].content == "v2 code-review\n"
+
+
+def test_no_bytecode_cache_when_disabled(project, bytecode_dir):
+    (project / ".aictrl" / "templates").mkdir()
+    assert create_templates_env(project, bytecode_cache=False).bytecode_cache is None
+    assert not bytecode_dir.exists()
+
+
+def test_index_rejects_other_jinja_minor(monkeypatch):
+    compiled_index.cache_clear()
+    monkeypatch.setattr(precompile.jinja2, "__version__", "2.11.3")
+    try:
+        assert compiled_index() is None
+    finally:
+        compiled_index.cache_clear()
@@ -0,0 +1,110 @@
+import json
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from aictrl.build import build_project
+from aictrl.cli import main
+from aictrl.config import load_config, load_org
+from aictrl.profiling import NULL_PROFILER, Profiler
+
+
+@pytest.fixture
+def project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    return dst
+
+
+def test_spans_nest_and_summarize():
+    profiler = Profiler()
+    for _ in range(2):
+        with profiler.span("outer"):
+            with profiler.span("inner", n=1):
+                pass
+    with profiler.span("other"):
+        with profiler.span("inner"):
+            pass
+
+    summary = [(s.name, s.depth, s.calls) for s in profiler.summary()]
+    assert summary == [("outer", 0, 2), ("inner", 1, 2), ("other", 0, 1), ("inner", 1, 1)]
+    assert profiler.spans[0].args == {"n": 1}
+
+
+def test_extend_nests_worker_spans():
+    worker = Profiler()
+    with worker.span("render"):
+        pass
+    profiler = Profiler()
+    with profiler.span("phase"):
+        profiler.extend(worker.spans)
+    assert profiler.spans[0].parents == ("phase",)
+
+
+def test_chrome_trace(tmp_path):
+    profiler = Profiler()
+    with profiler.span("a"):
+        with profiler.span("b"):
+            pass
+    path = tmp_path / "trace.json"
+    profiler.write_trace(path)
+
+    trace = json.loads(path.read_text())
+    complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert {e["name"] for e in complete} == {"a", "b"}
+    a = next(e for e in complete if e["name"] == "a")
+    b = next(e for e in complete if e["name"] == "b")
+    assert a["ts"] == 0
+    assert a["ts"] <= b["ts"] and b["ts"] + b["dur"] <= a["ts"] + a["dur"]
+    assert any(e["ph"] == "M" and e["name"] == "process_name" for e in trace["traceEvents"])
+
+
+def test_memory_peaks():
+    with Profiler(memory=True) as profiler:
+        with profiler.span("allocate"):
+            block = bytearray(4 * 2**20)
+            del block
+    assert profiler.summary()[0].peak_bytes >= 4 * 2**20
+    assert profiler.peak_bytes >= 4 * 2**20
+
+
+def test_null_profiler_is_shared_noop():
+    assert NULL_PROFILER.span("a") is NULL_PROFILER.span("b")
+    with NULL_PROFILER.span("a"):
+        pass
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_build_records_phases_and_renders(project, jobs):
+    profiler = Profiler()
+    result = build_project(project, load_config(project), load_org(project), jobs=jobs, profiler=profiler)
+
+    phases = [s.name for s in profiler.summary() if s.depth == 0]
+    assert phases == list(result.timings)
+    names = {s.name: s for s in profiler.summary()}
+    assert names["render skill body"].calls == 2
+    assert names["render claude skill"].calls == 2
+    assert names["render cursor shared"].calls == 1
+    assert {"write_lockfile", "ensure_gitignore", "load_skill_sources", "merge_overrides"} <= names.keys()
+    skills = {s.args["skill"] for s in profiler.spans if s.name == "render claude skill"}
+    assert skills == {"code-review", "testing-guide"}
+
+
+def test_cli_profile(project, tmp_path):
+    trace = tmp_path / "trace.json"
+    result = CliRunner().invoke(main, [
+        "build", "--project", str(project), "--profile-trace", str(trace), "--profile-memory",
+    ])
+    assert result.exit_code == 0, result.output
+    assert "Profile" in result.output
+    assert "render claude skill" in result.output
+    assert "Peak traced memory" in result.output
+    assert json.loads(trace.read_text())["traceEvents"]
+
+
+@pytest.mark.parametrize("option", [["--profile"], ["--profile-trace", "trace.json"], ["--profile-memory"]])
+def test_cli_profile_refuses_recursive(project, option):
+    result = CliRunner().invoke(main, ["build", "-r", "--project", str(project), *option])
+    assert result.exit_code == 2
+    assert "not with --recursive" in result.output
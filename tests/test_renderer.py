@@ -1,9 +1,17 @@
+import dataclasses
 import json
+import os
+
+import jinja2
+import pytest
+
+from aictrl import renderer
 
 from aictrl.config import load_config, load_org
-from aictrl.loader import load_skills
+from aictrl.loader import SkillData, load_skills
 from aictrl.merger import merge_overrides
-from aictrl.renderer import render_all, create_templates_env, write_output_files
+from aictrl.precompile import ENV_OPTIONS
+from aictrl.renderer import render_all, write_output_files
 from aictrl.targets.base import OutputFile
 
 
@@ -92,6 +100,68 @@ def test_render_cursor_hooks_json(sample_project):
     assert org.id in hooks_file.content
 
 
+def test_render_cursor_rules(sample_project):
+    config = load_config(sample_project)
+    org = load_org(sample_project)
+    skills = load_skills(sample_project)
+
+    files = render_all(skills, config, org, sample_project, target_names=["cursor"])
+    rule = next(f for f in files if f.path == ".cursor/rules/code-review.mdc")
+
+    assert rule.content.startswith("---\ndescription: Guides thorough code reviews")
+    assert "alwaysApply: false\n---\n\nYou are a code review assistant." in rule.content
+    assert "## team_standards" in rule.content
+
+
+def test_skill_body_rendered_once_for_all_targets(sample_project, monkeypatch):
+    config = load_config(sample_project)
+    org = load_org(sample_project)
+    skills = load_skills(sample_project)
+    calls = []
+    real = renderer.render_skill_document
+    monkeypatch.setattr(renderer, "render_skill_document", lambda *a: calls.append(a) or real(*a))
+
+    files = render_all(skills, config, org, sample_project, jobs=1)
+
+    assert len(calls) == len(skills)
+    claude = next(f for f in files if f.path == ".claude/skills/code-review/code-review.md")
+    cursor = next(f for f in files if f.path == ".cursor/rules/code-review.mdc")
+    assert claude.content.split("---\n\n", 1)[1] == cursor.content.split("---\n\n", 1)[1]
+
+
+# skill.md.j2 before the body moved into skill/body.md.j2
+_SINGLE_PASS_SKILL_TEMPLATE = """---
+description: {{ skill.description }}
+{% if skill.allowed_tools %}allowed_tools:
+{% for tool in skill.allowed_tools %}  - {{ tool }}
+{% endfor %}{% endif %}{% if skill.tags %}tags:
+{% for tag in skill.tags %}  - {{ tag }}
+{% endfor %}{% endif %}---
+
+{{ skill.instructions }}
+{% for name, content in skill.sections.items() %}
+
+---
+
+## {{ name }}
+
+{{ content }}
+{% endfor %}
+"""
+
+
+def test_claude_output_unchanged_by_shared_body(sample_project):
+    config = load_config(sample_project)
+    org = load_org(sample_project)
+    skills = merge_overrides(load_skills(sample_project), sample_project)
+    template = jinja2.Environment(**ENV_OPTIONS).from_string(_SINGLE_PASS_SKILL_TEMPLATE)
+
+    files = render_all(skills, config, org, sample_project, target_names=["claude"])
+    for skill in skills:
+        md = next(f for f in files if f.path.endswith(f"/{skill.slug}.md"))
+        assert md.content == template.render(skill=skill.as_dict(), org=dataclasses.asdict(org))
+
+
 def test_render_single_target(sample_project):
     config = load_config(sample_project)
     org = load_org(sample_project)
@@ -122,9 +192,9 @@ def test_write_output_files(tmp_path, sample_project):
     skills = load_skills(sample_project)
 
     files = render_all(skills, config, org, sample_project, target_names=["claude"])
-    count = write_output_files(files, tmp_path)
+    stats = write_output_files(files, tmp_path)
 
-    assert count == len(files)
+    assert stats.written == len(files)
     assert (tmp_path / ".claude" / "skills" / "code-review" / "code-review.md").exists()
     assert (tmp_path / ".claude" / "settings.json").exists()
 
@@ -147,3 +217,92 @@ def test_render_with_overrides(sample_project):
     assert "Edit" in cr_file.content
     # Override replaced team_standards section
     assert "Our Team Standards" in cr_file.content
+
+
+def _skill_with_content_files(content_files):
+    return SkillData(
+        slug="docs", name="docs", description="d", version="1.0",
+        instructions="i", content_files=content_files,
+    )
+
+
+def test_render_content_file_source_is_not_inlined(sample_project):
+    config = load_config(sample_project)
+    org = load_org(sample_project)
+    skill = _skill_with_content_files({"reference.md": {"source": "references/reference.md"}})
+
+    files = render_all([skill], config, org, sample_project, target_names=["claude"])
+    ref = next(f for f in files if f.path == ".claude/skills/docs/reference.md")
+
+    assert ref.source == "references/reference.md"
+    assert ref.content == ""
+
+
+def test_write_output_files_materializes_sources(tmp_path):
+    data_dir = tmp_path / ".aictrl" / "data" / "references"
+    data_dir.mkdir(parents=True)
+    (data_dir / "reference.md").write_text("big reference\n")
+
+    files = [OutputFile(path=".claude/skills/docs/reference.md", content="", source="references/reference.md")]
+    assert write_output_files(files, tmp_path).written == 1
+    assert (tmp_path / ".claude" / "skills" / "docs" / "reference.md").read_text() == "big reference\n"
+
+
+def test_write_output_files_missing_source(tmp_path):
+    files = [OutputFile(path=".claude/skills/docs/reference.md", content="", source="references/missing.md")]
+    with pytest.raises(FileNotFoundError, match="missing.md"):
+        write_output_files(files, tmp_path)
+
+
+def test_write_output_files_skips_unchanged(tmp_path):
+    files = [
+        OutputFile(path=".claude/a.md", content="alpha\n"),
+        OutputFile(path=".claude/run.sh", content="#!/bin/sh\n", executable=True),
+    ]
+    write_output_files(files, tmp_path)
+    a_md = tmp_path / ".claude" / "a.md"
+    os.utime(a_md, ns=(0, 0))
+
+    stats = write_output_files(files, tmp_path)
+    assert (stats.written, stats.unchanged) == (0, 2)
+    assert a_md.stat().st_mtime_ns == 0
+
+    # Same size, different bytes is still rewritten; so is a lost exec bit.
+    a_md.write_text("ALPHA\n")
+    (tmp_path / ".claude" / "run.sh").chmod(0o644)
+    stats = write_output_files(files, tmp_path)
+    assert (stats.written, stats.unchanged) == (2, 0)
+    assert a_md.read_text() == "alpha\n"
+    assert (tmp_path / ".claude" / "run.sh").stat().st_mode & 0o111
+
+    # And a gained one: the file must not stay executable.
+    a_md.chmod(0o755)
+    stats = write_output_files(files, tmp_path)
+    assert (stats.written, stats.unchanged) == (1, 1)
+    assert not a_md.stat().st_mode & 0o111
+
+
+def test_write_output_files_skips_unchanged_sources(tmp_path):
+    data_dir = tmp_path / ".aictrl" / "data" / "references"
+    data_dir.mkdir(parents=True)
+    (data_dir / "reference.md").write_text("big reference\n")
+    files = [OutputFile(path=".claude/skills/docs/reference.md", content="", source="references/reference.md")]
+
+    write_output_files(files, tmp_path)
+    assert write_output_files(files, tmp_path).unchanged == 1
+
+    (data_dir / "reference.md").write_text("big Reference\n")
+    assert write_output_files(files, tmp_path).written == 1
+
+
+def test_parallel_render_matches_serial(sample_project):
+    config = load_config(sample_project)
+    org = load_org(sample_project)
+    base = load_skills(sample_project)
+    skills = [dataclasses.replace(base[i % 2], slug=f"skill-{i:03d}") for i in range(20)]
+
+    serial = render_all(skills, config, org, sample_project, jobs=1)
+    parallel = render_all(skills, config, org, sample_project, jobs=2)
+
+    assert [f.path for f in parallel] == [f.path for f in serial]
+    assert parallel == serial
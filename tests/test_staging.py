@@ -0,0 +1,185 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from aictrl import build, staging
+from aictrl.build import build_project
+from aictrl.config import load_config, load_org
+from aictrl.staging import OLD_TREE, OutputStage, recover_stages
+
+
+@pytest.fixture
+def project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    return dst
+
+
+def _build(project):
+    return build_project(project, load_config(project), load_org(project))
+
+
+def _stage_base(project):
+    return project / ".aictrl" / ".cache" / "stage"
+
+
+def _dead_pid():
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+@pytest.fixture(params=["exchange", "rename"])
+def publish_mode(request, monkeypatch):
+    if request.param == "rename":
+        monkeypatch.setattr(staging, "_exchange", lambda a, b: False)
+    return request.param
+
+
+def test_publish_swaps_in_stage(tmp_path, publish_mode):
+    live = tmp_path / ".claude"
+    live.mkdir()
+    (live / "keep.md").write_text("keep\n")
+    (live / "user.json").write_text("{}\n")
+    keep_ino = (live / "keep.md").stat().st_ino
+
+    with OutputStage(tmp_path, ".claude") as stage:
+        (stage.tree / "keep.md").unlink()
+        (stage.tree / "keep.md").write_text("changed\n")
+        (stage.tree / "new.md").write_text("new\n")
+        # Nothing is visible until publish.
+        assert (live / "keep.md").read_text() == "keep\n"
+        assert not (live / "new.md").exists()
+        stage.publish()
+
+    assert (live / "keep.md").read_text() == "changed\n"
+    assert (live / "new.md").read_text() == "new\n"
+    assert (live / "user.json").read_text() == "{}\n"
+    assert (live / "keep.md").stat().st_ino != keep_ino
+    assert list(_stage_base(tmp_path).iterdir()) == []
+
+
+def test_publish_keeps_live_changes_made_during_build(tmp_path, publish_mode):
+    live = tmp_path / ".claude"
+    live.mkdir()
+    for name in ("output.md", "settings.local.json", "notes.md", "old.md"):
+        (live / name).write_text("before\n")
+
+    with OutputStage(tmp_path, ".claude") as stage:
+        (stage.tree / "output.md").unlink()
+        (stage.tree / "output.md").write_text("built\n")
+        # Meanwhile, in the live directory: editors and assistants save
+        # by replacing files.
+        for name in ("output.md", "settings.local.json"):
+            (live / f"{name}.tmp").write_text("saved during build\n")
+            os.replace(live / f"{name}.tmp", live / name)
+        (live / "rules").mkdir()
+        (live / "rules" / "new.md").write_text("created during build\n")
+        (live / "old.md").unlink()
+        stage.publish()
+
+    assert (live / "output.md").read_text() == "built\n"
+    assert (live / "settings.local.json").read_text() == "saved during build\n"
+    assert (live / "rules" / "new.md").read_text() == "created during build\n"
+    assert (live / "notes.md").read_text() == "before\n"
+    assert not (live / "old.md").exists()
+
+
+def test_build_keeps_settings_saved_mid_build(project, monkeypatch):
+    _build(project)
+    local = project / ".claude" / "settings.local.json"
+    write_files = build.write_files
+
+    def save_settings_meanwhile(files, *args, **kwargs):
+        if any(f.path.startswith(".claude/") for f in files):
+            saved = local.with_name("settings.local.json.tmp")
+            saved.write_text('{"permissions": {}}\n')
+            os.replace(saved, local)
+        return write_files(files, *args, **kwargs)
+
+    monkeypatch.setattr(build, "write_files", save_settings_meanwhile)
+    override = project / ".aictrl" / "overrides" / "skills" / "code-review.yaml"
+    override.write_text(override.read_text() + "description: Changed by override\n")
+    _build(project)
+
+    assert local.read_text() == '{"permissions": {}}\n'
+    assert "Changed by override" in (project / ".claude" / "skills" / "code-review" / "code-review.md").read_text()
+
+
+def test_stage_hardlinks_untouched_files(tmp_path):
+    live = tmp_path / ".claude"
+    live.mkdir()
+    (live / "a.md").write_text("a\n")
+
+    with OutputStage(tmp_path, ".claude") as stage:
+        assert (stage.tree / "a.md").stat().st_ino == (live / "a.md").stat().st_ino
+
+
+def test_unpublished_stage_is_discarded(tmp_path):
+    (tmp_path / ".claude").mkdir()
+    with OutputStage(tmp_path, ".claude") as stage:
+        (stage.tree / "x.md").write_text("x\n")
+    assert not (tmp_path / ".claude" / "x.md").exists()
+    assert list(_stage_base(tmp_path).iterdir()) == []
+
+
+def test_publish_creates_missing_target(tmp_path):
+    with OutputStage(tmp_path, ".cursor") as stage:
+        (stage.tree / "hooks.json").write_text("{}\n")
+        stage.publish()
+    assert (tmp_path / ".cursor" / "hooks.json").exists()
+
+
+def test_recover_restores_tree_from_interrupted_publish(tmp_path):
+    live = tmp_path / ".claude"
+    stage_dir = _stage_base(tmp_path) / f"{_dead_pid()}-.claude"
+    (stage_dir / OLD_TREE).mkdir(parents=True)
+    (stage_dir / OLD_TREE / "a.md").write_text("previous build\n")
+    (stage_dir / "live").write_text(str(live))
+
+    recover_stages(_stage_base(tmp_path))
+
+    assert (live / "a.md").read_text() == "previous build\n"
+    assert not stage_dir.exists()
+
+
+def test_recover_keeps_running_stages(tmp_path):
+    stage_dir = _stage_base(tmp_path) / f"{os.getppid()}-.claude"
+    stage_dir.mkdir(parents=True)
+    recover_stages(_stage_base(tmp_path))
+    assert stage_dir.exists()
+
+
+def test_build_never_writes_through_to_live_inodes(project, publish_mode):
+    _build(project)
+    skill_md = project / ".claude" / "skills" / "code-review" / "code-review.md"
+    reader_view = project / "held-open.md"
+    os.link(skill_md, reader_view)
+    before = reader_view.read_text()
+
+    override = project / ".aictrl" / "overrides" / "skills" / "code-review.yaml"
+    override.write_text(override.read_text() + "description: Changed by override\n")
+    _build(project)
+
+    assert "Changed by override" in skill_md.read_text()
+    assert reader_view.read_text() == before
+    assert list(_stage_base(project).iterdir()) == []
+
+
+def test_failed_build_leaves_live_tree_untouched(project):
+    _build(project)
+    settings = project / ".claude" / "settings.json"
+    before = {p: p.read_bytes() for p in (project / ".claude").rglob("*") if p.is_file()}
+
+    skill = project / ".aictrl" / "data" / "skills" / "code-review.yaml"
+    skill.write_text(skill.read_text() + "content_files:\n  ref.md:\n    source: missing.md\n")
+    with pytest.raises(FileNotFoundError):
+        _build(project)
+
+    after = {p: p.read_bytes() for p in (project / ".claude").rglob("*") if p.is_file()}
+    assert after == before
+    assert settings.exists()
+    assert list(_stage_base(project).iterdir()) == []
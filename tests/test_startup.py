@@ -0,0 +1,104 @@
+"""Startup cost of the CLI, measured with `python -X importtime`."""
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from aictrl.cli import main
+
+
+# Modules only `build`/`watch` (or a terminal) need.
+HEAVY_MODULES = {
+    "jinja2",
+    "rich",
+    "yaml",
+    "concurrent.futures.process",
+    "aictrl.build",
+    "aictrl.renderer",
+}
+
+# Import time of aictrl.cli on top of click, in microseconds: the best of
+# a few runs, so a busy machine does not fail it. Importing everything
+# eagerly costs several times this.
+IMPORT_BUDGET_US = 100_000
+
+
+def _importtime(code: str, *args: str, cwd=None) -> dict[str, int]:
+    """Run code under -X importtime; map each imported module to its cumulative microseconds."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        capture_output=True, text=True, cwd=cwd, check=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _heavy(modules: dict[str, int]) -> set[str]:
+    return HEAVY_MODULES & modules.keys()
+
+
+@pytest.fixture
+def built_project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    # Old enough for `check` to trust stat data.
+    for path in (dst / ".aictrl").rglob("*"):
+        if path.is_file():
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 60_000_000_000))
+    assert CliRunner().invoke(main, ["build", "--project", str(dst)]).exit_code == 0
+    return dst
+
+
+def test_cli_import_loads_no_heavy_modules():
+    assert _heavy(_importtime("import aictrl.cli")) == set()
+
+
+def test_cli_import_within_budget():
+    best = min(
+        modules["aictrl.cli"] - modules["click"]
+        for modules in (_importtime("import aictrl.cli") for _ in range(3))
+    )
+    assert best < IMPORT_BUDGET_US
+
+
+def test_fresh_check_loads_no_heavy_modules(built_project):
+    modules = _importtime("from aictrl.cli import main; main()", "check", "--project", str(built_project))
+    assert _heavy(modules) == set()
+
+
+def test_status_skips_jinja_and_rich(built_project):
+    modules = _importtime("from aictrl.cli import main; main()", "status", "--project", str(built_project))
+    assert _heavy(modules) <= {"yaml"}
+
+
+def test_client_import_is_stdlib_only():
+    modules = _importtime("import aictrl.client")
+    assert _heavy(modules) == set()
+    assert "click" not in modules
+    assert "aictrl.cli" not in modules
+
+
+def test_client_if_changed_fast_path(built_project):
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    git = ["git", "-C", str(built_project), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], check=True)
+    subprocess.run([*git, "add", "-A"], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "initial"], check=True)
+    assert CliRunner().invoke(main, ["build", "--project", str(built_project)]).exit_code == 0
+
+    modules = _importtime(
+        "from aictrl.client import main; main()", "build", "--if-changed", "--project", str(built_project),
+    )
+    assert _heavy(modules) == set()
+    assert "aictrl.cli" not in modules
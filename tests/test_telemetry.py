@@ -0,0 +1,197 @@
+import fcntl
+import gzip
+import json
+import shutil
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from click.testing import CliRunner
+
+from aictrl.cli import main
+from aictrl.config import load_config, load_org
+from aictrl.loader import load_skills
+from aictrl.renderer import render_all
+from aictrl.telemetry import Uploader, flush, has_pending
+
+
+class _Collector(BaseHTTPRequestHandler):
+    """Stands in for the telemetry endpoint: records each batch, and
+    answers with the next queued status (200 once the queue is empty)."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        if self.path.endswith("/batch") and not server.batch_route:
+            status = 404
+        else:
+            status = server.statuses.pop(0) if server.statuses else 200
+        encoding = self.headers["Content-Encoding"]
+        data = json.loads(gzip.decompress(body) if encoding == "gzip" else body)
+        server.requests.append({
+            "path": self.path,
+            "status": status,
+            "peer": self.client_address,
+            "encoding": encoding,
+            "events": data["events"] if self.path.endswith("/batch") else [data],
+        })
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Collector)
+    httpd.requests = []
+    httpd.statuses = []
+    httpd.batch_route = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/api/telemetry"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _spool(path, url, n, org="org-1", start=0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for i in range(start, start + n):
+            f.write(json.dumps({"skillName": f"s{i}", "source": "claude-code", "orgId": org, "telemetryUrl": url}) + "\n")
+
+
+def _uploader():
+    return Uploader(timeout=5, backoff=0, sleep=lambda seconds: None)
+
+
+def test_batches_over_one_connection(server, telemetry_spool):
+    _spool(telemetry_spool, server.url, 5)
+    _spool(telemetry_spool, server.url, 2, org="org-2")
+    telemetry_spool.write_text(telemetry_spool.read_text() + "not json\n")
+
+    result = flush(uploader=_uploader(), batch_events=2)
+
+    assert (result.sent, result.requests, result.dropped, result.pending) == (7, 4, 1, 0)
+    paths = [r["path"] for r in server.requests]
+    assert paths == ["/api/telemetry/org-1/skill-usage/batch"] * 3 + ["/api/telemetry/org-2/skill-usage/batch"]
+    assert [e["skillName"] for r in server.requests[:3] for e in r["events"]] == [f"s{i}" for i in range(5)]
+    assert "orgId" not in server.requests[0]["events"][0]
+    assert {r["encoding"] for r in server.requests} == {"gzip"}
+    assert len({r["peer"] for r in server.requests}) == 1
+    assert not has_pending()
+
+
+def test_retries_with_backoff(server, telemetry_spool):
+    server.statuses = [503, 429]
+    _spool(telemetry_spool, server.url, 3)
+    delays = []
+    uploader = Uploader(timeout=5, backoff=0.5, sleep=delays.append)
+
+    result = flush(uploader=uploader)
+
+    assert result.sent == 3
+    assert [r["status"] for r in server.requests] == [503, 429, 200]
+    assert delays == [0.5, 1.0]
+
+
+def test_rejected_batch_is_dropped(server, telemetry_spool):
+    server.statuses = [400]
+    _spool(telemetry_spool, server.url, 2)
+    result = flush(uploader=_uploader())
+    assert (result.sent, result.dropped, result.pending) == (0, 2, 0)
+    assert "HTTP 400" in result.errors[0]
+    assert not has_pending()
+
+
+def test_server_without_batch_route_gets_single_events(server, telemetry_spool):
+    server.batch_route = False
+    _spool(telemetry_spool, server.url, 3)
+    _spool(telemetry_spool, server.url, 1, org="org-2")
+
+    result = flush(uploader=_uploader(), batch_events=2)
+
+    assert (result.sent, result.requests, result.dropped, result.pending) == (4, 4, 0, 0)
+    single = [r for r in server.requests if r["status"] == 200]
+    assert [r["path"] for r in single] == ["/api/telemetry/org-1/skill-usage"] * 3 + ["/api/telemetry/org-2/skill-usage"]
+    assert [r["events"][0]["skillName"] for r in single] == ["s0", "s1", "s2", "s0"]
+    assert {r["encoding"] for r in single} == {None}
+    # The batch route is tried once per organization, not once per batch.
+    assert [r["status"] for r in server.requests].count(404) == 2
+    assert len({r["peer"] for r in server.requests}) == 1
+    assert not result.errors
+
+
+def test_failed_upload_is_kept_for_next_flush(server, telemetry_spool):
+    server.statuses = [500] * 4
+    _spool(telemetry_spool, server.url, 3)
+
+    result = flush(uploader=_uploader())
+    assert (result.sent, result.pending) == (0, 3)
+    assert has_pending()
+
+    # Events spooled meanwhile go out with the kept ones.
+    _spool(telemetry_spool, server.url, 1, start=3)
+    result = flush(uploader=_uploader())
+    assert (result.sent, result.pending) == (4, 0)
+    assert sorted(e["skillName"] for e in server.requests[-1]["events"]) == ["s0", "s1", "s2", "s3"]
+
+
+def test_unreachable_endpoint_keeps_events_within_cap(telemetry_spool):
+    _spool(telemetry_spool, "http://127.0.0.1:1/api/telemetry", 50)
+    newest = telemetry_spool.read_bytes().splitlines(keepends=True)[-10:]
+
+    result = flush(uploader=_uploader(), max_bytes=sum(map(len, newest)))
+
+    assert (result.sent, result.pending, result.dropped) == (0, 10, 40)
+    assert result.errors
+    kept = next(telemetry_spool.parent.glob("telemetry.jsonl.*.sending")).read_bytes()
+    assert kept.splitlines(keepends=True) == newest
+
+
+def test_concurrent_flush_is_busy(telemetry_spool, server):
+    _spool(telemetry_spool, server.url, 1)
+    with open(telemetry_spool.with_name("telemetry.jsonl.lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        assert flush(uploader=_uploader()).busy
+    assert flush(uploader=_uploader()).sent == 1
+
+
+def test_nothing_spooled(telemetry_spool):
+    assert flush() == flush()
+    assert not has_pending()
+
+
+def test_hook_appends_to_spool(sample_project, telemetry_spool, tmp_path):
+    if shutil.which("bash") is None or shutil.which("jq") is None:
+        pytest.skip("bash and jq needed to run the hook")
+    config, org = load_config(sample_project), load_org(sample_project)
+    files = render_all(load_skills(sample_project), config, org, sample_project, target_names=["claude"])
+    script = tmp_path / "skill-telemetry.sh"
+    script.write_text(next(f for f in files if f.path == ".claude/hooks/skill-telemetry.sh").content)
+
+    event = {"tool_name": "mcp__session-control__load_skill", "tool_input": {"name": "code-review"}, "duration": 12}
+    env = {"PATH": "/usr/bin:/bin", "AICTRL_ORG_ID": "org-1", "AICTRL_TELEMETRY_URL": "https://t.example",
+           "AICTRL_TELEMETRY_SPOOL": str(telemetry_spool)}
+    subprocess.run(["bash", str(script)], input=json.dumps(event), text=True, env=env, check=True)
+
+    spooled = json.loads(telemetry_spool.read_text())
+    assert spooled["skillName"] == "code-review"
+    assert spooled["orgId"] == "org-1"
+    assert spooled["telemetryUrl"] == "https://t.example"
+
+
+def test_cli_flush(server, telemetry_spool):
+    runner = CliRunner()
+    assert "Nothing to upload" in runner.invoke(main, ["telemetry", "flush"]).output
+
+    _spool(telemetry_spool, server.url, 3)
+    result = runner.invoke(main, ["telemetry", "flush"])
+    assert result.exit_code == 0, result.output
+    assert "Sent 3 events in 1 requests" in result.output
@@ -0,0 +1,200 @@
+import shutil
+import sys
+import threading
+import time
+
+import pytest
+
+from aictrl.watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    collect_burst,
+    create_watcher,
+    is_input,
+    watch_project,
+)
+
+
+@pytest.fixture
+def project(sample_project, tmp_path):
+    dst = tmp_path / "project"
+    shutil.copytree(sample_project, dst)
+    return dst
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def watcher(request, project):
+    if request.param == "inotify":
+        if sys.platform != "linux":
+            pytest.skip("inotify is Linux-only")
+        w = InotifyWatcher(project)
+    else:
+        w = PollingWatcher(project, interval=0.01)
+    yield w
+    w.close()
+
+
+def _skill(project):
+    return project / ".aictrl" / "data" / "skills" / "code-review.yaml"
+
+
+class TestIsInput:
+    def test_skill_files_are_inputs(self, project):
+        assert is_input(project, _skill(project))
+        assert is_input(project, project / ".aictrl" / "templates" / "claude" / "skill.md.j2")
+
+    def test_build_products_are_not(self, project):
+        assert not is_input(project, project / ".aictrl" / ".cache" / "parse.pickle")
+        assert not is_input(project, project / ".aictrl" / "skills.lock")
+        assert not is_input(project, project / ".claude" / "settings.json")
+
+
+class TestWatchers:
+    def test_detects_edit(self, project, watcher):
+        _skill(project).write_text(_skill(project).read_text() + "\n")
+        assert _skill(project) in watcher.wait(2.0)
+
+    def test_detects_new_file_in_new_directory(self, project, watcher):
+        new_dir = project / ".aictrl" / "templates" / "claude"
+        new_dir.mkdir(parents=True)
+        collect_burst(watcher, watcher.wait(2.0), debounce=0.05)
+
+        (new_dir / "skill.md.j2").write_text("{{ body }}")
+        assert new_dir / "skill.md.j2" in collect_burst(watcher, watcher.wait(2.0), debounce=0.05)
+
+    def test_ignores_build_products(self, project, watcher):
+        cache = project / ".aictrl" / ".cache"
+        cache.mkdir(exist_ok=True)
+        (cache / "scratch").write_text("x")
+        (project / ".aictrl" / "skills.lock").write_text("{}\n")
+        assert watcher.wait(0.1) == set()
+
+    def test_times_out_when_idle(self, watcher):
+        start = time.monotonic()
+        assert watcher.wait(0.05) == set()
+        assert time.monotonic() - start < 1.0
+
+
+def test_create_watcher_polling_on_request(project):
+    w = create_watcher(project, polling=True)
+    try:
+        assert w.name == "polling"
+    finally:
+        w.close()
+
+
+def test_collect_burst_merges_events(project):
+    w = PollingWatcher(project, interval=0.01)
+    skills = project / ".aictrl" / "data" / "skills"
+    first = skills / "a.txt"
+    first.write_text("a")
+
+    def later():
+        time.sleep(0.03)
+        (skills / "b.txt").write_text("b")
+
+    thread = threading.Thread(target=later)
+    thread.start()
+    changed = collect_burst(w, w.wait(1.0), debounce=0.2)
+    thread.join()
+    assert {skills / "a.txt", skills / "b.txt"} <= changed
+
+
+@pytest.mark.parametrize("polling", [False, True])
+def test_watch_rebuilds_after_edit(project, polling):
+    builds = []
+    errors = []
+    stop = threading.Event()
+    first_build = threading.Event()
+    rebuilt = threading.Event()
+
+    def on_build(result, changed, seconds):
+        builds.append((result, changed))
+        (rebuilt if changed else first_build).set()
+
+    thread = threading.Thread(
+        target=watch_project,
+        args=(project, on_build, errors.append),
+        kwargs={"jobs": 1, "debounce": 0.05, "polling": polling, "stop": stop},
+    )
+    thread.start()
+    try:
+        assert first_build.wait(10)
+        override = project / ".aictrl" / "overrides" / "skills" / "code-review.yaml"
+        override.write_text(override.read_text() + "description: Changed while watching\n")
+        assert rebuilt.wait(10)
+    finally:
+        stop.set()
+        thread.join(10)
+
+    assert not errors
+    result, changed = builds[-1]
+    assert override in changed
+    assert result.reused > 0
+    skill_md = project / ".claude" / "skills" / "code-review" / "code-review.md"
+    assert "Changed while watching" in skill_md.read_text()
+
+
+def test_watch_reports_errors_and_keeps_going(project):
+    errors = []
+    stop = threading.Event()
+    rebuilt = threading.Event()
+    skill = _skill(project)
+    good = skill.read_text()
+    skill.write_text("name: [unclosed\n")
+
+    thread = threading.Thread(
+        target=watch_project,
+        args=(project, lambda result, changed, seconds: rebuilt.set(), errors.append),
+        kwargs={"jobs": 1, "debounce": 0.05, "polling": True, "stop": stop},
+    )
+    thread.start()
+    try:
+        deadline = time.monotonic() + 10
+        while not errors and time.monotonic() < deadline:
+            time.sleep(0.01)
+        skill.write_text(good)
+        assert rebuilt.wait(10)
+    finally:
+        stop.set()
+        thread.join(10)
+
+    assert len(errors) == 1
+
+
+@pytest.mark.parametrize("path, bad, error", [
+    ("overrides/skills/code-review.yaml", "description: [half typed\n", "yaml"),
+    ("overrides/skills/code-review.yaml", "descripton: typo\n", "builtins"),
+    ("templates/claude/skill.md.j2", "{% if %}\n", "jinja2"),
+])
+def test_watch_survives_half_saved_override_or_template(project, path, bad, error):
+    errors = []
+    builds = []
+    stop = threading.Event()
+    target = project / ".aictrl" / path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(bad)
+
+    thread = threading.Thread(
+        target=watch_project,
+        args=(project, lambda result, changed, seconds: builds.append(result), errors.append),
+        kwargs={"jobs": 1, "debounce": 0.05, "polling": True, "stop": stop},
+    )
+    thread.start()
+    try:
+        deadline = time.monotonic() + 10
+        while not errors and time.monotonic() < deadline:
+            time.sleep(0.01)
+        if path.endswith(".yaml"):
+            target.write_text("description: Fixed while watching\n")
+        else:
+            target.unlink()
+        while not builds and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop.set()
+        thread.join(10)
+
+    assert not thread.is_alive()
+    assert [type(e).__module__.split(".")[0] for e in errors] == [error]
+    assert builds and builds[-1].skills